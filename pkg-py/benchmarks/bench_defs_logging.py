@@ -0,0 +1,85 @@
+"""
+Benchmark the cost of debug logging while resolving color definitions.
+
+Validates a brand with a large color palette and typography colors that refer
+to the palette, once with `brand_yml` debug logging disabled (the default) and
+once with debug logging enabled but discarded. The difference between the two
+is the cost of formatting debug messages, which is only paid when debug
+logging is enabled.
+
+Usage:
+
+    python pkg-py/benchmarks/bench_defs_logging.py [--colors 2000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import timeit
+
+from brand_yml import Brand
+from brand_yml._utils_logging import logger
+
+
+def brand_data(n_colors: int) -> dict:
+    palette = {f"color-{i}": f"#{i % 0xFFFFFF:06x}" for i in range(n_colors)}
+    # Aliases of aliases, to exercise nested resolution
+    palette.update({f"alias-{i}": f"color-{i}" for i in range(n_colors // 2)})
+    palette.update({f"alias2-{i}": f"alias-{i}" for i in range(n_colors // 4)})
+
+    return {
+        "color": {
+            "palette": palette,
+            "foreground": "alias2-0",
+            "background": "alias2-1",
+            "primary": "alias-2",
+            "secondary": "color-3",
+        },
+        "typography": {
+            "base": "Open Sans",
+            "headings": {"family": "Roboto Slab", "color": "primary"},
+            "link": {"color": "alias2-4"},
+            "monospace-inline": {"background-color": "alias-5"},
+        },
+    }
+
+
+def time_validate(n_colors: int, repeat: int, debug: bool) -> float:
+    level = logger.level
+    propagate = logger.propagate
+    logger.setLevel(logging.DEBUG if debug else logging.WARNING)
+    # Handled by the NullHandler only, so the cost is formatting the messages
+    logger.propagate = False
+
+    try:
+        data = brand_data(n_colors)
+        times = timeit.repeat(
+            lambda: Brand.model_validate(data), number=1, repeat=repeat
+        )
+    finally:
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").split("\n\n")[0]
+    )
+    parser.add_argument("--colors", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    disabled = time_validate(args.colors, args.repeat, debug=False)
+    enabled = time_validate(args.colors, args.repeat, debug=True)
+
+    print(f"Brand.model_validate() with {args.colors} palette colors")
+    print(f"  debug logging disabled: {disabled * 1000:8.1f} ms")
+    print(f"  debug logging enabled:  {enabled * 1000:8.1f} ms")
+    print(f"  formatting overhead:    {enabled / disabled:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Brand data used by the benchmark suite.
+
+Each case is a function returning the text of a Brand YAML file. The cases
+include every file in `examples/` and synthetic brands that are scaled up to
+stress specific parts of `brand_yml`.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+from brand_yml._utils_yaml import yaml_brand as yaml
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+EXAMPLES = REPO_ROOT / "examples"
+
+CaseFunc = Callable[[], str]
+
+
+def dump_yaml(data: object) -> str:
+    text = yaml.dump(data)
+    assert text is not None
+    return text
+
+
+def example_cases() -> dict[str, CaseFunc]:
+    def read(path: Path) -> CaseFunc:
+        return path.read_text
+
+    return {
+        f"example:{path.stem}": read(path)
+        for path in sorted(EXAMPLES.glob("*.yml"))
+    }
+
+
+def palette_large(n: int = 10_000) -> str:
+    """A palette of `n` colors with aliases and theme colors that refer to it."""
+    palette = {
+        f"color-{i}": f"#{(i * 2654435761) % 0xFFFFFF:06x}" for i in range(n)
+    }
+    palette.update({f"alias-{i}": f"color-{i}" for i in range(0, n, 10)})
+
+    return dump_yaml(
+        {
+            "meta": {"name": f"Palette with {n} colors"},
+            "color": {
+                "palette": palette,
+                "foreground": "color-0",
+                "background": "color-1",
+                "primary": "alias-10",
+                "secondary": "alias-20",
+                "info": "primary",
+            },
+            "typography": {
+                "headings": {"color": "primary"},
+                "link": {"color": "alias-30"},
+            },
+        }
+    )
+
+
+def alias_chains(depth: int = 1_000, chains: int = 5) -> str:
+    """Palettes with `chains` alias chains of `depth` links each."""
+    palette = {}
+    for c in range(chains):
+        # Each link refers to the next one, so definitions are used before
+        # they are defined
+        for i in range(depth):
+            palette[f"chain{c}-{i}"] = f"chain{c}-{i + 1}"
+        palette[f"chain{c}-{depth}"] = f"#{c:06x}"
+
+    return dump_yaml(
+        {
+            "color": {
+                "palette": palette,
+                "primary": "chain0-0",
+                "secondary": f"chain{chains - 1}-0",
+            },
+            "typography": {"headings": {"color": "chain1-0"}},
+        }
+    )
+
+
+def fonts_many(n: int = 500) -> str:
+    """A typography section with `n` fonts from every font source."""
+    fonts = []
+    for i in range(n):
+        family = f"Family {i}"
+        kind = i % 4
+        if kind == 0:
+            fonts.append({"family": family, "source": "google"})
+        elif kind == 1:
+            fonts.append(
+                {
+                    "family": family,
+                    "source": "bunny",
+                    "weight": [400, 700],
+                    "style": "normal",
+                }
+            )
+        elif kind == 2:
+            fonts.append(
+                {
+                    "family": family,
+                    "source": "google",
+                    "weight": "300..800",
+                    "display": "swap",
+                }
+            )
+        else:
+            fonts.append(
+                {
+                    "family": family,
+                    "source": "file",
+                    "files": [
+                        {"path": f"fonts/f{i}-regular.woff2"},
+                        {"path": f"fonts/f{i}-bold.woff2", "weight": "bold"},
+                        {"path": f"fonts/f{i}-italic.ttf", "style": "italic"},
+                    ],
+                }
+            )
+
+    return dump_yaml(
+        {
+            "typography": {
+                "fonts": fonts,
+                "base": "Family 0",
+                "headings": {"family": "Family 1", "weight": 600},
+                "monospace": "Family 2",
+            }
+        }
+    )
+
+
+def brand_large() -> str:
+    """A large brand with every section: a 10k color palette and 500 fonts."""
+    data = yaml.load(palette_large())
+    data.update(yaml.load(fonts_many()))
+    data["typography"]["headings"]["color"] = "primary"
+    data["logo"] = {
+        "images": {f"logo-{i}": f"logos/logo-{i}.svg" for i in range(100)},
+        "small": "logo-0",
+        "medium": {"light": "logo-1", "dark": "logo-2"},
+        "large": "logo-3",
+    }
+    return dump_yaml(data)
+
+
+def synthetic_cases() -> dict[str, CaseFunc]:
+    return {
+        "synthetic:palette-10k": palette_large,
+        "synthetic:alias-chains": alias_chains,
+        "synthetic:fonts-500": fonts_many,
+        "synthetic:brand-large": brand_large,
+    }
+
+
+def all_cases() -> dict[str, CaseFunc]:
+    return {**example_cases(), **synthetic_cases()}
@@ -0,0 +1,260 @@
+"""
+Benchmark suite for reading, validating and writing brands.
+
+Measures each phase of working with a brand separately for every case in
+`cases.py`:
+
+- `parse`: parse the Brand YAML text into Python data.
+- `validate`: validate the parsed data into a `brand_yml.Brand`.
+- `resolve`: resolve all color definitions in `color.palette`.
+- `css`: generate the CSS to include the brand's fonts.
+- `dump`: serialize the validated brand back to YAML.
+
+Results can be saved as a JSON baseline and later runs compared against it.
+The `parse` phase uses the YAML loader chosen by `BRAND_YAML_LOADER`.
+
+Usage:
+
+    python pkg-py/benchmarks/run.py
+    python pkg-py/benchmarks/run.py --save baseline.json
+    python pkg-py/benchmarks/run.py --compare baseline.json --max-regression 1.25
+    python pkg-py/benchmarks/run.py --filter synthetic --phase validate
+    BRAND_YAML_LOADER=safe python pkg-py/benchmarks/run.py --phase parse
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from copy import deepcopy
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from brand_yml import Brand
+from brand_yml._defs import DefsResolver
+from brand_yml._utils_yaml import yaml_brand as yaml
+from brand_yml._utils_yaml import yaml_loader
+
+sys.path.insert(0, str(Path(__file__).parent))
+from cases import all_cases  # noqa: E402 # pyright: ignore[reportMissingImports]
+
+PHASES = ("parse", "validate", "resolve", "css", "dump")
+
+# A phase receives the text of the Brand YAML and returns the function to be
+# timed, or `None` if the phase doesn't apply to the brand.
+PhaseSetup = Callable[[str], Optional[Callable[[], Any]]]
+
+
+def setup_parse(text: str):
+    loader = yaml_loader()
+    return lambda: loader.load(text)
+
+
+def setup_validate(text: str):
+    data = yaml.load(text)
+    # Validation may modify the data, so each run validates a fresh copy
+    return lambda: Brand.model_validate(deepcopy(data))
+
+
+def setup_resolve(text: str):
+    data = yaml.load(text)
+    palette = (data.get("color") or {}).get("palette")
+    if not palette:
+        return None
+    return lambda: DefsResolver(dict(palette), name="palette").resolved
+
+
+def setup_css(text: str):
+    brand = Brand.from_yaml_str(text)
+    typography = brand.typography
+    if typography is None or not typography.fonts:
+        return None
+
+    def css():
+        # Drop the cached CSS so that every call generates it
+        typography._css_include_fonts = None
+        return typography.css_include_fonts()
+
+    return css
+
+
+def setup_dump(text: str):
+    brand = Brand.from_yaml_str(text)
+    return brand.model_dump_yaml
+
+
+PHASE_SETUP: dict[str, PhaseSetup] = {
+    "parse": setup_parse,
+    "validate": setup_validate,
+    "resolve": setup_resolve,
+    "css": setup_css,
+    "dump": setup_dump,
+}
+
+
+def measure(
+    fn: Callable[[], Any],
+    repeat: int = 5,
+    min_time: float = 0.05,
+) -> float:
+    """
+    Returns the best time, in seconds, of a single call to `fn` over `repeat`
+    rounds. Each round calls `fn` enough times to take at least `min_time`.
+    """
+    fn()  # warm up
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 10_000:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+
+    return min(times)
+
+
+def run(
+    case_filter: str | None = None,
+    phases: tuple[str, ...] = PHASES,
+    repeat: int = 5,
+    min_time: float = 0.05,
+) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+
+    for name, case in all_cases().items():
+        if case_filter and case_filter not in name:
+            continue
+
+        text = case()
+        results[name] = {}
+        for phase in phases:
+            fn = PHASE_SETUP[phase](text)
+            if fn is None:
+                continue
+            results[name][phase] = measure(fn, repeat, min_time)
+
+        print_row(name, results[name], phases)
+
+    return results
+
+
+def format_time(seconds: float | None) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def print_header(phases: tuple[str, ...]) -> None:
+    print(f"{'case':<45}" + "".join(f"{p:>12}" for p in phases))
+
+
+def print_row(
+    name: str,
+    result: dict[str, float],
+    phases: tuple[str, ...],
+) -> None:
+    cells = "".join(f"{format_time(result.get(p)):>12}" for p in phases)
+    print(f"{name:<45}{cells}", flush=True)
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    phases: tuple[str, ...],
+) -> float:
+    """Print the ratio of each result to the baseline; returns the worst."""
+    print("\nRatio to baseline (> 1 is slower)")
+    print_header(phases)
+
+    worst = 0.0
+    for name, result in results.items():
+        base = baseline.get(name, {})
+        cells = ""
+        for phase in phases:
+            if phase not in result or phase not in base:
+                cells += f"{'-':>12}"
+                continue
+            ratio = result[phase] / base[phase]
+            worst = max(worst, ratio)
+            cells += f"{ratio:>11.2f}x"
+        print(f"{name:<45}{cells}")
+
+    return worst
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").split("\n\n")[0]
+    )
+    parser.add_argument("--filter", help="Only run cases containing this text.")
+    parser.add_argument(
+        "--phase",
+        action="append",
+        choices=PHASES,
+        help="Only run these phases (can be repeated).",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--save", type=Path, help="Save results as JSON.")
+    parser.add_argument("--compare", type=Path, help="Compare to a JSON file.")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="Exit with an error if any ratio to the baseline exceeds this.",
+    )
+    args = parser.parse_args()
+
+    phases = tuple(args.phase) if args.phase else PHASES
+
+    print_header(phases)
+    results = run(args.filter, phases, args.repeat, args.min_time)
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "meta": {
+                        "created": datetime.now(timezone.utc).isoformat(),
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                    },
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+        print(f"\nSaved results to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        worst = compare(results, baseline, phases)
+        if args.max_regression and worst > args.max_regression:
+            print(
+                f"\nRegression: {worst:.2f}x slower than baseline "
+                f"(max {args.max_regression:.2f}x)"
+            )
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
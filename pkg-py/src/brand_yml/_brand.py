@@ -0,0 +1,948 @@
+"""
+The `Brand` class and functions for reading Brand YAML files.
+
+These are re-exported lazily from `brand_yml`; import them from there.
+"""
+
+from __future__ import annotations
+
+import os
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, TypeVar, Union, overload
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+from ._utils import (
+    find_project_brand_yml,
+    project_file_cache,
+    recurse_dicts_and_models,
+)
+from ._utils_batch import (
+    ExecutorType,
+    map_chunks_unordered,
+    picklable_exception,
+)
+from ._utils_cache import LRUCache, file_stamp
+from ._utils_data_uri import data_uri_cache
+from ._utils_sfnt import font_metadata_cache
+from ._utils_yaml import BrandYamlLoaderType, yaml_loader, yaml_loader_type
+from ._utils_yaml import yaml_brand as yaml
+from .audit import BrandContrastAudit, audit_contrast
+from .base import BrandBase
+from .color import BrandColor
+from .file import FileLocation, FileLocationLocal
+from .logo import BrandLogo, BrandLogoResource
+from .meta import BrandMeta
+from .typography import BrandTypography
+
+BrandT = TypeVar("BrandT", bound="Brand")
+
+
+class Brand(BrandBase):
+    """
+    Brand guidelines in a class.
+
+    A brand instance encapsulates the color, typography and logo preferences for
+    a given brand, typically found in brand guidelines created by a company's
+    marketing department. `brand_yml.Brand` organizes this information in a
+    common, fully-specified class instance that makes it easy to re-use for
+    theming any artifact from websites to data visualizations.
+
+    Unified brand information following the Brand YAML specification. Read brand
+    metadata from a YAML file, typically named `_brand.yml`, with
+    `brand_yml.Brand.from_yaml` or from a YAML string with
+    `brand_yml.Brand.from_yaml_str`. Or create a full brand instance directly
+    via this class.
+    """
+
+    model_config = ConfigDict(
+        extra="ignore",
+        revalidate_instances="always",
+        validate_assignment=True,
+    )
+
+    # TODO @docs: Document Brand attributes
+    meta: BrandMeta | None = None
+    logo: BrandLogo | BrandLogoResource | None = None
+    color: BrandColor | None = None
+    typography: BrandTypography | None = None
+    defaults: dict[str, Any] | None = None
+    path: Path | None = Field(None, exclude=True, repr=False)
+
+    @classmethod
+    def from_yaml(
+        cls: type[BrandT],
+        path: str | Path,
+        *,
+        cache: bool = True,
+        loader: BrandYamlLoaderType | None = None,
+    ) -> BrandT:
+        """
+        Read a Brand YAML file.
+
+        Reads a Brand YAML file or finds and reads a `_brand.yml` file and returns
+        a validated :class:`Brand` object.
+
+        Parameters
+        ----------
+        path
+            The path to the Brand YAML file or a directory where `_brand.yml` is
+            expected to be found. Typically, you can pass `__file__` from the
+            calling script to find `_brand.yml` in the current directory or any of
+            its parent directories.
+        cache
+            Whether to use the process-wide cache of validated brands. When
+            `True` (the default), re-reading an unchanged file returns a copy
+            of the previously validated brand. See
+            [`brand_yml.clear_cache`](`brand_yml.clear_cache`).
+        loader
+            The YAML loader, either `"rt"` (round-trip, the default) or
+            `"safe"`, which is faster and uses the C-based parser from
+            `ruamel.yaml.clib` if it's installed. When `None`, the loader is
+            chosen by the `BRAND_YAML_LOADER` environment variable.
+
+        Returns
+        -------
+        :
+            A validated `brand_yml.Brand` object with all fields populated
+            according to the Brand YAML file.
+
+        Raises
+        ------
+        FileNotFoundError
+            Raises a `FileNotFoundError` if no brand configuration file is found
+            within the given path. Raises `ValueError` or other validation errors
+            from [pydantic](https://docs.pydantic.dev/latest/) if the Brand YAML
+            file is invalid.
+
+        Examples
+        --------
+
+        ```python
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml(__file__)
+        brand = Brand.from_yaml("path/to/_brand.yml")
+        ```
+        """
+        return _read_brand_yml(path, cls=cls, cache=cache, loader=loader)
+
+    @classmethod
+    def from_yaml_str(
+        cls,
+        text: str,
+        path: str | Path | None = None,
+        *,
+        loader: BrandYamlLoaderType | None = None,
+    ):
+        """
+        Create a Brand instance from a string of YAML.
+
+        Parameters
+        ----------
+        text
+            The text of the Brand YAML file.
+        path
+            The optional path on disk for supporting files like logos and fonts.
+        loader
+            The YAML loader, either `"rt"` (round-trip, the default) or
+            `"safe"`. When `None`, the loader is chosen by the
+            `BRAND_YAML_LOADER` environment variable.
+
+        Returns
+        -------
+        :
+            A validated `brand_yml.Brand` object with all fields populated
+            according to the Brand YAML text.
+
+        Raises
+        ------
+        ValueError
+            Raises `ValueError` or other validation errors from
+            [pydantic](https://docs.pydantic.dev/latest/) if the Brand YAML file
+            is invalid.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        meta:
+          name: Brand YAML
+        color:
+          primary: "#ff0202"
+        typography:
+          base: Open Sans
+        \"\"\")
+        ```
+
+        ```{python}
+        brand.meta
+        ```
+
+        ```{python}
+        brand.color.primary
+        ```
+        """
+        data = yaml_loader(loader).load(text)
+
+        if path is not None:
+            data["path"] = Path(path).absolute()
+
+        return cls.model_validate(data)
+
+    @classmethod
+    def from_validated(
+        cls: type[BrandT],
+        *,
+        meta: BrandMeta | None = None,
+        logo: BrandLogo | BrandLogoResource | None = None,
+        color: BrandColor | None = None,
+        typography: BrandTypography | None = None,
+        defaults: dict[str, Any] | None = None,
+        path: str | Path | None = None,
+    ) -> BrandT:
+        """
+        Create a Brand from already validated components.
+
+        `Brand(color=color, ...)` validates every component again, including
+        components that are already validated model instances. When the
+        components come from a trusted source, such as another brand,
+        `from_validated()` skips that step and only runs the checks that
+        involve more than one component: resolving `typography` colors using
+        `color` and setting the root directory of local files from `path`.
+
+        Components are used as-is and are shared with the new brand, except
+        `typography` and `logo`, which are copied when they need to be updated
+        for the new brand.
+
+        Parameters
+        ----------
+        meta, logo, color, typography
+            Validated brand components, e.g. from another brand instance.
+        defaults
+            The brand's `defaults`.
+        path
+            The absolute path of the Brand YAML file, used to find supporting
+            files like logos and fonts.
+
+        Returns
+        -------
+        :
+            A `brand_yml.Brand` instance.
+
+        Raises
+        ------
+        TypeError
+            If a component is not an instance of the expected model.
+
+        Examples
+        --------
+
+        ```python
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml("_brand.yml")
+        light = Brand.from_validated(
+            meta=brand.meta,
+            color=brand.color,
+            typography=brand.typography,
+        )
+        ```
+        """
+        components: dict[str, tuple[Any, tuple[type, ...]]] = {
+            "meta": (meta, (BrandMeta,)),
+            "logo": (logo, (BrandLogo, BrandLogoResource)),
+            "color": (color, (BrandColor,)),
+            "typography": (typography, (BrandTypography,)),
+        }
+        for name, (value, types) in components.items():
+            if value is not None and not isinstance(value, types):
+                expected = " or ".join(t.__name__ for t in types)
+                raise TypeError(
+                    f"`{name}` must be a validated {expected} instance, "
+                    f"not {type(value).__name__}."
+                )
+
+        if path is not None:
+            path = cls._validate_path_is_absolute(Path(path))
+
+        # The validators below modify these components in place. Local files
+        # are updated with the root directory, typography colors are resolved.
+        if path is not None:
+            if typography is not None:
+                typography = typography.model_copy(deep=True)
+            if logo is not None:
+                logo = logo.model_copy(deep=True)
+        elif typography is not None and color is not None:
+            typography = typography.model_copy(
+                update={
+                    name: deepcopy(getattr(typography, name))
+                    for name in BrandTypography.model_fields
+                    if name != "fonts"
+                }
+            )
+
+        values = {
+            "meta": meta,
+            "logo": logo,
+            "color": color,
+            "typography": typography,
+            "defaults": defaults,
+            "path": path,
+        }
+        brand = cls.model_construct(
+            _fields_set={k for k, v in values.items() if v is not None},
+            **values,
+        )
+        # Run the logic of the model validators on the constructed brand
+        brand._update_typography_colors()
+        brand._update_root_path()
+        brand._update_font_metadata()
+        return brand
+
+    def model_dump_yaml(
+        self,
+        stream: Any = None,
+        *,
+        transform: Any = None,
+    ) -> Any:
+        """
+        Serialize the Brand object to YAML.
+
+        Write the [`brand_yml.Brand`](`brand_yml.Brand`) instance to a string
+        or to a file on disk.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        meta:
+          name: Brand YAML
+        color:
+          palette:
+            orange: "#ff9a02"
+          primary: orange
+        typography:
+          headings: Raleway
+        \"\"\")
+        ```
+
+        ::: python-code-preview
+        ```{python}
+        print(brand.model_dump_yaml())
+        ```
+        :::
+
+        Parameters
+        ----------
+        stream
+            Passed to `stream` parameter of
+            [`ruamel.yaml.YAML.dump`](`ruamel.yaml.YAML.dump`).
+
+        transform
+            Passed to `transform` parameter of
+            [`ruamel.yaml.YAML.dump`](`ruamel.yaml.YAML.dump`).
+
+        Returns
+        -------
+        :
+            A string with the YAML representation of the `brand` if `stream` is
+            `None`. Otherwise, the YAML representation is written to `stream`,
+            typically a file.
+
+            Note that the output YAML may not be 100% identical to the input
+            `_brand.yml`. The output will contain the fully validated Brand
+            instance where default or computed values may be included as well as
+            any values resolved during validation, such as colors.
+        """
+
+        return yaml.dump(self, stream=stream, transform=transform)
+
+    def audit_contrast(self) -> BrandContrastAudit:
+        """
+        Check the contrast of the brand's text colors against their backgrounds.
+
+        Each text color is compared with the background it's shown on, using
+        the contrast ratio and levels defined by the [Web Content Accessibility
+        Guidelines (WCAG)](https://www.w3.org/TR/WCAG21/#contrast-minimum):
+
+        * `typography.base` uses `color.foreground` on `color.background`.
+        * `typography.headings`, `typography.link`,
+          `typography.monospace-inline` and `typography.monospace-block` use
+          their `color` on their `background-color`, falling back to
+          `color.foreground` and `color.background`. Elements that don't set
+          either color are covered by `typography.base`.
+        * The theme colors `color.primary` through `color.danger` are checked
+          against `color.background`, e.g. for links and buttons.
+
+        Every distinct color is parsed once and all ratios are computed
+        together. Colors that can't be parsed, such as CSS variables, are
+        reported without a ratio.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        color:
+          foreground: "#151515"
+          background: "#FFFFFF"
+          primary: "#EE6331"
+        typography:
+          link:
+            color: primary
+        \"\"\")
+
+        audit = brand.audit_contrast()
+        [(check.element, round(check.ratio, 2)) for check in audit.failures]
+        ```
+
+        Returns
+        -------
+        :
+            A [](`~brand_yml.audit.BrandContrastAudit`) with one check per pair
+            of colors.
+        """
+        return audit_contrast(self)
+
+    @model_validator(mode="after")
+    def _resolve_typography_colors(self):
+        self._update_typography_colors()
+        return self
+
+    def _update_typography_colors(self) -> None:
+        """
+        Resolve colors in `typography` using `color`.
+
+        Resolves colors used in `brand.typography` in the `color` or
+        `background-color` fields of any typography properties. These values are
+        replaced when the brand instance is validated so that values are ready
+        to be used by any brand consumers.
+        """
+        if self.typography is None:
+            return
+
+        color_defs = self.color._color_defs(resolved=True) if self.color else {}
+        color_names = [
+            k for k in BrandColor.model_fields.keys() if k != "palette"
+        ]
+
+        for top_field in self.typography.model_fields.keys():
+            typography_node = getattr(self.typography, top_field)
+
+            if not isinstance(typography_node, BaseModel):
+                continue
+
+            for typography_node_field in typography_node.model_fields.keys():
+                if typography_node_field not in ("color", "background_color"):
+                    continue
+
+                value = getattr(typography_node, typography_node_field)
+                if value is None or not isinstance(value, str):
+                    continue
+
+                is_defined = value in color_defs
+                is_theme_color = value in color_names
+
+                if not is_defined:
+                    if is_theme_color:
+                        raise ValueError(
+                            f"`typography.{top_field}.{typography_node_field}` "
+                            f"referred to `color.{value}` which is not defined."
+                        )
+                    else:
+                        continue
+
+                setattr(
+                    typography_node,
+                    typography_node_field,
+                    color_defs[value],
+                )
+
+    @field_validator("path", mode="after")
+    @classmethod
+    def _validate_path_is_absolute(cls, value: Path | None) -> Path | None:
+        """
+        Ensures that the value of the `path` field is specified absolutely.
+
+        Will also expand user directories and resolve any symlinks.
+        """
+        if value is None:
+            return None
+
+        value = Path(value).expanduser()
+
+        if not value.is_absolute():
+            raise ValueError(
+                f"brand.path must be an absolute path, not `{value}`."
+            )
+
+        return value.resolve()
+
+    @model_validator(mode="after")
+    def _set_root_path(self):
+        self._update_root_path()
+        return self
+
+    def _update_root_path(self) -> None:
+        """
+        Update the root path of local file locations.
+
+        Updates any fields in `brand_yml.Brand` that are known local file
+        locations, i.e. fields that are validated into
+        `brand_yml.file.FileLocationLocal` instances, to record the root
+        directory. These file paths should be specified (and serialized) as
+        relative paths in `_brand.yml`, but any brand consumer will need to be
+        able to resolve the file locations to their absolute paths via
+        `brand_yml.file.FileLocationLocal.absolute()`.
+        """
+        path = self.path
+        if path is not None:
+            recurse_dicts_and_models(
+                self,
+                pred=lambda value: isinstance(value, FileLocationLocal),
+                modify=lambda value: value.set_root_dir(path.parent),
+            )
+
+    @model_validator(mode="after")
+    def _infer_font_metadata(self):
+        self._update_font_metadata()
+        return self
+
+    def _update_font_metadata(self) -> None:
+        """
+        Fill in font file weights and styles from local font files.
+
+        Only runs when the `BRAND_YAML_INFER_FONT_METADATA` environment
+        variable is `true`, see
+        [`BrandTypography.infer_font_metadata()`](`brand_yml.typography.BrandTypography.infer_font_metadata`).
+        """
+        if self.typography is not None and _infer_font_metadata_enabled():
+            self.typography.infer_font_metadata()
+
+    @field_validator("logo", mode="before")
+    @classmethod
+    def _promote_logo_scalar_to_resource(cls, value: Any):
+        """
+        Take a single path value passed to `brand.logo` and promote it into a
+        [`brand_yml.BrandLogoResource`](`brand_yml.BrandLogoResource`).
+        """
+        if isinstance(value, (str, Path, FileLocation)):
+            return {"path": value}
+        return value
+
+
+@overload
+def read_brand_yml(
+    path: str | Path,
+    as_data: Literal[False] = False,
+    *,
+    cache: bool = True,
+    loader: BrandYamlLoaderType | None = None,
+) -> Brand: ...
+
+
+@overload
+def read_brand_yml(
+    path: str | Path,
+    as_data: Literal[True],
+    *,
+    cache: bool = True,
+    loader: BrandYamlLoaderType | None = None,
+) -> dict: ...
+
+
+def read_brand_yml(
+    path: str | Path,
+    as_data: bool = False,
+    *,
+    cache: bool = True,
+    loader: BrandYamlLoaderType | None = None,
+) -> Brand | dict:
+    """
+    Read a Brand YAML file.
+
+    Reads a Brand YAML file or finds and reads a project-specific `_brand.yml`
+    file and returns a validated `~brand_yml.Brand` instance.
+
+    To find a project-specific `_brand.yaml` file, pass the project directory or
+    `__file__` (the path of the current Python script).
+    `brand_yml.read_brand_yml` will look in that directory or any parent
+    directory for a `_brand.yml`, `brand/_brand.yml` or `_brand/_brand.yml`
+    file. Note that it starts the search in the directory passed in and moves
+    upward to find the Brand YAML file; it does not search into subdirectories
+    of the current directory.
+
+    Parameters
+    ----------
+    path
+        The path to the Brand YAML file or a directory where `_brand.yml` is
+        expected to be found. Typically, you can pass `__file__` from the
+        calling script to find `_brand.yml` in the current directory or any of
+        its parent directories.
+
+    as_data
+        When `True`, returns the raw brand data as a dictionary parsed from the
+        YAML file. When `False`, returns a validated :class:`Brand` object.
+
+    cache
+        Whether to use the process-wide cache of parsed and validated brands.
+        Cached entries are keyed by the resolved path of the Brand YAML file and
+        its modification time and size, so changes to the file are always
+        picked up. Each call returns a fresh copy of the cached value that can
+        be modified without affecting the cache. Use
+        [`brand_yml.clear_cache`](`brand_yml.clear_cache`) to empty the cache.
+
+    loader
+        The YAML loader, either `"rt"` (round-trip, the default) or `"safe"`.
+        The safe loader uses the C-based parser from `ruamel.yaml.clib`, if
+        it's installed, and skips the comment and formatting information kept
+        by the round-trip loader, making it a good choice when reading many
+        files. When `None`, the loader is chosen by the `BRAND_YAML_LOADER`
+        environment variable.
+
+    Returns
+    -------
+    :
+        A validated :class:`brand_yml.Brand` object with all fields populated according to
+        the Brand YAML file (`as_data=False`, default) or the raw brand data
+        as a dictionary (`as_data=True`).
+
+    Raises
+    ------
+    FileNotFoundError
+        Raises a `FileNotFoundError` if no brand configuration file is found
+        within the given path.
+    ValueError
+        `ValueError` or other validation errors are raised from
+        [pydantic](https://docs.pydantic.dev/latest/) if the Brand YAML file is
+        invalid.
+
+    Examples
+    --------
+
+    ```python
+    from brand_yml import read_brand_yml
+
+    brand = read_brand_yml(__file__)
+    brand = read_brand_yml("path/to/_brand.yml")
+    ```
+    """
+
+    if as_data:
+        return _read_brand_yml(path, cls=None, cache=cache, loader=loader)
+    return _read_brand_yml(path, cls=Brand, cache=cache, loader=loader)
+
+
+PathT = TypeVar("PathT", bound=Union[str, Path])
+
+
+def load_many(
+    paths: Iterable[PathT],
+    *,
+    workers: int | None = None,
+    executor: ExecutorType = "process",
+    chunksize: int | None = None,
+    loader: BrandYamlLoaderType | None = None,
+) -> Iterator[tuple[PathT, Brand | Exception]]:
+    """
+    Read and validate many Brand YAML files in parallel.
+
+    Each file is read with [`brand_yml.read_brand_yml`](`brand_yml.read_brand_yml`)
+    in a pool of worker processes (or threads). Errors are isolated per file:
+    a file that can't be read or isn't a valid brand yields the exception
+    instead of a brand, and the remaining files are still processed.
+
+    Parameters
+    ----------
+    paths
+        The paths to the Brand YAML files, or to directories or scripts from
+        which to find the project's `_brand.yml`.
+    workers
+        The maximum number of workers. Defaults to the number of processors
+        for `executor="process"`.
+    executor
+        Whether to use a pool of `"process"` (default) or `"thread"` workers.
+        Validation is CPU-bound, so processes are generally faster for large
+        batches.
+    chunksize
+        The number of files sent to a worker at once. Larger chunks reduce the
+        overhead of communicating with worker processes. By default, each
+        worker process receives about four chunks; threads receive one file at
+        a time.
+    loader
+        The YAML loader, see [`brand_yml.read_brand_yml`](`brand_yml.read_brand_yml`).
+        `"safe"` is recommended for large batches.
+
+    Returns
+    -------
+    :
+        An iterator of `(path, result)` tuples in the order in which files are
+        completed, where `path` is the path as given in `paths` and `result` is
+        either a validated [`brand_yml.Brand`](`brand_yml.Brand`) or the
+        exception raised while reading the file.
+
+    Examples
+    --------
+
+    ```python
+    from pathlib import Path
+    from brand_yml import Brand, load_many
+
+    paths = Path("tenants").glob("*/_brand.yml")
+
+    for path, result in load_many(paths, loader="safe"):
+        if isinstance(result, Exception):
+            print(f"{path}: {result}")
+    ```
+    """
+    return map_chunks_unordered(
+        _load_many_chunk,
+        [(path, loader, executor == "process") for path in paths],
+        workers=workers,
+        executor=executor,
+        chunksize=chunksize,
+    )
+
+
+def _load_many_chunk(
+    chunk: list[tuple[PathT, BrandYamlLoaderType | None, bool]],
+) -> list[tuple[PathT, Brand | Exception]]:
+    results: list[tuple[PathT, Brand | Exception]] = []
+    for path, loader, in_process in chunk:
+        try:
+            result = read_brand_yml(path, cache=False, loader=loader)
+        except Exception as err:
+            result = picklable_exception(err) if in_process else err
+        results.append((path, result))
+    return results
+
+
+def audit_contrast_many(
+    brands: Iterable[Brand | PathT],
+    *,
+    workers: int | None = None,
+    executor: ExecutorType = "process",
+    chunksize: int | None = None,
+    loader: BrandYamlLoaderType | None = None,
+) -> Iterator[tuple[Brand | PathT, BrandContrastAudit | Exception]]:
+    """
+    Audit the contrast of many brands in parallel.
+
+    Runs [`Brand.audit_contrast()`](`brand_yml.Brand.audit_contrast`) for each
+    brand in a pool of worker processes (or threads). Brands may be given as
+    [`brand_yml.Brand`](`brand_yml.Brand`) instances or as paths to Brand YAML
+    files, which are read in the workers with
+    [`brand_yml.read_brand_yml`](`brand_yml.read_brand_yml`). Errors are
+    isolated per brand: a brand that can't be read or audited yields the
+    exception instead of a report.
+
+    Parameters
+    ----------
+    brands
+        The brands, or paths to Brand YAML files.
+    workers
+        The maximum number of workers. Defaults to the number of processors
+        for `executor="process"`.
+    executor
+        Whether to use a pool of `"process"` (default) or `"thread"` workers.
+    chunksize
+        The number of brands sent to a worker at once. By default, each worker
+        process receives about four chunks; threads receive one brand at a
+        time.
+    loader
+        The YAML loader used to read paths, see
+        [`brand_yml.read_brand_yml`](`brand_yml.read_brand_yml`).
+
+    Returns
+    -------
+    :
+        An iterator of `(brand, result)` tuples in the order in which brands
+        are completed, where `brand` is the brand or path as given in `brands`
+        and `result` is either a [](`~brand_yml.audit.BrandContrastAudit`) or
+        the exception raised while reading or auditing the brand.
+
+    Examples
+    --------
+
+    ```python
+    from pathlib import Path
+    from brand_yml import audit_contrast_many
+
+    paths = Path("tenants").glob("*/_brand.yml")
+
+    for path, audit in audit_contrast_many(paths, loader="safe"):
+        if isinstance(audit, Exception) or not audit.passed:
+            print(path)
+    ```
+    """
+    items = list(brands)
+    results = map_chunks_unordered(
+        _audit_contrast_chunk,
+        [
+            (i, item, loader, executor == "process")
+            for i, item in enumerate(items)
+        ],
+        workers=workers,
+        executor=executor,
+        chunksize=chunksize,
+    )
+    # Workers return indices so that the caller gets back its own objects
+    return ((items[i], result) for i, result in results)
+
+
+def _audit_contrast_chunk(
+    chunk: list[tuple[int, Brand | PathT, BrandYamlLoaderType | None, bool]],
+) -> list[tuple[int, BrandContrastAudit | Exception]]:
+    results: list[tuple[int, BrandContrastAudit | Exception]] = []
+    for i, item, loader, in_process in chunk:
+        try:
+            brand = (
+                item
+                if isinstance(item, Brand)
+                else read_brand_yml(item, cache=False, loader=loader)
+            )
+            result = brand.audit_contrast()
+        except Exception as err:
+            result = picklable_exception(err) if in_process else err
+        results.append((i, result))
+    return results
+
+
+_brand_cache = LRUCache(maxsize=64)
+
+# Environment variables that change the outcome of reading a Brand YAML file
+font_metadata_env_var = "BRAND_YAML_INFER_FONT_METADATA"
+
+_brand_cache_env_vars = (
+    "BRAND_YAML_DEFAULT_FONT_SOURCE",
+    font_metadata_env_var,
+)
+
+
+def _infer_font_metadata_enabled() -> bool:
+    return os.environ.get(font_metadata_env_var, "").lower() in ("true", "1")
+
+
+def clear_cache() -> None:
+    """
+    Clear the cache of Brand YAML files.
+
+    [`brand_yml.read_brand_yml`](`brand_yml.read_brand_yml`) and
+    [`brand_yml.Brand.from_yaml`](`brand_yml.Brand.from_yaml`) cache the
+    parsed and validated contents of each Brand YAML file they read. The cache
+    is invalidated automatically when a file changes on disk, but can be
+    emptied explicitly with this function, e.g. in tests or long-running
+    processes.
+
+    This also clears the caches of directories searched for `_brand.yml`
+    files, of files encoded as `data:` URIs and of metadata read from font
+    files.
+    """
+    _brand_cache.clear()
+    project_file_cache.clear()
+    data_uri_cache.clear()
+    font_metadata_cache.clear()
+
+
+@overload
+def _read_brand_yml(
+    path: str | Path,
+    cls: None,
+    cache: bool,
+    loader: BrandYamlLoaderType | None = None,
+) -> dict: ...
+
+
+@overload
+def _read_brand_yml(
+    path: str | Path,
+    cls: type[BrandT],
+    cache: bool,
+    loader: BrandYamlLoaderType | None = None,
+) -> BrandT: ...
+
+
+def _read_brand_yml(
+    path: str | Path,
+    cls: type[Brand] | None,
+    cache: bool,
+    loader: BrandYamlLoaderType | None = None,
+) -> Brand | dict:
+    path = Path(path).absolute()
+
+    if path.is_dir():
+        path = find_project_brand_yml(path)
+    elif path.suffix == ".py":
+        # allows users to simply pass `__file__`
+        path = find_project_brand_yml(path.parent)
+
+    loader = yaml_loader_type(loader)
+
+    if not cache:
+        brand_data = _load_brand_yml(path, loader)
+        return brand_data if cls is None else cls.model_validate(brand_data)
+
+    env = tuple(os.environ.get(var) for var in _brand_cache_env_vars)
+    key = (cls, file_stamp(path), loader, env)
+    cached, font_stamps = _brand_cache.get(key, (None, ()))
+
+    # Font metadata is read from the font files when the brand is validated,
+    # so the cached brand is only current while its font files are unchanged
+    if isinstance(cached, Brand) and font_stamps != _font_file_stamps(cached):
+        cached = None
+
+    if cached is None:
+        if cls is None:
+            cached = _load_brand_yml(path, loader)
+        else:
+            # Validated brands are built from their own copy of the raw data
+            # so that the cached raw data isn't modified during validation
+            cached = cls.model_validate(
+                _read_brand_yml(path, None, cache, loader)
+            )
+        _brand_cache.set(key, (cached, _font_file_stamps(cached)))
+
+    # Hand out copies so that callers can't modify the cached values
+    if isinstance(cached, Brand):
+        return cached.model_copy(deep=True)
+    return deepcopy(cached)
+
+
+def _font_file_stamps(brand: Brand | dict) -> tuple[Any, ...]:
+    """The stamps of the local font files whose metadata `brand` depends on."""
+    if (
+        not isinstance(brand, Brand)
+        or brand.typography is None
+        or not _infer_font_metadata_enabled()
+    ):
+        return ()
+    return tuple(brand.typography._local_font_stamps())
+
+
+def _load_brand_yml(path: Path, loader: BrandYamlLoaderType) -> dict:
+    with open(path, "r") as f:
+        brand_data = yaml_loader(loader).load(f)
+
+    if not isinstance(brand_data, dict):
+        raise ValueError(
+            f"Invalid Brand YAML file {str(path)!r}. Must be a dictionary."
+        )
+
+    brand_data["path"] = path
+    return brand_data
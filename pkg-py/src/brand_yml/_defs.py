@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from textwrap import indent
-from typing import Any, Generic, Iterable, TypeVar, Union
+from typing import Any, Generic, Iterable, Iterator, TypeVar, Union
 
 from pydantic import (
     BaseModel,
@@ -10,7 +9,8 @@ from pydantic import (
 )
 from typing_extensions import TypeGuard
 
-from ._utils_logging import logger
+from ._utils_cache import LRUCache
+from ._utils_logging import log_debug, logger
 
 DictString = dict[str, str]
 DictStringRecursive = Union[DictString, dict[str, "DictStringRecursive"]]
@@ -71,23 +71,50 @@ def defs_get(
         references to top-level keys in `defs` also resolved. If `defs[key]`
         returns a dictionary or pydantic model, internal references to
         definitions are also replaced.
+
+    Notes
+    -----
+    The resolver for `defs` is reused by later lookups in the same table, so
+    every definition is resolved once. The resolver is rebuilt when a
+    top-level key of `defs` is added, removed or assigned a new value, but
+    changes made in place to nested values are not detected.
     """
     if key not in defs:
         return key
 
-    # Note that we assume that `defs` has already been checked for circular
-    # references, so we don't need to check for them here.
+    return defs_resolver(defs).get(key, level=level)
 
-    with_value = deepcopy(defs[key])
-    logger.debug(
-        level_indent(f"key {key} is in defs with value {with_value!r}", level)
-    )
 
-    if is_dict_or_basemodel(with_value):
-        defs_replace_recursively(with_value, defs=defs, level=level)
-        return with_value
-    else:
-        return with_value
+_resolvers = LRUCache(maxsize=32)
+"""Resolvers of recently used definitions, by the identity of the table."""
+
+
+def defs_resolver(defs: dict) -> DefsResolver:
+    """
+    Returns the cached `DefsResolver` for `defs`, or a new one if `defs` is a
+    different table or its top-level items changed since it was cached.
+    """
+    key = id(defs)
+    items = list(defs.items())
+
+    cached = _resolvers.get(key)
+    # The cache entry keeps `defs` alive, so its `id()` can't be reused
+    if (
+        cached is not None
+        and cached[0] is defs
+        and _same_items(cached[1], items)
+    ):
+        return cached[2]
+
+    resolver = DefsResolver(defs)
+    _resolvers.set(key, (defs, items, resolver))
+    return resolver
+
+
+def _same_items(a: list[tuple[str, Any]], b: list[tuple[str, Any]]) -> bool:
+    return len(a) == len(b) and all(
+        ka == kb and va is vb for (ka, va), (kb, vb) in zip(a, b)
+    )
 
 
 def defs_replace_recursively(
@@ -124,54 +151,271 @@ def defs_replace_recursively(
     if items is None:
         return None
 
-    if level == 0:
-        logger.debug("Checking for circular references")
-        check_circular_references(defs, name=name)
+    resolver = DefsResolver(defs, name=name, exclude=exclude)
+    resolver.replace(items, level=level)
 
-    if level > 50:  # pragma: no cover
-        logger.error("Hit recursion limit recursing into `items`")
-        return
 
-    for key in item_keys(items):
-        value = get_value(items, key)
+class DefsResolver:
+    """
+    Resolves references between definitions in `defs`.
 
-        if value is defs or key in set((exclude or "with_", "with_")):
-            # We replace internal def references when resolving sibling fields
-            continue
+    The references between the top-level keys of `defs` form a dependency
+    graph. The graph is built and sorted topologically once, which also
+    detects circular references, and each definition is then resolved exactly
+    once, in dependency order, into a table of resolved values.
 
-        logger.debug(level_indent(f"inspecting key {key}", level))
-        if isinstance(value, str) and value in defs:
-            new_value = defs_get(defs, value, level=level + 1)
-            logger.debug(
-                level_indent(
-                    f"replacing key {key} with definition from {value}: {new_value!r}",
-                    level,
+    Parameters
+    ----------
+    defs
+        A dictionary of definitions. Values are strings, which may refer to
+        other keys in `defs`, or dictionaries or pydantic models whose (nested)
+        string values may refer to keys in `defs`.
+
+    name
+        The name of the definitions, used in error messages.
+
+    exclude
+        A key whose values are never replaced, in addition to `with_`.
+    """
+
+    def __init__(
+        self,
+        defs: dict,
+        name: str | None = None,
+        exclude: str | None = None,
+    ):
+        self.defs = defs
+        self.name = name
+        self.exclude = {exclude or "with_", "with_"}
+        self._order: list[str] | None = None
+        self._resolved: dict[str, object] | None = None
+
+    @property
+    def order(self) -> list[str]:
+        """Keys of `defs`, sorted so that definitions precede their uses."""
+        if self._order is None:
+            log_debug("Checking for circular references")
+            self._order = self._sort()
+        return self._order
+
+    def check(self) -> None:
+        """Raise a `CircularReferenceError` if `defs` has circular references."""
+        self.order
+
+    @property
+    def resolved(self) -> dict[str, object]:
+        """A table of fully resolved definitions, by key."""
+        if self._resolved is None:
+            resolved: dict[str, object] = {}
+            self._resolved = resolved
+            for key in self.order:
+                resolved[key] = self._resolve_value(self.defs[key])
+        return self._resolved
+
+    def get(self, key: str, level: int = 0) -> object:
+        """
+        Returns a copy of the resolved definition of `key`, or `key` itself if
+        it isn't a key in `defs`.
+        """
+        if key not in self.defs:
+            return key
+
+        value = self.resolved[key]
+        log_debug("key %s is in defs with value %r", key, value, level=level)
+        return deepcopy(value) if is_dict_or_basemodel(value) else value
+
+    def replace(self, items: dict | BaseModel, level: int = 0) -> None:
+        """Replace references to `defs` in `items`, in place."""
+        if level > 50:  # pragma: no cover
+            logger.error("Hit recursion limit recursing into `items`")
+            return
+
+        for key in list(item_keys(items)):
+            value = get_value(items, key)
+
+            if value is self.defs or key in self.exclude:
+                # We replace internal def references when resolving sibling fields
+                continue
+
+            log_debug("inspecting key %s", key, level=level)
+            if isinstance(value, str) and value in self.defs:
+                new_value = self.get(value, level=level + 1)
+                log_debug(
+                    "replacing key %s with definition from %s: %r",
+                    key,
+                    value,
+                    new_value,
+                    level=level,
                 )
-            )
-            if isinstance(items, BaseModel):
-                setattr(items, key, new_value)
-            elif isinstance(items, dict):
-                items[key] = new_value
-        elif is_dict_or_basemodel(value):
-            logger.debug(level_indent(f"recursing into {key}", level))
-            defs_replace_recursively(
-                value,
-                defs=defs,
-                level=level + 1,
-                exclude=exclude,
-                name=name,
-            )
-        else:
-            logger.debug(
-                level_indent(
-                    f"skipping {key}, not replaceable (or not a dict or pydantic model)",
-                    level,
+                if isinstance(items, BaseModel):
+                    setattr(items, key, new_value)
+                elif isinstance(items, dict):
+                    items[key] = new_value
+            elif is_dict_or_basemodel(value):
+                log_debug("recursing into %s", key, level=level)
+                self.replace(value, level=level + 1)
+            else:
+                log_debug(
+                    "skipping %s, not replaceable (or not a dict or pydantic model)",
+                    key,
+                    level=level,
                 )
-            )
 
+    def _resolve_value(self, value: object) -> object:
+        # Called in dependency order, so referenced definitions are resolved
+        if isinstance(value, str):
+            if value in self.defs:
+                return self._resolved_ref(value)
+            return value
 
-def level_indent(x: str, level: int) -> str:
-    return indent(x, ("." * level))
+        if is_dict_or_basemodel(value):
+            value = deepcopy(value)
+            self._resolve_nested(value)
+
+        return value
+
+    def _resolve_nested(self, items: dict | BaseModel, level: int = 0) -> None:
+        if level > 50:  # pragma: no cover
+            logger.error("Hit recursion limit recursing into `defs`")
+            return
+
+        for key in list(item_keys(items)):
+            if key in self.exclude:
+                continue
+
+            value = get_value(items, key)
+            if isinstance(value, str) and value in self.defs:
+                new_value = self._resolved_ref(value)
+                if isinstance(items, BaseModel):
+                    setattr(items, key, new_value)
+                elif isinstance(items, dict):
+                    items[key] = new_value
+            elif is_dict_or_basemodel(value):
+                self._resolve_nested(value, level=level + 1)
+
+    def _resolved_ref(self, key: str) -> object:
+        assert self._resolved is not None
+        value = self._resolved[key]
+        return deepcopy(value) if is_dict_or_basemodel(value) else value
+
+    def _edges(self, key: str) -> list[tuple[str, list[str]]]:
+        """
+        Returns the references from `defs[key]` to other definitions, with the
+        path of keys leading to each reference.
+        """
+        edges: list[tuple[str, list[str]]] = []
+
+        def collect(value: object, path: list[str], level: int = 0):
+            if isinstance(value, str):
+                if value in self.defs:
+                    edges.append((value, path))
+                return
+
+            if not is_dict_or_basemodel(value) or level > 50:
+                return
+
+            for k in item_keys(value):
+                collect(get_value(value, k), [*path, k], level + 1)
+
+        collect(self.defs[key], [key])
+        return edges
+
+    def _sort(self) -> list[str]:
+        """
+        Topologically sort the keys in `defs` with an iterative depth-first
+        search. Keys on the current search path are "gray"; finding an edge to
+        a gray key means that the definitions are circular.
+        """
+        gray, black = 1, 2
+        state: dict[str, int] = {}
+        order: list[str] = []
+
+        for start in self.defs.keys():
+            if start in state:
+                continue
+
+            state[start] = gray
+            # Each frame holds a key, its remaining references, and the path
+            # of keys via the reference that's currently being followed
+            stack: list[list[Any]] = [[start, iter(self._edges(start)), []]]
+
+            while stack:
+                frame = stack[-1]
+                ref = next(frame[1], None)
+
+                if ref is None:
+                    state[frame[0]] = black
+                    order.append(frame[0])
+                    stack.pop()
+                    continue
+
+                ref_key, ref_path = ref
+                frame[2] = ref_path
+
+                if state.get(ref_key) == gray:
+                    raise self._circular_reference_error(start) or (
+                        CircularReferenceError(
+                            seen=[f[0] for f in stack] + [ref_key],
+                            path=[k for f in stack for k in f[2]],
+                            name=self.name,
+                        )
+                    )
+
+                if ref_key not in state:
+                    state[ref_key] = gray
+                    stack.append([ref_key, iter(self._edges(ref_key)), []])
+
+        return order
+
+    def _circular_reference_error(
+        self, start: str
+    ) -> CircularReferenceError | None:
+        """
+        Describe a circular reference reachable from `start`.
+
+        Only called once `_sort()` has found a cycle. The references are
+        followed from `start` until a definition is referenced twice, so that
+        `seen` and `path` list the references and keys in the same way as
+        earlier versions of `check_circular_references()`.
+        """
+        current: dict | BaseModel = {start: self.defs[start]}
+        stack: list[tuple[Any, Iterator[str], list[str], list[str]]] = [
+            (current, iter(list(item_keys(current))), [], [])
+        ]
+
+        while stack:
+            current, keys, seen, path = stack[-1]
+            key = next(keys, None)
+            if key is None:
+                stack.pop()
+                continue
+
+            value = get_value(current, key)
+            if isinstance(value, str):
+                if value not in self.defs:
+                    continue
+            elif not is_dict_or_basemodel(value):
+                continue
+
+            path_key = [*path, key]
+
+            if isinstance(value, str):
+                seen_key = [
+                    *seen,
+                    *([key, value] if len(seen) == 0 else [value]),
+                ]
+                if value in seen:
+                    return CircularReferenceError(seen_key, path_key, self.name)
+                value = {value: self.defs[value]}
+                stack.append(
+                    (value, iter(list(item_keys(value))), seen_key, path_key)
+                )
+            else:
+                stack.append(
+                    (value, iter(list(item_keys(value))), seen, path_key)
+                )
+
+        return None  # pragma: no cover
 
 
 def item_keys(item: DictStringRecursiveBaseModel | BaseModel) -> Iterable[str]:
@@ -192,50 +436,13 @@ def get_value(items: dict | BaseModel, key: str) -> object:
 
 def check_circular_references(
     data: dict[str, Any],
-    current: object | None = None,
-    seen: list[str] | None = None,
-    path: list[str] | None = None,
     name: str | None = None,
 ):
-    current = current if current is not None else data
-    seen = seen if seen is not None else []
-    path = path if path is not None else []
-
-    if not is_dict_or_basemodel(current):  # pragma: no cover
-        if not isinstance(current, str):
-            raise ValueError(
-                "All values must be strings, dictionaries, or pydantic models."
-            )
-        return
-
-    logger.debug(f"current is: {current}")
-    logger.debug(f"seen is: {seen}")
-    logger.debug(f"path is: {path}")
-
-    for key in item_keys(current):
-        value = get_value(current, key)
-
-        # Pass through objects we can recurse or strings if they're keys in `data`
-        if isinstance(value, str):
-            if value not in data:
-                continue
-        elif not is_dict_or_basemodel(value):
-            continue
-
-        path_key = [*path, key]
-
-        # implied value is also in data by above check
-        if isinstance(value, str):
-            seen_key = [*seen, *([key, value] if len(seen) == 0 else [value])]
-            if value in seen:
-                raise CircularReferenceError(seen_key, path_key, name)
-            else:
-                new_current = {k: v for k, v in data.items() if k == value}
-                check_circular_references(
-                    data, new_current, seen_key, path_key, name
-                )
-        else:
-            check_circular_references(data, value, seen, path_key, name)
+    """
+    Raise a `CircularReferenceError` if the definitions in `data` refer to
+    each other in a cycle, e.g. `a -> b -> a`.
+    """
+    DefsResolver(data, name=name).check()
 
 
 class CircularReferenceError(Exception):
@@ -251,5 +458,5 @@ class CircularReferenceError(Exception):
 
         msg_name = "" if not name else f" in '{name}'"
 
-        message = f'Circular reference detected{msg_name}.\nRefs    : {" -> ".join(seen)}\nVia path: {" -> ".join(path)}'
+        message = f"Circular reference detected{msg_name}.\nRefs    : {' -> '.join(seen)}\nVia path: {' -> '.join(path)}"
         super().__init__(message)
@@ -1,26 +1,137 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Union
 
 from pydantic import BaseModel
 
+from ._utils_cache import LRUCache
+
+
+class ProjectFileCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    currsize: int
+
+
+class ProjectFileCache:
+    """
+    Remembers where project files were, or were not, found in each directory.
+
+    Each directory visited by `find_project_file()` is listed once with
+    `os.scandir()` and the outcome -- a hit or a miss -- is cached. Cached
+    outcomes are invalidated when the modification time of the directory (or
+    of a checked subdirectory) changes, i.e. when files are added, removed or
+    renamed. Nested and sibling lookups in the same project reuse the outcomes
+    of their shared parent directories.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self._entries = LRUCache(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> ProjectFileCacheInfo:
+        return ProjectFileCacheInfo(self.hits, self.misses, len(self._entries))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def find_in_dir(
+        self,
+        dir_: Path,
+        filename: str,
+        subdir: tuple[str, ...] = (),
+    ) -> Path | None:
+        key = (dir_, filename, subdir)
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            stamps, found = entry
+            if all(_dir_mtime(path) == mtime for path, mtime in stamps):
+                self.hits += 1
+                return found
+
+        self.misses += 1
+        stamps, found = _scan_dir_for_file(dir_, filename, subdir)
+        self._entries.set(key, (stamps, found))
+        return found
+
+
+project_file_cache = ProjectFileCache()
+
+
+def _dir_mtime(path: Path) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scan_dir_for_file(
+    dir_: Path,
+    filename: str,
+    subdir: tuple[str, ...] = (),
+) -> tuple[tuple[tuple[Path, int | None], ...], Path | None]:
+    """
+    Look for `filename` in `dir_` or in any of its `subdir` directories, using
+    a single listing of `dir_`. Returns the modification times of the
+    directories that were inspected and the path to the file, if found.
+    """
+    stamps = [(dir_, _dir_mtime(dir_))]
+
+    try:
+        with os.scandir(dir_) as it:
+            entries = {entry.name: entry for entry in it}
+    except OSError:
+        entries = {}
+
+    def entry_exists(entry: os.DirEntry | None) -> bool:
+        if entry is None:
+            return False
+        try:
+            return entry.is_file() or entry.is_dir()
+        except OSError:
+            return False
+
+    if entry_exists(entries.get(filename)):
+        return tuple(stamps), dir_ / filename
+
+    for sub in subdir:
+        entry = entries.get(sub)
+        if entry is None or not entry.is_dir():
+            continue
+
+        sub_dir = dir_ / sub
+        stamps.append((sub_dir, _dir_mtime(sub_dir)))
+        if (sub_dir / filename).exists():
+            return tuple(stamps), sub_dir / filename
+
+    return tuple(stamps), None
+
 
 def find_project_file(
     filename: str,
     dir_: Path,
     subdir: tuple[str, ...] = (),
+    cache: ProjectFileCache | None = project_file_cache,
 ) -> Path:
     dir_og = dir_
     i = 0
     max_parents = 20
 
     while dir_ != dir_.parent and i < max_parents:
-        if (dir_ / filename).exists():
-            return dir_ / filename
-        for sub in subdir:
-            if (dir_ / sub / filename).exists():
-                return dir_ / sub / filename
+        if cache is not None:
+            found = cache.find_in_dir(dir_, filename, subdir)
+        else:
+            found = _scan_dir_for_file(dir_, filename, subdir)[1]
+
+        if found is not None:
+            return found
+
         dir_ = dir_.parent
         i += 1
 
@@ -0,0 +1,124 @@
+"""
+Run a function over batches of items in a thread or process pool.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from typing import Callable, Iterator, Literal, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ExecutorType = Literal["process", "thread"]
+
+
+def default_chunksize(
+    n_items: int,
+    workers: int | None,
+    executor: ExecutorType,
+) -> int:
+    """
+    Choose a chunk size that gives each worker about four chunks, which
+    amortizes inter-process communication while still balancing the load.
+    Threads share memory, so they get one item at a time.
+    """
+    if executor == "thread":
+        return 1
+
+    # The default size of a process pool
+    pool_size = workers or os.cpu_count() or 1
+    return max(1, n_items // (pool_size * 4))
+
+
+def map_chunks_unordered(
+    func: Callable[[list[T]], list[R]],
+    items: Sequence[T],
+    *,
+    workers: int | None = None,
+    executor: ExecutorType = "process",
+    chunksize: int | None = None,
+) -> Iterator[R]:
+    """
+    Apply `func` to chunks of `items` in a pool of workers.
+
+    `func` receives a list of up to `chunksize` items and returns a list of
+    results, which are yielded in the order in which the chunks complete. When
+    the iterator is closed early, chunks that haven't started are cancelled.
+
+    Parameters
+    ----------
+    func
+        The function to apply to each chunk. For process pools, `func` must be
+        importable (defined at the top-level of a module) and its results must
+        be picklable.
+    items
+        The items to process.
+    workers
+        The maximum number of workers. Defaults to the executor's default.
+    executor
+        Use a `"process"` or `"thread"` pool.
+    chunksize
+        The number of items sent to a worker at once. By default, items are
+        sent one at a time to threads and in chunks to processes.
+    """
+    if executor not in ("process", "thread"):
+        raise ValueError(
+            f"Invalid executor {executor!r}. Expected 'process' or 'thread'."
+        )
+
+    if chunksize is None:
+        chunksize = default_chunksize(len(items), workers, executor)
+    if chunksize < 1:
+        raise ValueError("`chunksize` must be a positive integer.")
+
+    chunks = [
+        list(items[i : i + chunksize]) for i in range(0, len(items), chunksize)
+    ]
+
+    return _map_chunks_unordered(func, chunks, workers, executor)
+
+
+def _map_chunks_unordered(
+    func: Callable[[list[T]], list[R]],
+    chunks: list[list[T]],
+    workers: int | None,
+    executor: ExecutorType,
+) -> Iterator[R]:
+    if len(chunks) == 0:
+        return
+
+    pool: Executor = (
+        ProcessPoolExecutor(max_workers=workers)
+        if executor == "process"
+        else ThreadPoolExecutor(max_workers=workers)
+    )
+
+    try:
+        futures: list[Future[list[R]]] = [
+            pool.submit(func, chunk) for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def picklable_exception(err: Exception) -> Exception:
+    """
+    Returns `err` if it can be sent between processes, otherwise a
+    `RuntimeError` with the same message.
+    """
+    try:
+        pickle.loads(pickle.dumps(err))
+        return err
+    except Exception:
+        return RuntimeError(f"{type(err).__name__}: {err}")
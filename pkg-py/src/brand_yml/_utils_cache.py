@@ -0,0 +1,82 @@
+"""
+Small, process-wide caches used to avoid repeated work on unchanged files.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, Hashable, Tuple
+
+FileStamp = Tuple[str, int, int]
+"""A file's resolved path, modification time (in ns) and size in bytes."""
+
+
+def file_stamp(path: Path | str) -> FileStamp:
+    """
+    Identify the current version of a file on disk.
+
+    The stamp changes whenever the file is modified, which makes it suitable
+    as (part of) a cache key for the contents of the file.
+    """
+    stat = os.stat(path)
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+class LRUCache:
+    """
+    A thread-safe, bounded, least-recently-used mapping.
+
+    Parameters
+    ----------
+    maxsize
+        The maximum number of items to keep. When the cache is full, the
+        least-recently used item is evicted. A `maxsize` of `0` disables the
+        cache.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if value < 0:
+            raise ValueError("`maxsize` must be a non-negative integer.")
+        self._maxsize = value
+        with self._lock:
+            self._evict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
@@ -0,0 +1,293 @@
+"""
+Parse CSS color strings and convert between sRGB, relative luminance and OKLab.
+
+Colors are represented as `(red, green, blue, alpha)` tuples of floats between
+0 and 1.
+"""
+
+from __future__ import annotations
+
+import re
+from colorsys import hls_to_rgb
+from typing import Tuple
+
+RGBA = Tuple[float, float, float, float]
+
+_re_hex = re.compile(r"#([0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})", re.IGNORECASE)
+_re_func = re.compile(r"(rgba?|hsla?)\((.*)\)", re.IGNORECASE)
+
+# CSS Color Module Level 4 named colors
+# https://www.w3.org/TR/css-color-4/#named-colors
+_named_colors_hex = {
+    "aliceblue": "#f0f8ff",
+    "antiquewhite": "#faebd7",
+    "aqua": "#00ffff",
+    "aquamarine": "#7fffd4",
+    "azure": "#f0ffff",
+    "beige": "#f5f5dc",
+    "bisque": "#ffe4c4",
+    "black": "#000000",
+    "blanchedalmond": "#ffebcd",
+    "blue": "#0000ff",
+    "blueviolet": "#8a2be2",
+    "brown": "#a52a2a",
+    "burlywood": "#deb887",
+    "cadetblue": "#5f9ea0",
+    "chartreuse": "#7fff00",
+    "chocolate": "#d2691e",
+    "coral": "#ff7f50",
+    "cornflowerblue": "#6495ed",
+    "cornsilk": "#fff8dc",
+    "crimson": "#dc143c",
+    "cyan": "#00ffff",
+    "darkblue": "#00008b",
+    "darkcyan": "#008b8b",
+    "darkgoldenrod": "#b8860b",
+    "darkgray": "#a9a9a9",
+    "darkgreen": "#006400",
+    "darkgrey": "#a9a9a9",
+    "darkkhaki": "#bdb76b",
+    "darkmagenta": "#8b008b",
+    "darkolivegreen": "#556b2f",
+    "darkorange": "#ff8c00",
+    "darkorchid": "#9932cc",
+    "darkred": "#8b0000",
+    "darksalmon": "#e9967a",
+    "darkseagreen": "#8fbc8f",
+    "darkslateblue": "#483d8b",
+    "darkslategray": "#2f4f4f",
+    "darkslategrey": "#2f4f4f",
+    "darkturquoise": "#00ced1",
+    "darkviolet": "#9400d3",
+    "deeppink": "#ff1493",
+    "deepskyblue": "#00bfff",
+    "dimgray": "#696969",
+    "dimgrey": "#696969",
+    "dodgerblue": "#1e90ff",
+    "firebrick": "#b22222",
+    "floralwhite": "#fffaf0",
+    "forestgreen": "#228b22",
+    "fuchsia": "#ff00ff",
+    "gainsboro": "#dcdcdc",
+    "ghostwhite": "#f8f8ff",
+    "gold": "#ffd700",
+    "goldenrod": "#daa520",
+    "gray": "#808080",
+    "green": "#008000",
+    "greenyellow": "#adff2f",
+    "grey": "#808080",
+    "honeydew": "#f0fff0",
+    "hotpink": "#ff69b4",
+    "indianred": "#cd5c5c",
+    "indigo": "#4b0082",
+    "ivory": "#fffff0",
+    "khaki": "#f0e68c",
+    "lavender": "#e6e6fa",
+    "lavenderblush": "#fff0f5",
+    "lawngreen": "#7cfc00",
+    "lemonchiffon": "#fffacd",
+    "lightblue": "#add8e6",
+    "lightcoral": "#f08080",
+    "lightcyan": "#e0ffff",
+    "lightgoldenrodyellow": "#fafad2",
+    "lightgray": "#d3d3d3",
+    "lightgreen": "#90ee90",
+    "lightgrey": "#d3d3d3",
+    "lightpink": "#ffb6c1",
+    "lightsalmon": "#ffa07a",
+    "lightseagreen": "#20b2aa",
+    "lightskyblue": "#87cefa",
+    "lightslategray": "#778899",
+    "lightslategrey": "#778899",
+    "lightsteelblue": "#b0c4de",
+    "lightyellow": "#ffffe0",
+    "lime": "#00ff00",
+    "limegreen": "#32cd32",
+    "linen": "#faf0e6",
+    "magenta": "#ff00ff",
+    "maroon": "#800000",
+    "mediumaquamarine": "#66cdaa",
+    "mediumblue": "#0000cd",
+    "mediumorchid": "#ba55d3",
+    "mediumpurple": "#9370db",
+    "mediumseagreen": "#3cb371",
+    "mediumslateblue": "#7b68ee",
+    "mediumspringgreen": "#00fa9a",
+    "mediumturquoise": "#48d1cc",
+    "mediumvioletred": "#c71585",
+    "midnightblue": "#191970",
+    "mintcream": "#f5fffa",
+    "mistyrose": "#ffe4e1",
+    "moccasin": "#ffe4b5",
+    "navajowhite": "#ffdead",
+    "navy": "#000080",
+    "oldlace": "#fdf5e6",
+    "olive": "#808000",
+    "olivedrab": "#6b8e23",
+    "orange": "#ffa500",
+    "orangered": "#ff4500",
+    "orchid": "#da70d6",
+    "palegoldenrod": "#eee8aa",
+    "palegreen": "#98fb98",
+    "paleturquoise": "#afeeee",
+    "palevioletred": "#db7093",
+    "papayawhip": "#ffefd5",
+    "peachpuff": "#ffdab9",
+    "peru": "#cd853f",
+    "pink": "#ffc0cb",
+    "plum": "#dda0dd",
+    "powderblue": "#b0e0e6",
+    "purple": "#800080",
+    "rebeccapurple": "#663399",
+    "red": "#ff0000",
+    "rosybrown": "#bc8f8f",
+    "royalblue": "#4169e1",
+    "saddlebrown": "#8b4513",
+    "salmon": "#fa8072",
+    "sandybrown": "#f4a460",
+    "seagreen": "#2e8b57",
+    "seashell": "#fff5ee",
+    "sienna": "#a0522d",
+    "silver": "#c0c0c0",
+    "skyblue": "#87ceeb",
+    "slateblue": "#6a5acd",
+    "slategray": "#708090",
+    "slategrey": "#708090",
+    "snow": "#fffafa",
+    "springgreen": "#00ff7f",
+    "steelblue": "#4682b4",
+    "tan": "#d2b48c",
+    "teal": "#008080",
+    "thistle": "#d8bfd8",
+    "tomato": "#ff6347",
+    "turquoise": "#40e0d0",
+    "violet": "#ee82ee",
+    "wheat": "#f5deb3",
+    "white": "#ffffff",
+    "whitesmoke": "#f5f5f5",
+    "yellow": "#ffff00",
+    "yellowgreen": "#9acd32",
+}
+
+_named_colors: dict[str, RGBA] = {
+    "transparent": (0.0, 0.0, 0.0, 0.0),
+}
+
+
+def parse_color(value: str) -> RGBA | None:
+    """
+    Parse a CSS named color or a color in hex, `rgb()`, `rgba()`, `hsl()` or
+    `hsla()` notation.
+
+    Returns `None` if the color isn't in one of these formats.
+    """
+    value = value.strip()
+
+    name = value.lower()
+    if name in _named_colors:
+        return _named_colors[name]
+    if name in _named_colors_hex:
+        value = _named_colors_hex[name]
+
+    match = _re_hex.fullmatch(value)
+    if match:
+        digits = match.group(1)
+        if len(digits) <= 4:
+            digits = "".join(d * 2 for d in digits)
+        channels = [
+            int(digits[i : i + 2], 16) / 255 for i in range(0, len(digits), 2)
+        ]
+        if len(channels) == 3:
+            channels.append(1.0)
+        return (channels[0], channels[1], channels[2], channels[3])
+
+    match = _re_func.fullmatch(value)
+    if match is None:
+        return None
+
+    args = [a for a in re.split(r"[\s,/]+", match.group(2).strip()) if a]
+    if len(args) not in (3, 4):
+        return None
+
+    try:
+        alpha = _parse_number(args[3], 1) if len(args) == 4 else 1.0
+        if match.group(1).lower().startswith("rgb"):
+            r, g, b = (_parse_number(a, 255) for a in args[:3])
+        else:
+            hue = float(args[0].lower().removesuffix("deg")) / 360 % 1
+            sat = _parse_number(args[1], 100)
+            light = _parse_number(args[2], 100)
+            r, g, b = hls_to_rgb(hue, light, sat)
+    except ValueError:
+        return None
+
+    return (_clamp(r), _clamp(g), _clamp(b), _clamp(alpha))
+
+
+def _parse_number(value: str, scale: float) -> float:
+    """Parse a number or percentage, scaling numbers by `1 / scale`."""
+    if value.endswith("%"):
+        return float(value[:-1]) / 100
+    return float(value) / scale
+
+
+def _clamp(value: float) -> float:
+    return min(1.0, max(0.0, value))
+
+
+def to_hex(rgba: RGBA) -> str:
+    """Format a color as `#rrggbb`, or `#rrggbbaa` if it's not opaque."""
+    channels = rgba if rgba[3] < 1 else rgba[:3]
+    return "#" + "".join(f"{round(_clamp(c) * 255):02x}" for c in channels)
+
+
+def _linear(channel: float) -> float:
+    if channel <= 0.04045:
+        return channel / 12.92
+    return ((channel + 0.055) / 1.055) ** 2.4
+
+
+def relative_luminance(rgba: RGBA) -> float:
+    """
+    The WCAG relative luminance of a color, from 0 (black) to 1 (white).
+    Transparency is ignored.
+    """
+    r, g, b = (_linear(c) for c in rgba[:3])
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast_ratio(luminance_a: float, luminance_b: float) -> float:
+    """The WCAG contrast ratio of two relative luminances, from 1 to 21."""
+    lighter, darker = (
+        max(luminance_a, luminance_b),
+        min(luminance_a, luminance_b),
+    )
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def to_oklab(rgba: RGBA) -> tuple[float, float, float]:
+    """
+    Convert a color to OKLab, in which distances between colors approximate
+    perceived differences.
+    """
+    r, g, b = (_linear(c) for c in rgba[:3])
+
+    l_ = (0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b) ** (1 / 3)
+    m_ = (0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b) ** (1 / 3)
+    s_ = (0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b) ** (1 / 3)
+
+    return (
+        0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_,
+        1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_,
+        0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_,
+    )
+
+
+def mix(a: RGBA, b: RGBA, weight: float) -> RGBA:
+    """Mix `weight` of color `b` into color `a`, in sRGB space."""
+    return (
+        a[0] + (b[0] - a[0]) * weight,
+        a[1] + (b[1] - a[1]) * weight,
+        a[2] + (b[2] - a[2]) * weight,
+        a[3] + (b[3] - a[3]) * weight,
+    )
@@ -0,0 +1,84 @@
+"""
+Encode local files as base64 `data:` URIs, e.g. to embed fonts and logos in a
+single HTML file.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import mmap
+import os
+from binascii import b2a_base64
+from pathlib import Path
+
+from ._utils_cache import LRUCache
+
+# Base64 encodes 3 bytes as 4 characters, so chunks that are a multiple of 3
+# bytes can be encoded separately and concatenated
+_base64_chunk_size = 3 * 256 * 1024
+
+data_uri_cache = LRUCache(maxsize=128)
+"""Encoded `data:` URIs keyed by the file's path, modification time and size."""
+
+
+def file_data_uri(
+    path: Path | str,
+    mime_type: str | None = None,
+    max_bytes: int | None = None,
+) -> str | None:
+    """
+    Encode a file as a base64 `data:` URI.
+
+    The encoded URI is cached until the file changes, so embedding the same
+    file again doesn't read and encode it again.
+
+    Parameters
+    ----------
+    path
+        The path to the file.
+    mime_type
+        The MIME type of the file. By default, the type is guessed from the
+        file extension.
+    max_bytes
+        The largest file to encode, in bytes.
+
+    Returns
+    -------
+    :
+        The `data:` URI, or `None` if the file is larger than `max_bytes`.
+    """
+    stat = os.stat(path)
+    if max_bytes is not None and stat.st_size > max_bytes:
+        return None
+
+    if mime_type is None:
+        mime_type = mimetypes.guess_type(str(path))[0]
+        mime_type = mime_type or "application/octet-stream"
+
+    key = (str(path), stat.st_mtime_ns, stat.st_size, mime_type)
+    uri = data_uri_cache.get(key)
+    if uri is None:
+        uri = f"data:{mime_type};base64,{base64_file(path)}"
+        data_uri_cache.set(key, uri)
+
+    return uri
+
+
+def base64_file(path: Path | str) -> str:
+    """
+    Base64-encode a file in chunks from a memory map, without first reading the
+    whole file into memory.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # Empty files can't be memory-mapped
+            return ""
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            chunks = [
+                b2a_base64(data[i : i + _base64_chunk_size], newline=False)
+                for i in range(0, size, _base64_chunk_size)
+            ]
+
+    return b"".join(chunks).decode("ascii")
@@ -0,0 +1,77 @@
+"""
+Metric-adjusted local fallback fonts, which take up the same space as a web
+font so that text doesn't move when the web font finishes loading.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from ._utils_sfnt import FontMetrics
+
+FontCategory = Literal["sans-serif", "serif", "monospace"]
+
+fallback_fonts: dict[FontCategory, tuple[str, FontMetrics]] = {
+    "sans-serif": ("Arial", FontMetrics(2048, 1854, -434, 67, 904)),
+    "serif": ("Times New Roman", FontMetrics(2048, 1825, -443, 87, 819)),
+    "monospace": ("Courier New", FontMetrics(2048, 1705, -615, 0, 1229)),
+}
+"""The local font used as the fallback for each category, with its metrics."""
+
+# Measured from the regular face of each family with `read_font_metadata()`.
+# This is deliberately not a full catalog: only add families whose metrics were
+# measured from the actual font files, since made-up metrics would make the
+# fallback shift text instead of preventing it.
+google_font_metrics: dict[str, tuple[FontCategory, FontMetrics]] = {
+    "Lato": ("sans-serif", FontMetrics(2000, 1974, -426, 0, 861)),
+    "Open Sans": ("sans-serif", FontMetrics(2048, 2189, -600, 0, 956)),
+    "Source Code Pro": ("monospace", FontMetrics(1000, 984, -273, 0, 600)),
+}
+"""
+Metrics of a few Google Fonts families, for fonts without local files.
+
+Families that aren't listed here only get a fallback from local font files.
+"""
+
+
+def fallback_family_name(family: str) -> str:
+    return f"{family} Fallback"
+
+
+def fallback_font_face(
+    family: str,
+    metrics: FontMetrics,
+    category: FontCategory = "sans-serif",
+) -> str:
+    """
+    A `@font-face` rule for a local font adjusted to match `metrics`.
+
+    `size-adjust` scales the fallback so that its average character width
+    matches the web font, and the ascent, descent and line gap overrides are
+    then relative to the adjusted size.
+    """
+    local, fallback = fallback_fonts[category]
+
+    size_adjust = (metrics.x_width_avg / metrics.units_per_em) / (
+        fallback.x_width_avg / fallback.units_per_em
+    )
+
+    def override(value: int) -> str:
+        return _percent(abs(value) / metrics.units_per_em / size_adjust)
+
+    return "\n".join(
+        [
+            "@font-face {",
+            f"  font-family: '{fallback_family_name(family)}';",
+            f"  src: local('{local}');",
+            f"  size-adjust: {_percent(size_adjust)};",
+            f"  ascent-override: {override(metrics.ascent)};",
+            f"  descent-override: {override(metrics.descent)};",
+            f"  line-gap-override: {override(metrics.line_gap)};",
+            "}",
+        ]
+    )
+
+
+def _percent(value: float) -> str:
+    return f"{value * 100:.2f}%"
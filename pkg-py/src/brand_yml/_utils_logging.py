@@ -1,4 +1,8 @@
+from __future__ import annotations
+
 import logging
+from textwrap import indent
+from typing import Any
 
 logger = logging.getLogger("brand_yml")
 if len(logger.handlers) == 0:
@@ -22,3 +26,28 @@ def log_set_debug():
     log_add_console_stream_handler()
     logger.setLevel(logging.DEBUG)
     logger.debug("Debug logging enabled")
+
+
+def log_debug_enabled() -> bool:
+    """Whether debug messages from `brand_yml` will be handled."""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def log_debug(msg: str, *args: Any, level: int = 0) -> None:
+    """
+    Log a debug message, deferring all formatting until it's needed.
+
+    `msg % args` is only formatted, and the message indented by `level` dots,
+    when debug logging is enabled. Use this instead of f-strings in hot loops,
+    where building the message (e.g. the `repr()` of large values) would
+    otherwise dominate the run time even though the message is discarded.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    if args:
+        msg = msg % args
+    if level > 0:
+        msg = indent(msg, "." * level)
+
+    logger.debug(msg, stacklevel=2)
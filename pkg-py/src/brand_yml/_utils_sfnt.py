@@ -0,0 +1,491 @@
+"""
+Read the weight, style, variation axes and vertical metrics of font files from
+their headers.
+
+Only the `OS/2`, `name`, `fvar`, `head`, `hhea`, `cmap` and `hmtx` tables are
+read. TrueType and OpenType files are memory-mapped, WOFF tables are
+decompressed individually and WOFF2 files require the optional `brotli`
+package.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import zlib
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from ._utils_cache import LRUCache, file_stamp
+
+_tables = (b"OS/2", b"name", b"fvar", b"head", b"hhea", b"cmap", b"hmtx")
+
+# Relative frequency of lowercase letters and spaces in English text, used to
+# weight the average character width
+_char_frequencies = {
+    " ": 0.18,
+    **{
+        char: 0.82 * percent / 100
+        for char, percent in zip(
+            "abcdefghijklmnopqrstuvwxyz",
+            (
+                8.2,
+                1.5,
+                2.8,
+                4.3,
+                12.7,
+                2.2,
+                2.0,
+                6.1,
+                7.0,
+                0.15,
+                0.77,
+                4.0,
+                2.4,
+                6.7,
+                7.5,
+                1.9,
+                0.095,
+                6.0,
+                6.3,
+                9.1,
+                2.8,
+                0.98,
+                2.4,
+                0.15,
+                2.0,
+                0.074,
+            ),
+        )
+    },
+}
+
+# Tags in the order of their index in the WOFF2 table directory
+# https://www.w3.org/TR/WOFF2/#table_dir_format
+_woff2_known_tags = (
+    b"cmap",
+    b"head",
+    b"hhea",
+    b"hmtx",
+    b"maxp",
+    b"name",
+    b"OS/2",
+    b"post",
+    b"cvt ",
+    b"fpgm",
+    b"glyf",
+    b"loca",
+    b"prep",
+    b"CFF ",
+    b"VORG",
+    b"EBDT",
+    b"EBLC",
+    b"gasp",
+    b"hdmx",
+    b"kern",
+    b"LTSH",
+    b"PCLT",
+    b"VDMX",
+    b"vhea",
+    b"vmtx",
+    b"BASE",
+    b"GDEF",
+    b"GPOS",
+    b"GSUB",
+    b"EBSC",
+    b"JSTF",
+    b"MATH",
+    b"CBDT",
+    b"CBLC",
+    b"COLR",
+    b"CPAL",
+    b"SVG ",
+    b"sbix",
+    b"acnt",
+    b"avar",
+    b"bdat",
+    b"bloc",
+    b"bsln",
+    b"cvar",
+    b"fdsc",
+    b"feat",
+    b"fmtx",
+    b"fvar",
+    b"gvar",
+    b"hsty",
+    b"just",
+    b"lcar",
+    b"mort",
+    b"morx",
+    b"opbd",
+    b"prop",
+    b"trak",
+    b"Zapf",
+    b"Silf",
+    b"Glat",
+    b"Gloc",
+    b"Feat",
+    b"Sill",
+)
+
+
+class FontAxis(NamedTuple):
+    """A variation axis of a variable font, e.g. `wght` from 100 to 900."""
+
+    tag: str
+    min: float
+    default: float
+    max: float
+
+
+class FontMetrics(NamedTuple):
+    """
+    The metrics that determine the size and line height of text in a font, in
+    font units.
+    """
+
+    units_per_em: int
+    ascent: int
+    descent: int
+    line_gap: int
+    x_width_avg: float
+    """The average width of lowercase letters and spaces in English text."""
+
+
+class FontMetadata(NamedTuple):
+    """The metadata of a font file read from its header tables."""
+
+    family: Optional[str]
+    subfamily: Optional[str]
+    weight: Optional[int]
+    italic: bool
+    axes: tuple[FontAxis, ...]
+    metrics: Optional[FontMetrics] = None
+
+    def axis(self, tag: str) -> FontAxis | None:
+        """The variation axis with `tag`, if the font has one."""
+        for axis in self.axes:
+            if axis.tag == tag:
+                return axis
+        return None
+
+
+font_metadata_cache = LRUCache(maxsize=256)
+"""Font metadata keyed by the file's path, modification time and size."""
+
+_missing = object()
+
+
+def read_font_metadata(path: Path | str) -> FontMetadata | None:
+    """
+    Read the metadata of a TrueType, OpenType, WOFF or WOFF2 font file.
+
+    The metadata is cached until the file changes, so validating the same
+    brand again doesn't read the file again.
+
+    Returns
+    -------
+    :
+        The font's metadata, or `None` if the file isn't a supported font, is
+        malformed, or is a WOFF2 file and `brotli` isn't installed.
+    """
+    key = file_stamp(path)
+    cached = font_metadata_cache.get(key, _missing)
+    if cached is not _missing:
+        return cached
+
+    try:
+        tables = _read_tables(path)
+        metadata = _font_metadata(tables) if tables is not None else None
+    except (OSError, ValueError, IndexError, struct.error, zlib.error):
+        # Truncated or malformed files, including tables that point past the
+        # end of the file
+        metadata = None
+
+    font_metadata_cache.set(key, metadata)
+    return metadata
+
+
+def _read_tables(path: Path | str) -> dict[bytes, bytes] | None:
+    with open(path, "rb") as f:
+        if Path(path).stat().st_size < 12:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            signature = data[:4]
+            if signature == b"wOFF":
+                return _read_woff_tables(data)
+            if signature == b"wOF2":
+                return _read_woff2_tables(data)
+            if signature in (b"\x00\x01\x00\x00", b"OTTO", b"true"):
+                return _read_sfnt_tables(data)
+    return None
+
+
+def _read_sfnt_tables(data: mmap.mmap) -> dict[bytes, bytes]:
+    (num_tables,) = struct.unpack_from(">H", data, 4)
+    tables = {}
+    for i in range(num_tables):
+        tag, _, offset, length = struct.unpack_from(">4sLLL", data, 12 + 16 * i)
+        if tag in _tables:
+            tables[tag] = data[offset : offset + length]
+    return tables
+
+
+def _read_woff_tables(data: mmap.mmap) -> dict[bytes, bytes]:
+    (num_tables,) = struct.unpack_from(">H", data, 12)
+    tables = {}
+    for i in range(num_tables):
+        tag, offset, comp_length, orig_length, _ = struct.unpack_from(
+            ">4sLLLL", data, 44 + 20 * i
+        )
+        if tag not in _tables:
+            continue
+        table = data[offset : offset + comp_length]
+        tables[tag] = (
+            zlib.decompress(table) if comp_length < orig_length else table
+        )
+    return tables
+
+
+def _read_woff2_tables(data: mmap.mmap) -> dict[bytes, bytes] | None:
+    try:
+        # brotli is an optional dependency, only needed for WOFF2 files
+        import brotli  # noqa: PLC0415 # pyright: ignore[reportMissingImports]
+    except ImportError:
+        return None
+
+    flavor, _, num_tables = struct.unpack_from(">4sLH", data, 4)
+    (compressed_size,) = struct.unpack_from(">L", data, 20)
+
+    directory: list[tuple[bytes, int]] = []
+    pos = 48
+    for _ in range(num_tables):
+        flags = data[pos]
+        pos += 1
+        if flags & 0x3F == 0x3F:
+            tag = data[pos : pos + 4]
+            pos += 4
+        else:
+            tag = _woff2_known_tags[flags & 0x3F]
+
+        length, pos = _uint_base128(data, pos)
+        # glyf and loca are transformed unless the version is 3, other tables
+        # are transformed unless the version is 0
+        version = flags >> 6
+        transformed = (
+            version != 3 if tag in (b"glyf", b"loca") else version != 0
+        )
+        if transformed:
+            length, pos = _uint_base128(data, pos)
+        directory.append((tag, length))
+
+    if flavor == b"ttcf":
+        # Font collections aren't supported
+        return None
+
+    # All tables are compressed together in a single stream
+    try:
+        stream = brotli.decompress(data[pos : pos + compressed_size])
+    except brotli.error as e:
+        raise ValueError("Invalid WOFF2 compressed data.") from e
+
+    tables = {}
+    offset = 0
+    for tag, length in directory:
+        if tag in _tables:
+            tables[tag] = stream[offset : offset + length]
+        offset += length
+    return tables
+
+
+def _uint_base128(data: mmap.mmap, pos: int) -> tuple[int, int]:
+    value = 0
+    for i in range(5):
+        byte = data[pos + i]
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos + i + 1
+    raise ValueError("Invalid UIntBase128 value in WOFF2 table directory.")
+
+
+def _font_metadata(tables: dict[bytes, bytes]) -> FontMetadata:
+    weight = None
+    italic = False
+    os2 = tables.get(b"OS/2")
+    if os2 is not None and len(os2) >= 64:
+        (weight,) = struct.unpack_from(">H", os2, 4)
+        (fs_selection,) = struct.unpack_from(">H", os2, 62)
+        # Bit 0 is ITALIC, bit 9 is OBLIQUE
+        italic = bool(fs_selection & 0x0201)
+
+    names = _read_names(tables[b"name"]) if b"name" in tables else {}
+    # Typographic family and subfamily names (16, 17) take precedence
+    family = names.get(16) or names.get(1)
+    subfamily = names.get(17) or names.get(2)
+    if subfamily is not None and "italic" in subfamily.lower():
+        italic = True
+
+    axes = _read_axes(tables[b"fvar"]) if b"fvar" in tables else ()
+
+    return FontMetadata(
+        family=family,
+        subfamily=subfamily,
+        weight=weight,
+        italic=italic,
+        axes=axes,
+        metrics=_read_metrics(tables),
+    )
+
+
+def _read_metrics(tables: dict[bytes, bytes]) -> FontMetrics | None:
+    head = tables.get(b"head")
+    hhea = tables.get(b"hhea")
+    os2 = tables.get(b"OS/2")
+    if head is None or hhea is None or os2 is None or len(os2) < 78:
+        return None
+
+    x_width_avg = _x_width_avg(tables, hhea)
+    if x_width_avg is None:
+        return None
+
+    (units_per_em,) = struct.unpack_from(">H", head, 18)
+    (fs_selection,) = struct.unpack_from(">H", os2, 62)
+
+    # Bit 7 is USE_TYPO_METRICS, otherwise browsers use the hhea metrics
+    table, offset = (os2, 68) if fs_selection & 0x80 else (hhea, 4)
+    ascent, descent, line_gap = struct.unpack_from(">hhh", table, offset)
+
+    return FontMetrics(
+        units_per_em=units_per_em,
+        ascent=ascent,
+        descent=descent,
+        line_gap=line_gap,
+        x_width_avg=x_width_avg,
+    )
+
+
+def _x_width_avg(tables: dict[bytes, bytes], hhea: bytes) -> float | None:
+    cmap, hmtx = tables.get(b"cmap"), tables.get(b"hmtx")
+    if cmap is None or hmtx is None:
+        return None
+
+    glyphs = _cmap_glyphs(cmap, [ord(c) for c in _char_frequencies])
+    if glyphs is None:
+        return None
+
+    (num_metrics,) = struct.unpack_from(">H", hhea, 34)
+    if num_metrics == 0 or len(hmtx) < 4 * num_metrics:
+        # e.g. a transformed `hmtx` table in a WOFF2 file
+        return None
+
+    total = 0.0
+    for char, frequency in _char_frequencies.items():
+        # Glyphs after the last metric share its advance width
+        glyph = min(glyphs.get(ord(char), 0), num_metrics - 1)
+        (advance,) = struct.unpack_from(">H", hmtx, 4 * glyph)
+        total += advance * frequency
+    return total / sum(_char_frequencies.values())
+
+
+def _cmap_glyphs(cmap: bytes, codepoints: list[int]) -> dict[int, int] | None:
+    """Look up the glyph IDs of `codepoints` in a Unicode `cmap` subtable."""
+    (num_subtables,) = struct.unpack_from(">H", cmap, 2)
+    subtables = {}
+    for i in range(num_subtables):
+        platform, _, offset = struct.unpack_from(">HHL", cmap, 4 + 8 * i)
+        (fmt,) = struct.unpack_from(">H", cmap, offset)
+        if platform in (0, 3) and fmt in (4, 12):
+            subtables[fmt] = offset
+
+    if 12 in subtables:
+        offset = subtables[12]
+        (num_groups,) = struct.unpack_from(">L", cmap, offset + 12)
+        groups = [
+            struct.unpack_from(">LLL", cmap, offset + 16 + 12 * i)
+            for i in range(num_groups)
+        ]
+        return {
+            cp: glyph + cp - start
+            for cp in codepoints
+            for start, end, glyph in groups
+            if start <= cp <= end
+        }
+
+    if 4 in subtables:
+        return _cmap_format4_glyphs(cmap, subtables[4], codepoints)
+
+    return None
+
+
+def _cmap_format4_glyphs(
+    cmap: bytes, offset: int, codepoints: list[int]
+) -> dict[int, int]:
+    (seg_count_x2,) = struct.unpack_from(">H", cmap, offset + 6)
+    ends = offset + 14
+    starts = ends + seg_count_x2 + 2
+    deltas = starts + seg_count_x2
+    range_offsets = deltas + seg_count_x2
+
+    glyphs = {}
+    for cp in codepoints:
+        for seg in range(0, seg_count_x2, 2):
+            (end,) = struct.unpack_from(">H", cmap, ends + seg)
+            if cp > end:
+                continue
+            (start,) = struct.unpack_from(">H", cmap, starts + seg)
+            if cp < start:
+                break
+            (delta,) = struct.unpack_from(">h", cmap, deltas + seg)
+            (range_offset,) = struct.unpack_from(
+                ">H", cmap, range_offsets + seg
+            )
+            if range_offset == 0:
+                glyphs[cp] = (cp + delta) & 0xFFFF
+            else:
+                pos = range_offsets + seg + range_offset + 2 * (cp - start)
+                (glyph,) = struct.unpack_from(">H", cmap, pos)
+                glyphs[cp] = (glyph + delta) & 0xFFFF if glyph else 0
+            break
+    return glyphs
+
+
+def _read_names(table: bytes) -> dict[int, str]:
+    _, count, string_offset = struct.unpack_from(">HHH", table, 0)
+    names: dict[int, str] = {}
+    for i in range(count):
+        platform, _, language, name_id, length, offset = struct.unpack_from(
+            ">HHHHHH", table, 6 + 12 * i
+        )
+        if name_id not in (1, 2, 16, 17):
+            continue
+
+        raw = table[string_offset + offset : string_offset + offset + length]
+        if platform == 3:
+            # Prefer English (United States) names on Windows
+            if name_id in names and language != 0x0409:
+                continue
+            names[name_id] = raw.decode("utf-16-be", errors="replace")
+        elif platform == 1 and name_id not in names:
+            names[name_id] = raw.decode("mac_roman", errors="replace")
+    return names
+
+
+def _read_axes(table: bytes) -> tuple[FontAxis, ...]:
+    axes_offset, _, axis_count, axis_size = struct.unpack_from(
+        ">HHHH", table, 4
+    )
+    axes = []
+    for i in range(axis_count):
+        tag, min_value, default, max_value = struct.unpack_from(
+            ">4slll", table, axes_offset + axis_size * i
+        )
+        axes.append(
+            FontAxis(
+                tag=tag.decode("ascii", errors="replace"),
+                # Fixed 16.16 numbers
+                min=min_value / 65536,
+                default=default / 65536,
+                max=max_value / 65536,
+            )
+        )
+    return tuple(axes)
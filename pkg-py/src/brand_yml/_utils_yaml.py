@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-import json
+import os
+from threading import local
+from typing import Literal
 
 from pydantic import BaseModel, RootModel
 from ruamel.yaml import YAML
@@ -16,14 +18,14 @@ class BrandYaml(YAML):
 
     def dump(self, data, stream=None, **kw):
         if isinstance(data, (BaseModel, RootModel)):
-            # Dump to JSON first to have Pydantic handle casting to JSON formats,
-            # otherwise `ruamel.yaml` will raise errors for classes it doesn't know
-            # how to serialize.
-            data_json = data.model_dump_json(
+            # Dump in JSON mode to have Pydantic handle casting to JSON-compatible
+            # types, otherwise `ruamel.yaml` will raise errors for classes it
+            # doesn't know how to serialize.
+            data = data.model_dump(
+                mode="json",
                 exclude_defaults=True,
                 exclude_none=True,
             )
-            data = json.loads(data_json)
 
         to_string = stream is None
 
@@ -38,3 +40,61 @@ class BrandYaml(YAML):
 
 yaml_brand = BrandYaml()
 yaml_brand.indent(mapping=2, sequence=4, offset=2)
+
+
+BrandYamlLoaderType = Literal["rt", "safe"]
+"""
+The YAML loader used to read Brand YAML files.
+
+* `"rt"`: The round-trip loader, which preserves comments and formatting.
+* `"safe"`: The safe loader, which uses the faster C-based parser from
+  `ruamel.yaml.clib` when available and returns plain Python dictionaries and
+  lists. The information kept by the round-trip loader isn't used by
+  `brand_yml.Brand`, so the safe loader is preferable when reading many files.
+"""
+
+yaml_loader_env_var = "BRAND_YAML_LOADER"
+
+_yaml_loaders = local()
+
+
+def yaml_loader(loader: BrandYamlLoaderType | None = None) -> YAML:
+    """
+    Get the YAML instance used to load Brand YAML files.
+
+    Parameters
+    ----------
+    loader
+        The loader type, either `"rt"` (round-trip) or `"safe"`. When `None`,
+        the loader is chosen by the `BRAND_YAML_LOADER` environment variable,
+        falling back to the round-trip loader.
+    """
+    loader = yaml_loader_type(loader)
+
+    # Loaders are created per thread because `ruamel.yaml.YAML` instances keep
+    # the state of the current load and aren't thread-safe.
+    loaders: dict[str, YAML] | None = getattr(_yaml_loaders, "loaders", None)
+    if loaders is None:
+        loaders = _yaml_loaders.loaders = {}
+
+    if loader not in loaders:
+        loaders[loader] = BrandYaml() if loader == "rt" else YAML(typ="safe")
+
+    return loaders[loader]
+
+
+def yaml_loader_type(
+    loader: BrandYamlLoaderType | str | None = None,
+) -> BrandYamlLoaderType:
+    """Validate `loader`, or read it from `BRAND_YAML_LOADER` if `None`."""
+    if loader is None:
+        loader = os.environ.get(yaml_loader_env_var) or "rt"
+
+    if loader == "rt":
+        return "rt"
+    if loader == "safe":
+        return "safe"
+
+    raise ValueError(
+        f"Invalid Brand YAML loader {loader!r}. Expected 'rt' or 'safe'."
+    )
@@ -0,0 +1,188 @@
+"""
+Accessibility Audits for Brand YAML
+
+This module defines the report returned by
+[`Brand.audit_contrast()`](`brand_yml.Brand.audit_contrast`), which checks the
+contrast of the brand's text colors against their backgrounds.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from .color import BrandColorEngine
+
+if TYPE_CHECKING:
+    from ._brand import Brand
+
+# WCAG 2 minimum contrast ratios
+contrast_min_aa = 4.5
+contrast_min_aa_large = 3.0
+contrast_min_aaa = 7.0
+
+_typography_elements = (
+    "base",
+    "headings",
+    "link",
+    "monospace_inline",
+    "monospace_block",
+)
+
+_theme_colors = (
+    "primary",
+    "secondary",
+    "tertiary",
+    "success",
+    "info",
+    "warning",
+    "danger",
+)
+
+
+class BrandContrastCheck(BaseModel):
+    """
+    The contrast of one text color against its background.
+
+    Attributes
+    ----------
+    element
+        Where the colors are used, e.g. `typography.headings` or
+        `color.primary`.
+    foreground
+        The resolved text color.
+    background
+        The resolved background color.
+    ratio
+        The WCAG contrast ratio of the colors, from 1 to 21, or `None` if
+        either color couldn't be parsed, e.g. because it's a CSS variable.
+    aa
+        Whether the ratio meets WCAG level AA for normal text (4.5:1).
+    aa_large
+        Whether the ratio meets WCAG level AA for large text (3:1).
+    aaa
+        Whether the ratio meets WCAG level AAA for normal text (7:1).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    element: str
+    foreground: str
+    background: str
+    ratio: Optional[float] = None
+    aa: Optional[bool] = None
+    aa_large: Optional[bool] = None
+    aaa: Optional[bool] = None
+
+
+class BrandContrastAudit(BaseModel):
+    """
+    A report of the contrast of every text color in a brand.
+
+    Attributes
+    ----------
+    checks
+        One check per pair of text and background colors, in the order of
+        `typography.base`, `typography.headings`, `typography.link`,
+        `typography.monospace_inline`, `typography.monospace_block`, followed
+        by the theme colors in `color` against `color.background`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    checks: list[BrandContrastCheck]
+
+    @property
+    def failures(self) -> list[BrandContrastCheck]:
+        """The checks that don't meet WCAG level AA for normal text."""
+        return [check for check in self.checks if check.aa is False]
+
+    @property
+    def unchecked(self) -> list[BrandContrastCheck]:
+        """The checks whose colors couldn't be parsed."""
+        return [check for check in self.checks if check.ratio is None]
+
+    @property
+    def passed(self) -> bool:
+        """
+        Whether every check meets WCAG level AA. Checks whose colors couldn't
+        be parsed aren't known to pass, so any `unchecked` pair fails the
+        audit.
+        """
+        return not self.failures and not self.unchecked
+
+
+def audit_contrast(brand: Brand) -> BrandContrastAudit:
+    """
+    Check the contrast of every text color in `brand` against its background.
+
+    See [`Brand.audit_contrast()`](`brand_yml.Brand.audit_contrast`).
+    """
+    pairs = _contrast_pairs(brand)
+
+    # Parse every distinct color once and compute the ratios in one pass
+    colors = {c: c for pair in pairs for c in pair[1:]}
+    engine = BrandColorEngine(colors)
+
+    checks = []
+    for element, foreground, background in pairs:
+        if foreground not in engine or background not in engine:
+            checks.append(
+                BrandContrastCheck(
+                    element=element,
+                    foreground=foreground,
+                    background=background,
+                )
+            )
+            continue
+
+        ratio = engine.contrast(foreground, background)
+        checks.append(
+            BrandContrastCheck(
+                element=element,
+                foreground=foreground,
+                background=background,
+                ratio=ratio,
+                aa=ratio >= contrast_min_aa,
+                aa_large=ratio >= contrast_min_aa_large,
+                aaa=ratio >= contrast_min_aaa,
+            )
+        )
+
+    return BrandContrastAudit(checks=checks)
+
+
+def _contrast_pairs(brand: Brand) -> list[tuple[str, str, str]]:
+    """
+    List the `(element, foreground, background)` color pairs in `brand`.
+
+    Typography elements without their own colors use `color.foreground` on
+    `color.background`, which is checked once for `typography.base`.
+    """
+    colors = brand.color.resolved_colors if brand.color else {}
+    page_fg = colors.get("foreground")
+    page_bg = colors.get("background")
+
+    pairs: list[tuple[str, str, str]] = []
+
+    for name in _typography_elements:
+        node = getattr(brand.typography, name, None)
+        fg = getattr(node, "color", None)
+        bg = getattr(node, "background_color", None)
+
+        if name != "base" and fg is None and bg is None:
+            continue
+
+        fg = fg or page_fg
+        bg = bg or page_bg
+        if fg is not None and bg is not None:
+            pairs.append((f"typography.{name}", fg, bg))
+
+    if page_bg is not None:
+        for name in _theme_colors:
+            fg = colors.get(name)
+            if fg is not None:
+                pairs.append((f"color.{name}", fg, page_bg))
+
+    return pairs
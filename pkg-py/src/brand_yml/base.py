@@ -4,6 +4,8 @@ Base Pydantic model for Brand-related classes.
 
 from __future__ import annotations
 
+from typing import Any
+
 from pydantic import BaseModel
 
 
@@ -24,3 +26,51 @@ class BrandBase(BaseModel):
         fields = [f for f in self.model_fields.keys()]
         values = [getattr(self, f) for f in fields]
         return ((f, v) for f, v in zip(fields, values) if v is not None)
+
+    def update(self, **changes: Any) -> None:
+        """
+        Update several fields at once.
+
+        Assigning to a field validates the whole model, including any model
+        validators. `update()` applies all of the `changes` and then validates
+        the model once, rather than once per field. The instance is updated in
+        place, and is left unchanged if validation fails.
+
+        Parameters
+        ----------
+        **changes
+            New values for the model's fields, by field name or alias.
+
+        Raises
+        ------
+        ValueError
+            If a field doesn't exist or if the updated model is invalid.
+        """
+        fields = type(self).model_fields
+        aliases = {f.alias: name for name, f in fields.items() if f.alias}
+
+        updates: dict[str, Any] = {}
+        for key, value in changes.items():
+            name = aliases.get(key, key)
+            if name not in fields:
+                raise ValueError(
+                    f'"{type(self).__name__}" object has no field "{key}"'
+                )
+            updates[name] = value
+
+        data = {
+            (field.alias or name): updates.get(name, getattr(self, name))
+            for name, field in fields.items()
+        }
+        new = type(self).model_validate(data)
+
+        vars(self).update(vars(new))
+        object.__setattr__(
+            self,
+            "__pydantic_fields_set__",
+            self.model_fields_set | updates.keys(),
+        )
+        object.__setattr__(self, "__pydantic_extra__", new.__pydantic_extra__)
+        object.__setattr__(
+            self, "__pydantic_private__", new.__pydantic_private__
+        )
@@ -7,16 +7,27 @@ palette and mappings to common theme colors.
 
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import Optional
+from array import array
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional
 
 from pydantic import (
     ConfigDict,
+    PrivateAttr,
     field_validator,
     model_validator,
 )
 
-from ._defs import check_circular_references, defs_replace_recursively
+from ._defs import DefsResolver, defs_replace_recursively
+from ._utils_color import (
+    RGBA,
+    contrast_ratio,
+    mix,
+    parse_color,
+    relative_luminance,
+    to_hex,
+    to_oklab,
+)
 from ._utils_docs import add_example_yaml
 from .base import BrandBase
 
@@ -202,6 +213,9 @@ class BrandColor(BrandBase):
     light: Optional[str] = None
     dark: Optional[str] = None
 
+    _resolved_colors: Optional[dict[str, str]] = PrivateAttr(default=None)
+    _engine: Optional[BrandColorEngine] = PrivateAttr(default=None)
+
     @field_validator("palette")
     @classmethod
     def _create_brand_palette(cls, value: dict[str, str] | None):
@@ -212,14 +226,48 @@ class BrandColor(BrandBase):
         if not isinstance(value, dict):
             raise ValueError("`palette` must be a dictionary")
 
-        check_circular_references(value)
+        resolver = DefsResolver(value, name="palette")
+        resolver.check()
         # We resolve `color.palette` on load or on replacement only
         # TODO: Replace with class with getter/setters
         #       Retain original values, return resolved values, and re-validate on update.
-        defs_replace_recursively(value, value, name="palette")
+        resolver.replace(value)
 
         return value
 
+    @property
+    def resolved_colors(self) -> Mapping[str, str]:
+        """
+        A read-only mapping of every color name to its resolved value.
+
+        Includes the colors in `color.palette` and the theme colors, e.g.
+        `primary`, with theme colors taking precedence over palette colors of
+        the same name. References to other colors are fully resolved.
+
+        The mapping is computed once and reused until a field of `color` is
+        assigned a new value. Changes made in place, e.g. to
+        `color.palette["blue"]`, are not detected; assign a new `palette` to
+        update the resolved colors.
+        """
+        if self._resolved_colors is None:
+            defs = self._color_defs(resolved=False)
+            defs_replace_recursively(defs, defs, name="color")
+            self._resolved_colors = defs
+        return MappingProxyType(self._resolved_colors)
+
+    @property
+    def engine(self) -> BrandColorEngine:
+        """
+        Batched color operations over the brand's resolved colors.
+
+        Every color in `resolved_colors` is parsed once into a
+        [](`~brand_yml.color.BrandColorEngine`), which is reused until a field
+        of `color` is assigned a new value.
+        """
+        if self._engine is None:
+            self._engine = BrandColorEngine(self.resolved_colors)
+        return self._engine
+
     def _color_defs(self, resolved: bool = False) -> dict[str, str]:
         """
         Returns a flat dictionary of color definitions with `color.*` overlaid
@@ -229,29 +277,26 @@ class BrandColor(BrandBase):
         ----------
         resolved
             Whether or not the all resolvable values in the color definitions
-            should be resolved. Currently, once the model is initialized,
-            top-level values, e.g. `color.primary`, are already resolved but
-            `color.palette` values retain internal references.
+            should be resolved. Resolved definitions are copied from
+            `resolved_colors`.
 
         Returns
         -------
         :
             A flat dictionary of color definitions.
         """
-        defs = deepcopy(self.palette) if self.palette is not None else {}
+        if resolved:
+            return dict(self.resolved_colors)
+
+        defs = dict(self.palette) if self.palette is not None else {}
         defs.update(
             {
                 k: v
-                for k, v in self.model_dump().items()
-                if k != "palette" and v is not None
+                for k in type(self).model_fields
+                if k != "palette" and (v := getattr(self, k)) is not None
             }
         )
-
-        if resolved:
-            defs_replace_recursively(defs, defs)
-            return defs
-        else:
-            return defs
+        return defs
 
     @model_validator(mode="after")
     def resolve_palette_values(self):
@@ -261,4 +306,233 @@ class BrandColor(BrandBase):
             name="color",
             exclude="palette",
         )
+        # Runs on initialization and on assignment (`validate_assignment`)
+        self._resolved_colors = None
+        self._engine = None
         return self
+
+
+class BrandColorEngine:
+    """
+    Batched color operations over a set of named colors
+
+    Colors are parsed once into a compact buffer of RGBA channels, stored as
+    32-bit floats between 0 and 1, along with their relative luminance.
+    CSS named colors, e.g. `rebeccapurple`, and colors in hex, `rgb()`,
+    `rgba()`, `hsl()` or `hsla()` notation are supported; other values, e.g.
+    CSS variables, are skipped.
+
+    Operations that take a color accept either the name of a color in the
+    engine or a CSS color string.
+
+    Use [](`~brand_yml.BrandColor.engine`) to get the cached engine for a
+    brand's colors rather than creating one directly.
+
+    Parameters
+    ----------
+    colors
+        A mapping of color names to color values.
+
+    Examples
+    --------
+
+    ```{python}
+    from brand_yml import BrandColor
+
+    color = BrandColor(
+        palette={"blue": "#447099", "orange": "#EE6331"},
+        foreground="#151515",
+        background="#FFFFFF",
+    )
+    color.engine.contrast("foreground", "background")
+    ```
+
+    ```{python}
+    color.engine.nearest("#4070A0")
+    ```
+
+    ```{python}
+    color.engine.lighten(0.2)
+    ```
+
+    Attributes
+    ----------
+    names
+        The names of the parsed colors, in the order of the rows and columns of
+        [](`~brand_yml.color.BrandColorEngine.contrast_matrix`).
+    """
+
+    def __init__(self, colors: Mapping[str, str]):
+        names: list[str] = []
+        rgba = array("f")
+        for name, value in colors.items():
+            parsed = parse_color(value) if isinstance(value, str) else None
+            if parsed is None:
+                continue
+            names.append(name)
+            rgba.extend(parsed)
+
+        self.names: tuple[str, ...] = tuple(names)
+        self._index = {name: i for i, name in enumerate(names)}
+        self._rgba = rgba
+        self._luminance = array("f", map(relative_luminance, self._iter_rgba()))
+        self._oklab: Optional[array] = None
+        self._contrast_matrix: Optional[array[float]] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __repr__(self) -> str:
+        return f"BrandColorEngine(names={self.names!r})"
+
+    def _iter_rgba(self) -> Iterator[RGBA]:
+        rgba = self._rgba
+        for i in range(0, len(rgba), 4):
+            yield (rgba[i], rgba[i + 1], rgba[i + 2], rgba[i + 3])
+
+    def _lookup(self, color: str) -> RGBA:
+        i = self._index.get(color)
+        if i is not None:
+            return tuple(self._rgba[i * 4 : i * 4 + 4])  # type: ignore[return-value]
+
+        parsed = parse_color(color)
+        if parsed is None:
+            raise ValueError(
+                f"{color!r} is not a known color name or a supported color value."
+            )
+        return parsed
+
+    def rgba(self, color: str) -> RGBA:
+        """
+        The red, green, blue and alpha channels of a color, between 0 and 1.
+        """
+        return self._lookup(color)
+
+    def luminance(self, color: str) -> float:
+        """
+        The WCAG relative luminance of a color, from 0 (black) to 1 (white).
+        """
+        i = self._index.get(color)
+        if i is not None:
+            return self._luminance[i]
+        return relative_luminance(self._lookup(color))
+
+    def contrast(self, color_a: str, color_b: str) -> float:
+        """
+        The WCAG contrast ratio of two colors, from 1 to 21.
+
+        Transparency is ignored, i.e. colors are treated as opaque.
+        """
+        return contrast_ratio(self.luminance(color_a), self.luminance(color_b))
+
+    def contrast_matrix(self) -> array[float]:
+        """
+        The WCAG contrast ratio of every pair of colors.
+
+        Returns
+        -------
+        :
+            A square matrix of 32-bit floats, flattened in row-major order,
+            whose rows and columns follow the order of `names`: the ratio of
+            colors `i` and `j` is at index `i * len(names) + j`. The matrix is
+            computed once and reused.
+        """
+        if self._contrast_matrix is None:
+            offset = [lum + 0.05 for lum in self._luminance]
+            matrix = array("f")
+            for a in offset:
+                matrix.extend(a / b if a > b else b / a for b in offset)
+            self._contrast_matrix = matrix
+        return self._contrast_matrix
+
+    def nearest(self, color: str) -> str:
+        """
+        The name of the color that looks most similar to `color`.
+
+        Similarity is measured by distance in the OKLab color space, which
+        approximates perceived differences better than distance in RGB.
+
+        Raises
+        ------
+        ValueError
+            If the engine has no colors or `color` isn't a supported color.
+        """
+        if not self.names:
+            raise ValueError("There are no colors to compare with.")
+
+        if self._oklab is None:
+            self._oklab = array("f")
+            for rgba in self._iter_rgba():
+                self._oklab.extend(to_oklab(rgba))
+
+        target_l, target_a, target_b = to_oklab(self._lookup(color))
+        oklab = self._oklab
+        distances = [
+            (oklab[i] - target_l) ** 2
+            + (oklab[i + 1] - target_a) ** 2
+            + (oklab[i + 2] - target_b) ** 2
+            for i in range(0, len(oklab), 3)
+        ]
+        return self.names[distances.index(min(distances))]
+
+    def mix(self, color: str, weight: float = 0.5) -> dict[str, str]:
+        """
+        Mix a color into every color.
+
+        Parameters
+        ----------
+        color
+            The color to mix in.
+        weight
+            The proportion of `color` in the result, from 0 (unchanged) to 1
+            (entirely `color`).
+
+        Returns
+        -------
+        :
+            A dictionary of color names to the mixed colors in hex notation.
+        """
+        if not 0 <= weight <= 1:
+            raise ValueError("`weight` must be between 0 and 1.")
+
+        other = self._lookup(color)
+        return {
+            name: to_hex(mix(rgba, other, weight))
+            for name, rgba in zip(self.names, self._iter_rgba())
+        }
+
+    def lighten(self, amount: float) -> dict[str, str]:
+        """
+        Lighten every color by mixing in `amount` of white, from 0 to 1.
+
+        Returns
+        -------
+        :
+            A dictionary of color names to the lightened colors in hex notation.
+        """
+        if not 0 <= amount <= 1:
+            raise ValueError("`amount` must be between 0 and 1.")
+        return self._mix_opaque((1.0, 1.0, 1.0), amount)
+
+    def darken(self, amount: float) -> dict[str, str]:
+        """
+        Darken every color by mixing in `amount` of black, from 0 to 1.
+
+        Returns
+        -------
+        :
+            A dictionary of color names to the darkened colors in hex notation.
+        """
+        if not 0 <= amount <= 1:
+            raise ValueError("`amount` must be between 0 and 1.")
+        return self._mix_opaque((0.0, 0.0, 0.0), amount)
+
+    def _mix_opaque(self, rgb: tuple[float, float, float], weight: float):
+        # Keeps each color's own alpha, unlike `mix()`
+        return {
+            name: to_hex(mix(rgba, (*rgb, rgba[3]), weight))
+            for name, rgba in zip(self.names, self._iter_rgba())
+        }
@@ -6,6 +6,8 @@ from typing import Any, Union
 
 from pydantic import HttpUrl, RootModel, field_validator
 
+from ._utils_data_uri import file_data_uri
+
 
 class FileLocation(RootModel):
     """
@@ -130,6 +132,38 @@ class FileLocationLocal(FileLocation):
         relative_to = Path(self._root_dir).absolute()
         return self.root.relative_to(relative_to)
 
+    def to_data_uri(
+        self,
+        mime_type: str | None = None,
+        max_bytes: int | None = None,
+    ) -> str | None:
+        """
+        Embed the file as a base64-encoded `data:` URI.
+
+        The encoded file is cached until the file changes on disk, so repeated
+        calls don't read and encode the file again.
+
+        Parameters
+        ----------
+        mime_type
+            The MIME type of the file. By default, the type is guessed from the
+            file extension.
+        max_bytes
+            Files larger than `max_bytes` are not encoded.
+
+        Returns
+        -------
+        :
+            A `data:` URI with the file's contents, or `None` if the file is
+            larger than `max_bytes`.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the file doesn't exist at its absolute path.
+        """
+        return file_data_uri(self.absolute(), mime_type, max_bytes)
+
     def exists(self) -> bool:
         """Check that the file exists at its absolute path."""
         return self.absolute().exists()
@@ -22,7 +22,7 @@ from pydantic import (
 from ._defs import BrandLightDark, defs_replace_recursively
 from ._utils_docs import add_example_yaml
 from .base import BrandBase
-from .file import FileLocation, FileLocationLocalOrUrlType
+from .file import FileLocation, FileLocationLocal, FileLocationLocalOrUrlType
 
 
 class BrandLogoResource(BrandBase):
@@ -41,6 +41,34 @@ class BrandLogoResource(BrandBase):
     alt: str | None = None
     """Alterative text for the image, used for accessibility."""
 
+    def to_src(self, inline_max_bytes: int | None = None) -> str:
+        """
+        The location of the logo, e.g. for the `src` of an HTML `<img>` tag.
+
+        Parameters
+        ----------
+        inline_max_bytes
+            Embed local logo files up to this size, in bytes, as base64-encoded
+            `data:` URIs, e.g. for self-contained HTML files. Larger or missing
+            files and online files are returned as their path or URL.
+
+        Returns
+        -------
+        :
+            The URL or relative path of the logo, or a `data:` URI with the
+            contents of the logo file.
+        """
+        if (
+            inline_max_bytes is not None
+            and isinstance(self.path, FileLocationLocal)
+            and self.path.exists()
+        ):
+            uri = self.path.to_data_uri(max_bytes=inline_max_bytes)
+            if uri is not None:
+                return uri
+
+        return str(self.path.root)
+
 
 def brand_logo_type_discriminator(
     x: Any,
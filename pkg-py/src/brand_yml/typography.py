@@ -15,6 +15,8 @@ from __future__ import annotations
 import itertools
 import os
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from html import escape as html_escape
 from pathlib import Path
 from re import split as re_split
 from textwrap import indent
@@ -22,12 +24,13 @@ from typing import (
     TYPE_CHECKING,
     Annotated,
     Any,
+    Iterator,
     Literal,
     TypeVar,
     Union,
     overload,
 )
-from urllib.parse import urlencode, urljoin
+from urllib.parse import urlencode, urljoin, urlsplit
 
 from pydantic import (
     BaseModel,
@@ -37,6 +40,7 @@ from pydantic import (
     HttpUrl,
     PlainSerializer,
     PositiveInt,
+    PrivateAttr,
     RootModel,
     Tag,
     field_validator,
@@ -44,9 +48,28 @@ from pydantic import (
     model_validator,
 )
 
+from ._utils_batch import map_chunks_unordered
+from ._utils_cache import FileStamp, file_stamp
 from ._utils_docs import BaseDocAttributeModel, add_example_yaml
+from ._utils_font_fallbacks import (
+    FontCategory,
+    fallback_family_name,
+    fallback_font_face,
+    google_font_metrics,
+)
+from ._utils_fonts import (
+    FontFace,
+    FontFetcher,
+    fetch_url,
+    font_file_name,
+    font_file_origins,
+    font_src_format_preference,
+    parse_font_faces,
+    unicode_range_covers,
+)
+from ._utils_sfnt import FontMetrics, read_font_metadata
 from .base import BrandBase
-from .file import FileLocationLocalOrUrlType
+from .file import FileLocationLocal, FileLocationLocalOrUrlType
 
 # Types ------------------------------------------------------------------------
 
@@ -58,6 +81,9 @@ SingleOrTuple = Union[T, tuple[T, ...]]
 
 
 BrandTypographyFontStyleType = Literal["normal", "italic"]
+BrandTypographyFontDisplayType = Literal[
+    "auto", "block", "swap", "fallback", "optional"
+]
 BrandTypographyFontWeightNamedType = Literal[
     "thin",
     "extra-light",
@@ -126,6 +152,19 @@ font_weight_map: dict[str, BrandTypographyFontWeightRoundIntType] = {
     "black": 900,
 }
 
+# https://developer.mozilla.org/en-US/docs/Web/CSS/font-stretch#keyword_to_numeric_mapping
+font_stretch_map: dict[str, float] = {
+    "ultra-condensed": 50,
+    "extra-condensed": 62.5,
+    "condensed": 75,
+    "semi-condensed": 87.5,
+    "normal": 100,
+    "semi-expanded": 112.5,
+    "expanded": 125,
+    "extra-expanded": 150,
+    "ultra-expanded": 200,
+}
+
 # https://developer.mozilla.org/en-US/docs/Web/CSS/@font-face/src#font_formats
 font_formats = {
     ".otc": "collection",
@@ -236,6 +275,18 @@ class BrandTypographyFontFileWeight(RootModel):
             return f"{self.root[0]}..{self.root[1]}"
         return str(self.root)
 
+    def _covers(self, weight: int) -> bool:
+        """Whether text with font `weight` can use this font file."""
+        if self.root == "auto":
+            return True
+
+        def as_int(value: int | str) -> int:
+            return font_weight_map[value] if isinstance(value, str) else value
+
+        if isinstance(self.root, tuple):
+            return as_int(self.root[0]) <= weight <= as_int(self.root[1])
+        return as_int(self.root) == weight
+
     if TYPE_CHECKING:  # pragma: no cover
         # https://docs.pydantic.dev/latest/concepts/serialization/#overriding-the-return-type-when-dumping-a-model
         # Ensure type checkers see the correct return type
@@ -362,33 +413,129 @@ class BrandTypographyFontFiles(BrandTypographyFontSource):
               weight: bold
             - path: https://example.com/Closed-Sans-Italic.woff2
               style: italic
+
+        # A variable font file with weight and width axes
+        - family: Roboto Flex
+          files:
+            - path: fonts/roboto-flex/RobotoFlex[wdth,wght].woff2
+              weight: 100..900
+              stretch: 25%..151%
+              variation-settings:
+                GRAD: 0
     ```
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
     source: Literal["file"] = Field("file", frozen=True)  # type: ignore[reportIncompatibleVariableOverride]
     files: list[BrandTypographyFontFilesPath] = Field(default_factory=list)
 
-    def to_css(self) -> str:
+    display: BrandTypographyFontDisplayType | None = None
+    """
+    The `font-display` of every file in the family, i.e. how text is shown
+    while the font is loading. Files may override this value.
+    """
+
+    unicode_range: str | None = Field(default=None, alias="unicode-range")
+    """
+    The `unicode-range` of every file in the family. Files may override this
+    value.
+    """
+
+    def to_css(self, inline_max_bytes: int | None = None) -> str:
+        """
+        Create one `@font-face` rule per font face.
+
+        Files with the same weight, style, stretch, display and unicode range
+        but different formats are alternative formats of the same font face.
+        They are combined into one rule whose `src` lists the files from the
+        most to the least compact format (`woff2`, `woff`, `truetype`,
+        `opentype`), so browsers only download the first format they support.
+        Files with `weight: auto` could be any weight, so they are only
+        combined with files of the same name (without the extension). Two
+        different files in the same format are always separate font faces.
+
+        Static files whose weight and stretch are covered by a variable font
+        file of the same style and unicode range are left out, so that the
+        browser downloads a single variable file instead.
+
+        Local files up to `inline_max_bytes` in size are embedded in the CSS as
+        `data:` URIs.
+        """
         if len(self.files) == 0:
             return ""
 
+        faces: dict[tuple[str, ...], list[BrandTypographyFontFilesPath]] = {}
+        for file in self._css_files():
+            key = (
+                # `auto` weights don't identify a face, the file name does
+                Path(str(file.path.root)).stem
+                if file.weight.root == "auto"
+                else "",
+                file._weight_key(),
+                file._stretch_key(),
+                file.style,
+                str(file.display or self.display),
+                str(file.unicode_range or self.unicode_range),
+            )
+            # A second file in a format the face already has is another face
+            n = 0
+            while any(
+                f.format == file.format and f.path.root != file.path.root
+                for f in faces.get((*key, str(n)), [])
+            ):
+                n += 1
+            faces.setdefault((*key, str(n)), []).append(file)
+
         return "\n".join(
             "\n".join(
                 [
                     "@font-face {",
                     f"  font-family: '{self.family}';",
-                    indent(font.to_css(), 2 * " "),
+                    indent(
+                        font_face_declarations(
+                            files,
+                            display=self.display,
+                            unicode_range=self.unicode_range,
+                            inline_max_bytes=inline_max_bytes,
+                        ),
+                        2 * " ",
+                    ),
                     "}",
                 ]
             )
-            for font in self.files
+            for files in faces.values()
         )
 
+    def _local_metrics(self) -> FontMetrics | None:
+        """Metrics from the local file closest to the regular face."""
+        files = sorted(
+            self.files,
+            key=lambda f: (f.style != "normal", not f.weight._covers(400)),
+        )
+        for file in files:
+            if isinstance(file.path, FileLocationLocal) and file.path.exists():
+                metadata = read_font_metadata(file.path.absolute())
+                if metadata is not None and metadata.metrics is not None:
+                    return metadata.metrics
+        return None
+
+    def _css_files(self) -> list[BrandTypographyFontFilesPath]:
+        """The files without the static files replaced by variable files."""
+        variable = [f for f in self.files if f._is_variable()]
+        if not variable:
+            return self.files
+
+        return [
+            file
+            for file in self.files
+            if file._is_variable()
+            or not any(v._replaces(file, self.unicode_range) for v in variable)
+        ]
+
 
 class BrandTypographyFontFilesPath(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
     path: FileLocationLocalOrUrlType
     weight: BrandTypographyFontFileWeight = Field(
@@ -396,18 +543,197 @@ class BrandTypographyFontFilesPath(BaseModel):
         validate_default=True,
     )
     style: BrandTypographyFontStyleType = "normal"
+    display: BrandTypographyFontDisplayType | None = None
+    """
+    The `font-display` of the font file, i.e. how text is shown while the font
+    is loading, e.g. `swap` shows text in a fallback font until the font is
+    ready.
+    """
+
+    stretch: str | None = None
+    """
+    The `font-stretch` of the font file, as a keyword such as `condensed` or a
+    percentage. Variable fonts with a width axis may give a range, e.g.
+    `75%..125%` or `[75%, 125%]`.
+    """
+
+    variation_settings: str | dict[str, float] | None = Field(
+        default=None, alias="variation-settings"
+    )
+    """
+    The `font-variation-settings` of a variable font file, i.e. the values of
+    its axes that aren't set by other properties. Either a mapping of axis tags
+    to values, e.g. `{GRAD: 0, opsz: 14}`, or a CSS value, e.g. `"'GRAD' 0"`.
+    """
+
+    unicode_range: str | None = Field(default=None, alias="unicode-range")
+    """
+    The range of Unicode characters covered by the font file, e.g.
+    `U+0000-00FF, U+0131`. Browsers only download the file when the page uses
+    characters in this range.
+    """
+
+    def to_css(
+        self,
+        display: BrandTypographyFontDisplayType | None = None,
+        unicode_range: str | None = None,
+        inline_max_bytes: int | None = None,
+    ) -> str:
+        """
+        The declarations of the `@font-face` rule for this file. `display` and
+        `unicode_range` are used when the file doesn't set its own value.
+        """
+        return font_face_declarations(
+            [self],
+            display=display,
+            unicode_range=unicode_range,
+            inline_max_bytes=inline_max_bytes,
+        )
+
+    def to_css_src(self, inline_max_bytes: int | None = None) -> str:
+        """
+        The file's entry in the `src` of a `@font-face` rule.
+
+        When `inline_max_bytes` is set, local files up to this size are
+        embedded as a `data:` URI rather than linked by path.
+        """
+        url = str(self.path.root)
+        if inline_max_bytes is not None and isinstance(
+            self.path, FileLocationLocal
+        ):
+            if self.path.exists():
+                url = (
+                    self.path.to_data_uri(
+                        mime_type=font_mime_types.get(self.format),
+                        max_bytes=inline_max_bytes,
+                    )
+                    or url
+                )
 
-    def to_css(self) -> str:
         # TODO: Handle `file://` vs `https://` or move to correct location
-        src = f"url('{self.path.root}') format('{self.format}')"
-        return "\n".join(
-            [
-                f"font-weight: {self.weight};",
-                f"font-style: {self.style};",
-                f"src: {src};",
-            ]
+        return f"url('{url}') format('{self.format}')"
+
+    def _weight_key(self) -> str:
+        weight = str(self.weight)
+        return str(font_weight_map.get(weight, weight))
+
+    def _stretch_key(self) -> str:
+        """The stretch as percentages, e.g. `87.5%` for `semi-condensed`."""
+        if self.stretch is None:
+            return "None"
+        return " ".join(
+            f"{p:g}%" if (p := _font_stretch_percent(v)) is not None else v
+            for v in self.stretch.split()
+        )
+
+    def _stretch_css(self) -> str | None:
+        """
+        The `font-stretch` of the file. Like weight ranges, the bounds of
+        ranges are given as numbers, i.e. percentages.
+        """
+        if self.stretch is None or len(self.stretch.split()) != 2:
+            return self.stretch
+        return self._stretch_key()
+
+    def _infer_metadata(self) -> bool:
+        """
+        Fill `weight: auto`, the default `style` and a missing `stretch` from
+        the metadata in a local font file. Returns whether the file was read.
+        """
+        if (
+            not isinstance(self.path, FileLocationLocal)
+            or not self.path.exists()
+        ):
+            return False
+
+        metadata = read_font_metadata(self.path.absolute())
+        if metadata is None:
+            return False
+
+        if self.weight.root == "auto":
+            wght = metadata.axis("wght")
+            if wght is not None and wght.min < wght.max:
+                weights = [
+                    _round_font_weight(wght.min),
+                    _round_font_weight(wght.max),
+                ]
+                weight: Any = weights if weights[0] < weights[1] else weights[0]
+            else:
+                weight = metadata.weight and _round_font_weight(metadata.weight)
+            if weight:
+                self.weight = BrandTypographyFontFileWeight.model_validate(
+                    weight
+                )
+
+        if "style" not in self.model_fields_set and metadata.italic:
+            self.style = "italic"
+
+        wdth = metadata.axis("wdth")
+        if self.stretch is None and wdth is not None and wdth.min < wdth.max:
+            self.stretch = f"{wdth.min:g}% {wdth.max:g}%"
+
+        return True
+
+    def _is_variable(self) -> bool:
+        """Whether the file covers a range of weights or stretches."""
+        return isinstance(self.weight.root, tuple) or (
+            self.stretch is not None and len(self.stretch.split()) == 2
         )
 
+    def _replaces(
+        self,
+        static: BrandTypographyFontFilesPath,
+        unicode_range: str | None = None,
+    ) -> bool:
+        """
+        Whether this variable file covers the weight, stretch, style and
+        unicode range of a `static` file. `unicode_range` is the family's
+        default unicode range.
+        """
+        if static.style != self.style:
+            return False
+        if (static.unicode_range or unicode_range) != (
+            self.unicode_range or unicode_range
+        ):
+            return False
+        if static.weight.root == "auto" or isinstance(
+            static.weight.root, tuple
+        ):
+            return False
+
+        weight = static.weight.root
+        if isinstance(weight, str):
+            weight = font_weight_map[weight]
+        if not self.weight._covers(weight):
+            return False
+
+        stretch = _font_stretch_percent(static.stretch or "normal")
+        bounds = [
+            b
+            for v in (self.stretch or "normal").split()
+            if (b := _font_stretch_percent(v)) is not None
+        ]
+        if stretch is None or not bounds:
+            return False
+        return min(bounds) <= stretch <= max(bounds)
+
+    @field_validator("stretch", mode="before")
+    @classmethod
+    def _validate_stretch(cls, value: Any) -> Any:
+        if isinstance(value, str) and ".." in value:
+            value = re_split(r"\s*[.]{2,3}\s*", value, maxsplit=1)
+
+        if isinstance(value, (tuple, list)):
+            if len(value) != 2:
+                raise ValueError(
+                    "Font stretch ranges must have exactly 2 elements."
+                )
+            return " ".join(str(cls._validate_stretch(v)) for v in value)
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return f"{value:g}%"
+        return value
+
     @field_validator("path", mode="after")
     @classmethod
     def validate_path(
@@ -437,6 +763,75 @@ class BrandTypographyFontFilesPath(BaseModel):
         return fmt
 
 
+font_mime_types = {
+    "woff2": "font/woff2",
+    "woff": "font/woff",
+    "truetype": "font/ttf",
+    "opentype": "font/otf",
+}
+
+
+def _format_rank(file: BrandTypographyFontFilesPath) -> int:
+    return font_src_format_preference.index(file.format)
+
+
+def _round_font_weight(weight: float) -> int:
+    """Round a font weight to the nearest multiple of 100 from 100 to 900."""
+    return min(900, max(100, int(weight / 100 + 0.5) * 100))
+
+
+def _font_stretch_percent(value: str) -> float | None:
+    if value in font_stretch_map:
+        return font_stretch_map[value]
+    try:
+        return float(value.removesuffix("%"))
+    except ValueError:
+        return None
+
+
+def font_face_declarations(
+    files: list[BrandTypographyFontFilesPath],
+    display: BrandTypographyFontDisplayType | None = None,
+    unicode_range: str | None = None,
+    inline_max_bytes: int | None = None,
+) -> str:
+    """
+    The declarations of a `@font-face` rule for `files`, alternative formats of
+    the same font face. The `src` lists each file once, from the most to the
+    least compact format. The other declarations are taken from the first file;
+    `display` and `unicode_range` are used when it doesn't set its own value.
+    """
+    file = files[0]
+    srcs = dict.fromkeys(
+        f.to_css_src(inline_max_bytes) for f in sorted(files, key=_format_rank)
+    )
+    css = [
+        f"font-weight: {file.weight};",
+        f"font-style: {file.style};",
+        f"src: {', '.join(srcs)};",
+    ]
+
+    stretch = file._stretch_css()
+    if stretch is not None:
+        css.append(f"font-stretch: {stretch};")
+
+    if file.variation_settings is not None:
+        settings = file.variation_settings
+        if isinstance(settings, dict):
+            settings = ", ".join(f"'{k}' {v:g}" for k, v in settings.items())
+        css.append(f"font-variation-settings: {settings};")
+
+    display = file.display or display
+    if display is not None:
+        css.append(f"font-display: {display};")
+
+    unicode_range = file.unicode_range or unicode_range
+    if unicode_range is not None:
+        css.append(f"unicode-range: {unicode_range};")
+
+    return "\n".join(css)
+
+
 # Fonts (Google) ---------------------------------------------------------------
 
 
@@ -606,7 +1001,7 @@ class BrandTypographyGoogleFontsApi(BrandTypographyFontSource):
     both normal and italic font styles should be imported.
     """
 
-    display: Literal["auto", "block", "swap", "fallback", "optional"] = "auto"
+    display: BrandTypographyFontDisplayType = "auto"
     """
     Specifies how a font face is displayed based on whether and when it is
     downloaded and ready to use.
@@ -626,6 +1021,24 @@ class BrandTypographyGoogleFontsApi(BrandTypographyFontSource):
     documentation](https://developers.google.com/fonts/docs/getting_started#use_font-display).
     """
 
+    subset: SingleOrList[str] | None = None
+    """
+    The character subset(s) to request, e.g. `latin` or `["latin",
+    "cyrillic"]`.
+
+    When not set, the API decides which subsets to provide. Modern browsers
+    only download the subsets covering the characters used on the page.
+    """
+
+    text: str | None = None
+    """
+    Request a font file that only contains the characters in `text`.
+
+    Useful when a font is only used for a short, known string of text, such as
+    a title or digits in a dashboard, as the font file is then only a fraction
+    of its full size.
+    """
+
     version: PositiveInt = 2
     """Google Fonts API version. (Primarily for internal use.)"""
 
@@ -637,65 +1050,187 @@ class BrandTypographyGoogleFontsApi(BrandTypographyFontSource):
 
     def to_import_url(self) -> str:
         """Returns the URL for the font family to be used in a CSS `@import` statement."""
-        if self.version == 1:
-            return self._import_url_v1()
-        return self._import_url_v2()
-
-    def _import_url_v1(self) -> str:
-        weight = self.weight.to_url_list()
-        style_str = sorted(
-            self.style if isinstance(self.style, list) else [self.style]
-        )
-        style_map = {"normal": "", "italic": "i"}
-        ital: list[str] = sorted([style_map[s] for s in style_str])
-
-        values = []
-        if len(weight) > 0 and len(ital) > 0:
-            values = [f"{w}{i}" for w, i in itertools.product(weight, ital)]
-        elif len(weight) > 0:
-            values = [str(w) for w in weight]
-        elif len(ital) > 0:
-            values = ["regular" if i == "" else "italic" for i in ital]
-
-        family_values = "" if len(values) == 0 else f":{','.join(values)}"
-        params = urlencode(
-            {
-                "family": self.family + family_values,
-                "display": self.display,
-            }
+        return google_fonts_import_url(
+            (self._import_family(),), **self._import_options()
         )
 
-        return urljoin(str(self.url), f"css?{params}")
+    def _import_family(
+        self,
+        used: set[tuple[BrandTypographyFontStyleType, int]] | None = None,
+    ) -> GoogleFontsFamily:
+        """
+        The family, weights and styles to import.
 
-    def _import_url_v2(self) -> str:
-        weight = self.weight.to_url_list()
-        style_str = sorted(
+        When `used` lists the `(style, weight)` faces used by the brand's
+        typography, only those faces are imported. Explicitly set `weight` or
+        `style` fields take precedence over the used weights or styles.
+        """
+        styles: list[BrandTypographyFontStyleType] = (
             self.style if isinstance(self.style, list) else [self.style]
         )
-        style_map = {"normal": 0, "italic": 1}
-        ital: list[int] = sorted([style_map[s] for s in style_str])
-
-        values = []
-        axis = ""
-        if len(weight) > 0 and len(ital) > 0:
-            values = [f"{i},{w}" for i, w in itertools.product(ital, weight)]
-            axis = "ital,wght"
-        elif len(weight) > 0:
-            values = [str(w) for w in weight]
-            axis = "wght"
-        elif len(ital) > 0:
-            values = [str(i) for i in ital]
-            axis = "ital"
-
-        axis_range = "" if len(values) == 0 else f":{axis}@{';'.join(values)}"
-        params = urlencode(
-            {
-                "family": self.family + axis_range,
-                "display": self.display,
-            }
-        )
+        weights = self.weight.to_url_list()
+
+        if not used:
+            return (self.family, tuple(weights), tuple(sorted(styles)), ())
+
+        explicit = self.model_fields_set
+        if "weight" not in explicit and "style" not in explicit:
+            faces = tuple(sorted(used))
+            return (
+                self.family,
+                tuple(str(w) for w in sorted({w for _, w in faces})),
+                tuple(sorted({s for s, _ in faces})),
+                tuple((s, str(w)) for s, w in faces),
+            )
 
-        return urljoin(str(self.url), f"css2?{params}")
+        if "weight" not in explicit:
+            weights = [str(w) for w in sorted({w for _, w in used})]
+        if "style" not in explicit:
+            styles = list({s for s, _ in used})
+
+        return (self.family, tuple(weights), tuple(sorted(styles)), ())
+
+    def _import_options(self) -> dict[str, Any]:
+        """
+        Options of the import URL shared by all families in the URL. Fonts with
+        the same options can be requested together.
+        """
+        subset = self.subset if isinstance(self.subset, list) else [self.subset]
+        return {
+            "display": self.display,
+            "subset": tuple(sorted(s for s in subset if s)),
+            "text": self.text,
+            "version": self.version,
+            "url": str(self.url),
+        }
+
+
+GoogleFontsFamily = tuple[
+    str,
+    tuple[str, ...],
+    tuple[BrandTypographyFontStyleType, ...],
+    tuple[tuple[BrandTypographyFontStyleType, str], ...],
+]
+"""
+A font family name, its weights as they appear in the URL, its styles and, if
+not every combination of weight and style is needed, the exact `(style,
+weight)` faces.
+"""
+
+
+@lru_cache(maxsize=1024)
+def google_fonts_import_url(
+    families: tuple[GoogleFontsFamily, ...],
+    display: str,
+    version: int,
+    url: str,
+    subset: tuple[str, ...] = (),
+    text: str | None = None,
+) -> str:
+    """
+    Create the CSS import URL for font families from a Google Fonts-compatible
+    API.
+
+    The URL depends only on these arguments, so it's computed once for each
+    combination and then reused.
+
+    Parameters
+    ----------
+    families
+        The font families to include in the URL. Each family is a tuple of the
+        family name, the font weights as they appear in the URL, e.g. `("400",
+        "700")` or `("300..700",)`, the font styles, `"normal"` and/or
+        `"italic"`, and the exact `(style, weight)` faces to request. When the
+        faces are empty, every combination of weight and style is requested.
+    display
+        The value of the `display` parameter.
+    version
+        The API version, `1` (`css`) or `2` (`css2`).
+    url
+        The base URL of the API.
+    subset
+        The character subsets to request. Omitted from the URL when empty.
+    text
+        Only request the characters in `text`. Omitted from the URL when
+        `None`.
+    """
+    if version == 1:
+        # css?family=A:400,700|B:400i
+        family_specs = [_google_fonts_family_v1(*f) for f in families]
+        params = [("family", "|".join(family_specs))]
+        endpoint = "css"
+    else:
+        # css2?family=A:wght@400;700&family=B:ital@1
+        params = [("family", _google_fonts_family_v2(*f)) for f in families]
+        endpoint = "css2"
+
+    params.append(("display", display))
+    if subset:
+        params.append(("subset", ",".join(subset)))
+    if text is not None:
+        params.append(("text", text))
+
+    return urljoin(url, f"{endpoint}?{urlencode(params)}")
+
+
+def _google_fonts_family_v1(
+    family: str,
+    weight: tuple[str, ...],
+    style: tuple[BrandTypographyFontStyleType, ...],
+    faces: tuple[tuple[BrandTypographyFontStyleType, str], ...] = (),
+) -> str:
+    style_map = {"normal": "", "italic": "i"}
+    ital: list[str] = sorted([style_map[s] for s in style])
+
+    values = []
+    if len(faces) > 0:
+        values = [
+            f"{w}{i}"
+            for i, w in sorted(
+                ((style_map[s], w) for s, w in faces),
+                key=lambda f: (f[0], int(f[1])),
+            )
+        ]
+    elif len(weight) > 0 and len(ital) > 0:
+        values = [f"{w}{i}" for w, i in itertools.product(weight, ital)]
+    elif len(weight) > 0:
+        values = [str(w) for w in weight]
+    elif len(ital) > 0:
+        values = ["regular" if i == "" else "italic" for i in ital]
+
+    return family + ("" if len(values) == 0 else f":{','.join(values)}")
+
+
+def _google_fonts_family_v2(
+    family: str,
+    weight: tuple[str, ...],
+    style: tuple[BrandTypographyFontStyleType, ...],
+    faces: tuple[tuple[BrandTypographyFontStyleType, str], ...] = (),
+) -> str:
+    style_map = {"normal": 0, "italic": 1}
+    ital: list[int] = sorted([style_map[s] for s in style])
+
+    values = []
+    axis = ""
+    if len(faces) > 0 and ital != [0]:
+        # Tuples must be sorted, e.g. ital,wght@0,400;0,700;1,400
+        pairs = sorted((style_map[s], int(w)) for s, w in faces)
+        values = [f"{i},{w}" for i, w in pairs]
+        axis = "ital,wght"
+    elif len(faces) > 0:
+        values = [str(w) for w in sorted(int(w) for _, w in faces)]
+        axis = "wght"
+    elif len(weight) > 0 and len(ital) > 0:
+        values = [f"{i},{w}" for i, w in itertools.product(ital, weight)]
+        axis = "ital,wght"
+    elif len(weight) > 0:
+        values = [str(w) for w in weight]
+        axis = "wght"
+    elif len(ital) > 0:
+        values = [str(i) for i in ital]
+        axis = "ital"
+
+    return family + ("" if len(values) == 0 else f":{axis}@{';'.join(values)}")
 
 
 class BrandTypographyFontGoogle(BrandTypographyGoogleFontsApi):
@@ -1328,6 +1863,14 @@ class BrandTypography(BrandBase):
     )
     link: BrandTypographyLink | None = None
 
+    _css_include_fonts: (
+        tuple[
+            list[object],
+            dict[tuple[Any, ...], tuple[tuple[Any, ...], str]],
+        ]
+        | None
+    ) = PrivateAttr(default=None)
+
     @model_validator(mode="before")
     @classmethod
     def _default_fonts_provider(cls, data: Any):
@@ -1429,23 +1972,714 @@ class BrandTypography(BrandBase):
         use_fallback("monospace_block")
         return self
 
-    def css_include_fonts(self) -> str:
+    def infer_font_metadata(self) -> int:
+        """
+        Fill in font file details from the metadata in local font files.
+
+        Reads the `OS/2`, `name` and `fvar` tables of local TrueType, OpenType,
+        WOFF and WOFF2 files in `fonts` to replace `weight: auto` with the
+        file's weight, or its range of weights for variable fonts, to set
+        `style: italic` for italic files without an explicit `style`, and to set
+        the `stretch` range of variable fonts with a width axis. Only the
+        headers of the files are read, and the results are cached until the
+        files change. Reading WOFF2 files requires the `brotli` package.
+
+        When the `BRAND_YAML_INFER_FONT_METADATA` environment variable is
+        `true`, this method is called when a [`brand_yml.Brand`](`brand_yml.Brand`)
+        is validated.
+
+        Returns
+        -------
+        :
+            The number of font files that were read.
+        """
+        count = 0
+        for font in self.fonts:
+            if isinstance(font, BrandTypographyFontFiles):
+                count += sum(file._infer_metadata() for file in font.files)
+        return count
+
+    def vendor_fonts(
+        self,
+        dest_dir: str | Path,
+        *,
+        root_dir: str | Path | None = None,
+        fetcher: FontFetcher | None = None,
+    ) -> list[Path]:
+        """
+        Download Google and Bunny Fonts to self-host them.
+
+        Fetches the CSS for each Google or Bunny Fonts family, downloads the
+        font files it references (preferring `woff2`) into `dest_dir` and
+        replaces the font with a
+        [`brand_yml.typography.BrandTypographyFontFiles`](`brand_yml.typography.BrandTypographyFontFiles`)
+        entry for the downloaded files. Afterwards,
+        [`css_include_fonts()`](`brand_yml.typography.BrandTypography.css_include_fonts`)
+        creates local `@font-face` rules instead of `@import` rules, so pages
+        no longer depend on the fonts API.
+
+        Files are named after the family and a hash of their content, so
+        downloading the same files again doesn't create new files. All files
+        are downloaded before any font is replaced: if a download fails, the
+        fonts are left unchanged.
+
+        Parameters
+        ----------
+        dest_dir
+            The directory where font files are saved. Relative paths are
+            relative to `root_dir`. On Windows, `dest_dir` must be on the same
+            drive as `root_dir`.
+        root_dir
+            The directory that local font paths are relative to, typically the
+            directory containing `_brand.yml`. Defaults to the current working
+            directory.
+        fetcher
+            A function that takes a URL and returns the content at the URL as
+            bytes. Defaults to a fetcher that downloads files with
+            `urllib.request`. Font files are downloaded concurrently, so the
+            fetcher must be thread-safe.
+
+        Returns
+        -------
+        :
+            The paths of the font files.
+
+        Examples
+        --------
+
+        ```python
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml("_brand.yml")
+        brand.typography.vendor_fonts("fonts", root_dir=brand.path.parent)
+        brand.model_dump_yaml("_brand.yml")
+        ```
+        """
+        fetch = fetcher or fetch_url
+        root = Path(
+            root_dir if root_dir is not None else os.getcwd()
+        ).absolute()
+        dest = root / Path(dest_dir).expanduser()
+        try:
+            dest_relative = Path(os.path.relpath(dest, root))
+        except ValueError as e:
+            # On Windows, `dest` and `root` can be on different drives, and
+            # local font paths can't be absolute
+            raise ValueError(
+                f"`dest_dir` ({dest}) must be on the same drive as "
+                f"`root_dir` ({root}), because font paths are relative to "
+                "`root_dir`."
+            ) from e
+
+        faces: dict[
+            int, tuple[BrandTypographyGoogleFontsApi, list[FontFace]]
+        ] = {}
+        for i, font in enumerate(self.fonts):
+            if not isinstance(font, BrandTypographyGoogleFontsApi):
+                continue
+            css_url = font.to_import_url()
+            css = fetch(css_url).decode("utf-8")
+            faces[i] = (font, parse_font_faces(css, base_url=css_url))
+
+        urls = list(
+            dict.fromkeys(f.url for _, ff in faces.values() for f in ff)
+        )
+        content = dict(
+            map_chunks_unordered(
+                lambda chunk: [(url, fetch(url)) for url in chunk],
+                urls,
+                executor="thread",
+                chunksize=1,
+            )
+        )
+
+        dest.mkdir(parents=True, exist_ok=True)
+
+        paths: dict[Path, None] = {}
+        for i, (font, font_faces) in faces.items():
+            files = []
+            for face in font_faces:
+                name = font_file_name(font.family, content[face.url], face)
+                path = dest / name
+                if not path.exists():
+                    path.write_bytes(content[face.url])
+                paths[path] = None
+
+                # Variable fonts have a weight range, e.g. `300 800`
+                weight = (face.weight or "auto").split()
+                file = BrandTypographyFontFilesPath.model_validate(
+                    {
+                        "path": str(dest_relative / name),
+                        "weight": weight if len(weight) == 2 else weight[0],
+                        "style": face.style or "normal",
+                        "stretch": face.stretch,
+                        "unicode_range": face.unicode_range,
+                    }
+                )
+                if isinstance(file.path, FileLocationLocal):
+                    file.path.set_root_dir(root)
+                files.append(file)
+
+            self.fonts[i] = BrandTypographyFontFiles.model_validate(
+                {
+                    "family": font.family,
+                    "files": files,
+                    "display": None if font.display == "auto" else font.display,
+                }
+            )
+
+        return list(paths)
+
+    def html_preload_links(self) -> str:
+        """
+        HTML `<link rel="preload">` tags for the fonts used by `base` and
+        `headings`.
+
+        Preloading tells the browser to download these font files right away,
+        rather than after the CSS has been loaded and applied, so text is shown
+        in the brand's fonts sooner. Include the tags in the `<head>` of the
+        page, before the stylesheets.
+
+        Only font files that match the weight and style of `base` text
+        (default 400, normal) and `headings` (default 700, normal) are
+        preloaded. When a family is split into files by `unicode-range`, only
+        the files covering Latin characters are preloaded, and when the same
+        font is available in several formats, only the most compact format is
+        preloaded.
+
+        Fonts from Google or Bunny Fonts are loaded via CSS imports and can't
+        be preloaded; use
+        [`vendor_fonts()`](`brand_yml.typography.BrandTypography.vendor_fonts`)
+        to host these fonts locally first.
+
+        Returns
+        -------
+        :
+            The `<link>` tags, one per line, or an empty string if there are no
+            font files to preload.
+        """
+        used: list[tuple[str, int, list[str]]] = []
+        for node, default_weight in ((self.base, 400), (self.headings, 700)):
+            if node is None or node.family is None:
+                continue
+            weight = node.weight or default_weight
+            if isinstance(weight, str):
+                weight = font_weight_map[weight]
+            style = getattr(node, "style", None) or "normal"
+            used.append(
+                (
+                    node.family,
+                    weight,
+                    style if isinstance(style, list) else [style],
+                )
+            )
+
+        preload: dict[tuple[Any, ...], BrandTypographyFontFilesPath] = {}
+        for family, weight, styles in used:
+            for font in self.fonts:
+                if not isinstance(font, BrandTypographyFontFiles):
+                    continue
+                if font.family != family:
+                    continue
+                for file in font._css_files():
+                    fmt = font_formats.get(Path(str(file.path.root)).suffix)
+                    unicode_range = file.unicode_range or font.unicode_range
+                    if (
+                        fmt not in font_mime_types
+                        or file.style not in styles
+                        or not file.weight._covers(weight)
+                        or (
+                            unicode_range is not None
+                            # Latin capital letter A
+                            and not unicode_range_covers(unicode_range, 0x41)
+                        )
+                    ):
+                        continue
+
+                    key = (
+                        family,
+                        file._weight_key(),
+                        file._stretch_key(),
+                        file.style,
+                        unicode_range,
+                    )
+                    best = preload.get(key)
+                    if best is None or _format_rank(file) < _format_rank(best):
+                        preload[key] = file
+
+        links = {
+            str(file.path.root): (
+                '<link rel="preload" href="{}" as="font" type="{}" crossorigin>'
+            ).format(
+                html_escape(str(file.path.root)),
+                font_mime_types[file.format],
+            )
+            for file in preload.values()
+        }
+        return "\n".join(links.values())
+
+    def resource_hints(
+        self,
+        output: Literal["html", "header"] = "html",
+        dns_prefetch: bool = True,
+    ) -> str:
+        """
+        Resource hints that connect to remote font hosts early.
+
+        Fonts from Google Fonts, Bunny Fonts or other hosted files are only
+        requested after the page's CSS has been loaded and parsed. Telling the
+        browser to `preconnect` to their hosts up front lets the DNS lookup, TCP
+        and TLS handshakes happen in parallel with loading the page.
+
+        The origins are collected from the `url` of each Google Fonts-compatible
+        font, including the separate host that Google Fonts serves font files
+        from (`https://fonts.gstatic.com`), and from hosted font `files`. Font
+        files are requested in CORS mode, so their origins are hinted with
+        `crossorigin`; an origin that serves both CSS and font files, such as
+        Bunny Fonts, is hinted both with and without `crossorigin`. Each origin
+        is listed once.
+
+        Parameters
+        ----------
+        output
+            `"html"` for `<link>` tags to include in the `<head>` of the page,
+            or `"header"` for the value of an HTTP `Link` header, which lets
+            the browser connect before it has received the page.
+        dns_prefetch
+            Whether to also add a `dns-prefetch` hint for each origin, for
+            browsers that don't support `preconnect`.
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        typography:
+          fonts:
+            - family: Inter
+              source: google
+          base: Inter
+        \"\"\")
+
+        print(brand.typography.resource_hints())
+        ```
+
+        ```{python}
+        brand.typography.resource_hints(output="header", dns_prefetch=False)
+        ```
+
+        Returns
+        -------
+        :
+            The `<link>` tags, one per line, or the comma-separated `Link`
+            header value. An empty string if no fonts are hosted remotely.
+        """
+        if output not in ("html", "header"):
+            raise ValueError(
+                f"Invalid output {output!r}. Expected 'html' or 'header'."
+            )
+
+        # (origin, crossorigin) in the order they were first seen
+        hints: dict[tuple[str, bool], None] = {}
+
+        def origin(url: str) -> str | None:
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.netloc:
+                return None
+            return f"{parts.scheme}://{parts.netloc}"
+
+        for font in self.fonts:
+            if isinstance(font, BrandTypographyGoogleFontsApi):
+                css_origin = origin(str(font.url))
+                if css_origin is None:
+                    continue
+                hints[(css_origin, False)] = None
+                file_origin = font_file_origins.get(css_origin, css_origin)
+                hints[(file_origin, True)] = None
+            elif isinstance(font, BrandTypographyFontFiles):
+                for file in font.files:
+                    if isinstance(file.path, FileLocationLocal):
+                        continue
+                    file_origin = origin(str(file.path.root))
+                    if file_origin is not None:
+                        hints[(file_origin, True)] = None
+
+        links: list[tuple[str, str, bool]] = [
+            (url, "preconnect", crossorigin) for url, crossorigin in hints
+        ]
+        if dns_prefetch:
+            links.extend(
+                (url, "dns-prefetch", False)
+                for url in dict.fromkeys(url for url, _ in hints)
+            )
+
+        if output == "header":
+            return ", ".join(
+                f"<{url}>; rel={rel}" + ("; crossorigin" if crossorigin else "")
+                for url, rel, crossorigin in links
+            )
+
+        return "\n".join(
+            '<link rel="{}" href="{}"{}>'.format(
+                rel, html_escape(url), " crossorigin" if crossorigin else ""
+            )
+            for url, rel, crossorigin in links
+        )
+
+    def css_include_fonts(
+        self,
+        combine: bool = False,
+        inline_max_bytes: int | None = None,
+        prune: bool = False,
+    ) -> str:
         """
         Generates CSS include statements for the defined fonts.
 
         This method creates CSS `@import` or `@font-face` rules for all fonts
-        defined in the typography configuration.
+        defined in the typography configuration. The CSS is cached and reused
+        until the font definitions in `fonts` change.
+
+        Parameters
+        ----------
+        combine
+            Whether to import all Google Fonts families, and all Bunny Fonts
+            families, with a single `@import` rule per provider rather than one
+            rule per family. Fewer imports mean fewer requests that block the
+            page from rendering. Fonts are only combined when they have the
+            same `display` setting.
+        inline_max_bytes
+            Embed local font files up to this size, in bytes, in the CSS as
+            base64-encoded `data:` URIs, e.g. for self-contained HTML files.
+            Larger files and hosted files are linked as usual. The local files
+            must exist; their root directory is set when the typography is part
+            of a [`brand_yml.Brand`](`brand_yml.Brand`) read from a file.
+        prune
+            Whether to import only the weights and styles of Google Fonts and
+            Bunny Fonts families that are used by `base`, `headings`, `link`,
+            `monospace`, `monospace-inline` and `monospace-block`. By default,
+            all nine weights in both normal and italic styles are imported for
+            each family. Families with an explicit `weight` or `style` keep
+            those values, and families that aren't used by any element are
+            imported in full. Note that browsers synthesize bold or italic text
+            in faces that aren't imported, e.g. for `<strong>` in body text.
 
         Returns
         -------
         :
             A string containing CSS include statements for all defined fonts.
         """
-        # TODO: Download or move files into a project-relative location
-
         if len(self.fonts) == 0:
             return ""
 
-        includes = [font.to_css() for font in self.fonts]
+        # Fonts may be modified in place, so the cache is keyed on the objects
+        # that make up `fonts` rather than on the `fonts` list itself
+        key = self._fonts_snapshot()
+        if self._css_include_fonts is None or not _same_objects(
+            self._css_include_fonts[0], key
+        ):
+            self._css_include_fonts = (key, {})
+
+        # Embedded files depend on their root directory and may change on disk
+        # without changing `fonts`
+        stamps = (
+            tuple(self._local_font_stamps())
+            if inline_max_bytes is not None
+            else ()
+        )
+
+        cache = self._css_include_fonts[1]
+        # Pruned imports also depend on the faces used by the elements
+        used = self._used_font_faces() if prune else {}
+        options = (
+            combine,
+            inline_max_bytes,
+            tuple(
+                sorted((f, tuple(sorted(faces))) for f, faces in used.items())
+            ),
+        )
+        if options not in cache or cache[options][0] != stamps:
+            includes = (
+                self._css_include_fonts_combined(inline_max_bytes, used)
+                if combine
+                else [
+                    _font_to_css(f, inline_max_bytes, used.get(f.family))
+                    for f in self.fonts
+                ]
+            )
+            cache[options] = (stamps, "\n".join([i for i in includes if i]))
+
+        return cache[options][1]
 
-        return "\n".join([i for i in includes if i])
+    def css_fallback_fonts(self) -> str:
+        """
+        Generates metric-adjusted fallback fonts for the defined fonts.
+
+        While a web font is loading, the browser shows text in a fallback font,
+        and when the web font arrives, text that takes up a different amount of
+        space moves around the page. This method creates a `@font-face` rule
+        per font family, named after the family with a ` Fallback` suffix, for
+        a local font (Arial, Times New Roman or Courier New) whose `size-adjust`,
+        `ascent-override`, `descent-override` and `line-gap-override` match the
+        size of the web font. Use
+        [`font_stack()`](`brand_yml.typography.BrandTypography.font_stack`) to
+        include the fallback in a `font-family` declaration.
+
+        The metrics are read from local font files, or are taken from a small
+        table of Google Fonts families. Families that appear in more than one
+        `fonts` entry get a single rule, from the first entry with metrics.
+        Families used by the `monospace` elements fall back to Courier New.
+
+        ::: {.callout-note}
+        The bundled table only covers Lato, Open Sans and Source Code Pro.
+        Other Google Fonts or Bunny Fonts families, families without local
+        files and system fonts don't get a fallback. Use `source: file` with
+        local font files (e.g. from
+        [`vendor_fonts()`](`brand_yml.typography.BrandTypography.vendor_fonts`))
+        to get fallbacks for any family.
+        :::
+
+        Examples
+        --------
+
+        ```{python}
+        from brand_yml import Brand
+
+        brand = Brand.from_yaml_str(\"\"\"
+        typography:
+          fonts:
+            - family: Open Sans
+              source: google
+          base: Open Sans
+        \"\"\")
+
+        print(brand.typography.css_fallback_fonts())
+        ```
+
+        ```{python}
+        brand.typography.font_stack("Open Sans")
+        ```
+
+        Returns
+        -------
+        :
+            The `@font-face` rules, or an empty string if no font has known
+            metrics.
+        """
+        return "\n".join(
+            fallback_font_face(family, metrics, category)
+            for family, (category, metrics) in self._fallbacks().items()
+        )
+
+    def font_stack(self, family: str) -> str:
+        """
+        The CSS `font-family` value for a font family with its fallbacks.
+
+        The stack lists `family`, its metric-adjusted fallback from
+        [`css_fallback_fonts()`](`brand_yml.typography.BrandTypography.css_fallback_fonts`)
+        when it has one, and a generic family, e.g. `'Open Sans', 'Open Sans
+        Fallback', sans-serif`.
+
+        Parameters
+        ----------
+        family
+            The name of a font family, usually one of the families in `fonts`.
+        """
+        fallback = self._fallbacks().get(family)
+
+        if fallback is not None:
+            category = fallback[0]
+        elif family in self._monospace_families():
+            category = "monospace"
+        else:
+            category = "sans-serif"
+
+        stack = [f"'{family}'"]
+        if fallback is not None:
+            stack.append(f"'{fallback_family_name(family)}'")
+        stack.append(category)
+        return ", ".join(stack)
+
+    def _fallbacks(self) -> dict[str, tuple[FontCategory, FontMetrics]]:
+        # One fallback per family, from the first entry in `fonts` with metrics
+        fallbacks: dict[str, tuple[FontCategory, FontMetrics]] = {}
+        for font in self.fonts:
+            if font.family in fallbacks:
+                continue
+            fallback = self._fallback_metrics(font)
+            if fallback is not None:
+                fallbacks[font.family] = fallback
+        return fallbacks
+
+    def _fallback_metrics(
+        self,
+        font: BrandTypographyFontFamily,
+    ) -> tuple[FontCategory, FontMetrics] | None:
+        if isinstance(font, BrandTypographyFontSystem):
+            return None
+
+        metrics = None
+        if isinstance(font, BrandTypographyFontFiles):
+            metrics = font._local_metrics()
+
+        category: FontCategory = "sans-serif"
+        if font.family in google_font_metrics:
+            category, known_metrics = google_font_metrics[font.family]
+            metrics = metrics or known_metrics
+
+        if metrics is None:
+            return None
+        if font.family in self._monospace_families():
+            category = "monospace"
+        return category, metrics
+
+    def _monospace_families(self) -> set[str]:
+        nodes = (self.monospace, self.monospace_inline, self.monospace_block)
+        return {n.family for n in nodes if n is not None and n.family}
+
+    def _css_include_fonts_combined(
+        self,
+        inline_max_bytes: int | None = None,
+        used: dict[str, set[tuple[BrandTypographyFontStyleType, int]]]
+        | None = None,
+    ) -> list[str]:
+        """
+        CSS includes where fonts from the same Google Fonts-compatible API are
+        imported together, in place of the first font of each group.
+        """
+        groups: dict[tuple[Any, ...], list[GoogleFontsFamily]] = {}
+        includes: list[str | tuple[Any, ...]] = []
+
+        for font in self.fonts:
+            if not isinstance(font, BrandTypographyGoogleFontsApi):
+                includes.append(_font_to_css(font, inline_max_bytes))
+                continue
+
+            group = tuple(font._import_options().items())
+            if group not in groups:
+                groups[group] = []
+                includes.append(group)
+            groups[group].append(
+                font._import_family((used or {}).get(font.family))
+            )
+
+        return [
+            include
+            if isinstance(include, str)
+            else "@import url('{}');".format(
+                google_fonts_import_url(tuple(groups[include]), **dict(include))
+            )
+            for include in includes
+        ]
+
+    def _used_font_faces(
+        self,
+    ) -> dict[str, set[tuple[BrandTypographyFontStyleType, int]]]:
+        """
+        The `(style, weight)` faces of each font family used by the
+        typographic elements, with the browser's default weights where an
+        element doesn't set one.
+        """
+        base_family = self.base.family if self.base else None
+        base_weight = self.base.weight if self.base else None
+
+        elements: list[
+            tuple[
+                str | None,
+                Any,
+                SingleOrList[BrandTypographyFontStyleType] | None,
+                int,
+            ]
+        ] = [
+            (base_family, base_weight, None, 400),
+        ]
+        if self.headings is not None:
+            elements.append(
+                (
+                    self.headings.family or base_family,
+                    self.headings.weight,
+                    self.headings.style,
+                    700,
+                )
+            )
+        if self.link is not None:
+            elements.append((base_family, self.link.weight, None, 400))
+        for node in (
+            self.monospace,
+            self.monospace_inline,
+            self.monospace_block,
+        ):
+            if node is not None:
+                elements.append(
+                    (
+                        node.family,
+                        node.weight,
+                        getattr(node, "style", None),
+                        400,
+                    )
+                )
+
+        used: dict[str, set[tuple[BrandTypographyFontStyleType, int]]] = {}
+        for family, node_weight, style, default_weight in elements:
+            if family is None:
+                continue
+            weight = node_weight or default_weight
+            if isinstance(weight, str):
+                weight = font_weight_map[weight]
+            styles: list[BrandTypographyFontStyleType] = (
+                style if isinstance(style, list) else [style or "normal"]
+            )
+            used.setdefault(family, set()).update((s, weight) for s in styles)
+
+        return used
+
+    def _local_font_stamps(self) -> Iterator[tuple[Path, FileStamp | None]]:
+        for font in self.fonts:
+            if not isinstance(font, BrandTypographyFontFiles):
+                continue
+            for file in font.files:
+                if isinstance(file.path, FileLocationLocal):
+                    path = file.path.absolute()
+                    yield (path, file_stamp(path) if path.exists() else None)
+
+    def _fonts_snapshot(self) -> list[object]:
+        """
+        The fonts, their files, the values of their fields and the items of
+        list values, e.g. `weight: [400, 700]`. Assigning a field of a font or
+        a file, editing a list in place, or adding or removing a font or a
+        file, changes at least one of these objects.
+        """
+        snapshot: list[object] = []
+        for font in self.fonts:
+            _extend_snapshot(snapshot, font)
+        return snapshot
+
+
+def _extend_snapshot(snapshot: list[object], value: object) -> None:
+    snapshot.append(value)
+    if isinstance(value, BaseModel):
+        for v in vars(value).values():
+            _extend_snapshot(snapshot, v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _extend_snapshot(snapshot, v)
+
+
+def _same_objects(a: list[object], b: list[object]) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+def _font_to_css(
+    font: BrandTypographyFontFamily,
+    inline_max_bytes: int | None = None,
+    used: set[tuple[BrandTypographyFontStyleType, int]] | None = None,
+) -> str:
+    if isinstance(font, BrandTypographyFontFiles):
+        return font.to_css(inline_max_bytes=inline_max_bytes)
+    if isinstance(font, BrandTypographyGoogleFontsApi) and used:
+        url = google_fonts_import_url(
+            (font._import_family(used),), **font._import_options()
+        )
+        return f"@import url('{url}');"
+    return font.to_css()
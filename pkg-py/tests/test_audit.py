@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import pytest
+from brand_yml import Brand, audit_contrast_many
+from brand_yml.audit import BrandContrastAudit
+
+
+def test_audit_contrast():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          palette:
+            orange: "#EE6331"
+          foreground: "#151515"
+          background: "#FFFFFF"
+          primary: orange
+          secondary: var(--secondary)
+        typography:
+          headings:
+            color: "#767676"
+          link:
+            color: primary
+          monospace-inline:
+            color: "#7d12ba"
+            background-color: "#f8f9fa"
+          monospace-block:
+            weight: bold
+        """
+    )
+
+    audit = brand.audit_contrast()
+    checks = {check.element: check for check in audit.checks}
+
+    # `monospace-block` doesn't set its own colors, so it's covered by `base`
+    assert list(checks) == [
+        "typography.base",
+        "typography.headings",
+        "typography.link",
+        "typography.monospace_inline",
+        "color.primary",
+        "color.secondary",
+    ]
+
+    base = checks["typography.base"]
+    assert (base.foreground, base.background) == ("#151515", "#FFFFFF")
+    assert base.ratio == pytest.approx(18.26, abs=0.01)
+    assert base.aa and base.aa_large and base.aaa
+
+    headings = checks["typography.headings"]
+    assert headings.ratio == pytest.approx(4.54, abs=0.01)
+    assert headings.aa and not headings.aaa
+
+    inline = checks["typography.monospace_inline"]
+    assert inline.background == "#f8f9fa"
+
+    # Colors are resolved before they're checked
+    link = checks["typography.link"]
+    assert link.foreground == "#EE6331"
+    assert link.ratio == pytest.approx(3.25, abs=0.01)
+    assert link.aa_large and not link.aa
+
+    assert audit.failures == [link, checks["color.primary"]]
+    assert audit.unchecked == [checks["color.secondary"]]
+    assert checks["color.secondary"].aa is None
+    assert not audit.passed
+
+
+def test_audit_contrast_unchecked_fails():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          foreground: "#151515"
+          background: var(--page-bg)
+        """
+    )
+
+    audit = brand.audit_contrast()
+    assert audit.failures == []
+    assert [check.element for check in audit.unchecked] == ["typography.base"]
+    assert audit.unchecked[0].ratio is None
+    assert not audit.passed
+
+
+def test_audit_contrast_without_colors():
+    assert Brand.from_yaml_str("meta:\n  name: Empty\n").audit_contrast() == (
+        BrandContrastAudit(checks=[])
+    )
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_audit_contrast_many(tmp_path, executor):
+    brand = Brand.from_yaml_str(
+        "color:\n  foreground: '#777777'\n  background: '#FFFFFF'\n"
+    )
+    path = tmp_path / "_brand.yml"
+    path.write_text("color:\n  foreground: '#000'\n  background: '#FFF'\n")
+    missing = tmp_path / "missing.yml"
+
+    results = list(
+        audit_contrast_many(
+            [brand, path, missing], workers=2, executor=executor
+        )
+    )
+    assert len(results) == 3
+
+    by_id = {id(item): result for item, result in results}
+    brand_audit, path_audit = by_id[id(brand)], by_id[id(path)]
+    assert isinstance(brand_audit, BrandContrastAudit)
+    assert isinstance(path_audit, BrandContrastAudit)
+    assert brand_audit == brand.audit_contrast()
+    assert not brand_audit.passed
+    assert path_audit.passed
+    assert isinstance(by_id[id(missing)], FileNotFoundError)
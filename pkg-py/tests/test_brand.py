@@ -2,10 +2,15 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from brand_yml import Brand, read_brand_yml
+from brand_yml import Brand, clear_cache, load_many, read_brand_yml
+from brand_yml._brand import _brand_cache
+from brand_yml._utils_batch import default_chunksize
 from brand_yml.file import FileLocationLocal
 from brand_yml.logo import BrandLogo, BrandLogoResource
+from brand_yml.meta import BrandMetaName
 from brand_yml.typography import BrandTypography, BrandTypographyFontFiles
+from ruamel.yaml.comments import CommentedMap
+from utils import path_examples, set_env_var
 
 path_fixtures = Path(__file__).parent / "fixtures"
 
@@ -111,3 +116,272 @@ def test_brand_yml_paths():
     # brand.path must be absolute
     with pytest.raises(ValueError):
         brand.path = Path("_brand.yml")
+
+
+def test_brand_yml_cache_returns_copies():
+    path = path_fixtures / "find-brand-yml" / "_brand.yml"
+    clear_cache()
+
+    brand_one = read_brand_yml(path)
+    brand_two = read_brand_yml(path)
+
+    assert brand_one == brand_two
+    assert brand_one is not brand_two
+
+    # Modifying a returned brand doesn't modify the cached brand
+    assert brand_one.meta is not None
+    brand_one.meta.name = BrandMetaName.model_validate({"full": "Modified"})
+    assert read_brand_yml(path) == brand_two
+
+    data = read_brand_yml(path, as_data=True)
+    data["meta"] = "modified"
+    assert read_brand_yml(path, as_data=True)["meta"] != "modified"
+
+
+def test_brand_yml_cache_invalidated_on_change(tmp_path):
+    path = tmp_path / "_brand.yml"
+    path.write_text("meta:\n  name: one\n")
+    clear_cache()
+
+    brand = Brand.from_yaml(tmp_path)
+    assert brand.meta is not None
+    assert brand.meta.name == BrandMetaName.model_validate({"full": "one"})
+
+    path.write_text("meta:\n  name: two (changed)\n")
+    brand = Brand.from_yaml(tmp_path)
+    assert brand.meta is not None
+    assert brand.meta.name == BrandMetaName.model_validate(
+        {"full": "two (changed)"}
+    )
+
+    assert Brand.from_yaml(tmp_path, cache=False) == brand
+
+
+def test_brand_yml_cache_invalidated_on_font_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("BRAND_YAML_INFER_FONT_METADATA", "true")
+    font = tmp_path / "OpenSans.ttf"
+    font.write_bytes(b"not a font file")
+    (tmp_path / "_brand.yml").write_text(
+        "typography:\n"
+        "  fonts:\n"
+        "    - family: Open Sans\n"
+        "      source: file\n"
+        "      files: [{path: OpenSans.ttf}]\n"
+    )
+    clear_cache()
+
+    def file_weight() -> str:
+        brand = Brand.from_yaml(tmp_path)
+        assert brand.typography is not None
+        font_files = brand.typography.fonts[0]
+        assert isinstance(font_files, BrandTypographyFontFiles)
+        return str(font_files.files[0].weight)
+
+    assert file_weight() == "auto"
+
+    # Replacing the font file invalidates the cached brand
+    ttf = path_examples("fonts/open-sans/OpenSans-Variable.ttf")
+    font.write_bytes(ttf.read_bytes())
+    assert file_weight() == "300 800"
+
+
+def test_brand_yml_cache_lru_eviction(tmp_path):
+    clear_cache()
+    maxsize = _brand_cache.maxsize
+
+    try:
+        _brand_cache.maxsize = 2
+        for name in ("one", "two", "three"):
+            path = tmp_path / name / "_brand.yml"
+            path.parent.mkdir()
+            path.write_text(f"meta:\n  name: {name}\n")
+            read_brand_yml(path, as_data=True)
+
+        assert len(_brand_cache) == 2
+
+        clear_cache()
+        assert len(_brand_cache) == 0
+    finally:
+        _brand_cache.maxsize = maxsize
+
+
+def test_brand_yml_loader():
+    path = path_examples("brand-posit.yml")
+
+    brand_rt = read_brand_yml(path, cache=False)
+    brand_safe = read_brand_yml(path, cache=False, loader="safe")
+    assert brand_safe == brand_rt
+    assert Brand.from_yaml(path, loader="safe") == brand_rt
+
+    data_rt = read_brand_yml(path, as_data=True, loader="rt")
+    data_safe = read_brand_yml(path, as_data=True, loader="safe")
+    assert isinstance(data_rt, CommentedMap)
+    assert type(data_safe) is dict
+    assert data_safe == data_rt
+
+    with set_env_var("BRAND_YAML_LOADER", "safe"):
+        assert type(read_brand_yml(path, as_data=True)) is dict
+
+    assert Brand.from_yaml_str(path.read_text(), loader="safe") == (
+        Brand.from_yaml_str(path.read_text())
+    )
+
+    with pytest.raises(ValueError, match="Invalid Brand YAML loader"):
+        read_brand_yml(path, loader="fast")  # type: ignore
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_many(tmp_path, executor):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"brand-{i}.yml"
+        path.write_text(f"meta:\n  name: Brand {i}\n")
+        paths.append(path)
+
+    invalid = tmp_path / "invalid.yml"
+    invalid.write_text("color:\n  palette:\n    a: b\n    b: a\n")
+    not_a_dict = tmp_path / "not-a-dict.yml"
+    not_a_dict.write_text("- a\n- b\n")
+    missing = tmp_path / "missing.yml"
+
+    results = dict(
+        load_many(
+            [*paths, invalid, not_a_dict, missing],
+            workers=2,
+            executor=executor,
+            chunksize=2,
+            loader="safe",
+        )
+    )
+
+    assert len(results) == 9
+    for i, path in enumerate(paths):
+        brand = results[path]
+        assert isinstance(brand, Brand)
+        assert brand == read_brand_yml(path)
+
+    assert isinstance(results[invalid], Exception)
+    assert "Circular reference" in str(results[invalid])
+    assert isinstance(results[not_a_dict], ValueError)
+    assert isinstance(results[missing], FileNotFoundError)
+
+
+def test_load_many_errors():
+    assert list(load_many([])) == []
+
+    with pytest.raises(ValueError, match="executor"):
+        load_many(["_brand.yml"], executor="fiber")  # type: ignore
+
+    with pytest.raises(ValueError, match="chunksize"):
+        load_many(["_brand.yml"], chunksize=0)
+
+
+def test_load_many_default_chunksize(monkeypatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 16)
+    # About four chunks per worker in the default pool
+    assert default_chunksize(640, None, "process") == 10
+    assert default_chunksize(640, 2, "process") == 80
+    assert default_chunksize(10, None, "process") == 1
+    assert default_chunksize(640, None, "thread") == 1
+
+
+def test_brand_from_validated():
+    brand = Brand.from_yaml_str(
+        """
+        meta:
+          name: Example
+        color:
+          palette:
+            blue: "#447099"
+          primary: blue
+        typography:
+          fonts:
+            - family: Open Sans
+              source: google
+          base: Open Sans
+          headings:
+            color: primary
+        """
+    )
+    assert brand.typography is not None
+
+    trusted = Brand.from_validated(
+        meta=brand.meta,
+        color=brand.color,
+        typography=brand.typography,
+    )
+    assert trusted == Brand.model_validate(
+        {
+            "meta": brand.meta,
+            "color": brand.color,
+            "typography": brand.typography,
+        }
+    )
+    assert trusted.model_fields_set == {"meta", "color", "typography"}
+    assert trusted.color is brand.color
+
+    # Typography colors are resolved without modifying the original
+    typography = brand.typography.model_copy(deep=True)
+    assert typography.headings is not None
+    typography.headings.color = "primary"
+    trusted = Brand.from_validated(color=brand.color, typography=typography)
+    assert trusted.typography is not None
+    assert trusted.typography.headings is not None
+    assert trusted.typography.headings.color == "#447099"
+    assert typography.headings.color == "primary"
+
+    with pytest.raises(ValueError, match="color.primary"):
+        Brand.from_validated(typography=typography)
+
+    with pytest.raises(TypeError, match="BrandColor"):
+        Brand.from_validated(color={"primary": "#447099"})  # type: ignore
+
+
+def test_brand_from_validated_path():
+    brand = read_brand_yml(path_examples("brand-logo-single.yml"))
+    assert brand.path is not None
+
+    trusted = Brand.from_validated(logo=brand.logo, path=brand.path)
+    assert trusted.logo == brand.logo
+    assert trusted.logo is not brand.logo
+    assert trusted.path == brand.path
+
+    with pytest.raises(ValueError, match="absolute"):
+        Brand.from_validated(logo=brand.logo, path="relative/_brand.yml")
+
+
+def test_brand_update():
+    brand = Brand.from_yaml_str(
+        """
+        color:
+          palette:
+            blue: "#447099"
+          primary: blue
+        typography:
+          headings:
+            color: primary
+        """
+    )
+    assert brand.color is not None
+
+    brand.color.update(palette={"red": "#FF0000"}, primary="red")
+    assert brand.color.primary == "#FF0000"
+    assert brand.color.resolved_colors["primary"] == "#FF0000"
+    assert brand.color.model_fields_set == {"palette", "primary"}
+
+    brand.update(meta={"name": "Updated"}, color=brand.color)
+    assert brand.meta is not None
+    assert brand.meta.name is not None
+    assert brand.meta.name.full == "Updated"
+    assert brand.typography is not None
+    assert brand.typography.headings is not None
+    assert brand.typography.headings.color == "#447099"
+
+    # Invalid updates leave the model unchanged
+    with pytest.raises(ValueError, match="no field"):
+        brand.update(meta=None, colour={})
+    with pytest.raises(ValueError):
+        brand.color.update(primary="red", secondary=["not", "a", "color"])
+    assert brand.color.primary == "#FF0000"
+    assert brand.color.secondary is None
+    assert brand.meta.name.full == "Updated"
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import pytest
 from brand_yml import read_brand_yml
+from brand_yml._defs import CircularReferenceError
+from brand_yml.color import BrandColor
 from syrupy.extensions.json import JSONSnapshotExtension
 from utils import path_examples, pydantic_data_from_json
 
@@ -83,3 +85,142 @@ def test_brand_color_ex_palette_internal(snapshot_json):
     }
 
     assert snapshot_json == pydantic_data_from_json(brand)
+
+
+def test_brand_color_palette_alias_chains():
+    color = BrandColor.model_validate(
+        {
+            "palette": {
+                "brand-blue": "blue-500",
+                "blue-500": "blue",
+                "blue": "#447099",
+                "accent": "brand-blue",
+            },
+            "primary": "accent",
+        }
+    )
+
+    assert color.palette == {
+        "brand-blue": "#447099",
+        "blue-500": "#447099",
+        "blue": "#447099",
+        "accent": "#447099",
+    }
+    assert color.primary == "#447099"
+
+    with pytest.raises(CircularReferenceError, match="in 'palette'"):
+        BrandColor.model_validate({"palette": {"a": "b", "b": "a"}})
+
+
+def test_brand_color_resolved_colors():
+    color = BrandColor(
+        palette={"blue": "#447099", "brand": "blue", "accent": "primary"},
+        primary="brand",
+        secondary="#707073",
+    )
+
+    resolved = color.resolved_colors
+    assert resolved == {
+        "blue": "#447099",
+        "brand": "#447099",
+        "accent": "#447099",
+        "primary": "#447099",
+        "secondary": "#707073",
+    }
+    # The table is computed once and can't be modified
+    table = color._resolved_colors
+    assert table is not None
+    assert color.resolved_colors == resolved
+    assert color._resolved_colors is table
+    with pytest.raises(TypeError):
+        resolved["blue"] = "#000000"  # type: ignore
+
+    # `_color_defs()` returns a copy that callers may modify
+    defs = color._color_defs(resolved=True)
+    defs["blue"] = "#000000"
+    assert color.resolved_colors["blue"] == "#447099"
+
+    # Assigning a field invalidates the table
+    color.secondary = "blue"
+    assert color._resolved_colors is None
+    assert color.resolved_colors["secondary"] == "#447099"
+    assert color._resolved_colors is not table
+    table = color._resolved_colors
+
+    color.palette = {"blue": "#0000FF", "accent": "secondary"}
+    assert color._resolved_colors is None
+    assert color.resolved_colors == {
+        "blue": "#0000FF",
+        "accent": "#447099",
+        "primary": "#447099",
+        "secondary": "#447099",
+    }
+    assert color._resolved_colors is not table
+
+
+def test_brand_color_engine():
+    color = BrandColor(
+        palette={
+            "blue": "#447099",
+            "gray": "rgb(112, 112, 115)",
+            "v": "var(--x)",
+        },
+        foreground="#000",
+        background="white",
+        primary="blue",
+        secondary="hsl(0, 100%, 50%)",
+    )
+
+    engine = color.engine
+    # Values that aren't colors, e.g. CSS variables, are skipped
+    assert engine.names == (
+        "blue",
+        "gray",
+        "foreground",
+        "background",
+        "primary",
+        "secondary",
+    )
+    assert "v" not in engine
+    assert engine.rgba("secondary") == (1.0, 0.0, 0.0, 1.0)
+    assert engine.rgba("#FF000080") == pytest.approx((1.0, 0.0, 0.0, 128 / 255))
+
+    # CSS named colors are parsed, case-insensitively
+    assert engine.rgba("background") == (1.0, 1.0, 1.0, 1.0)
+    assert engine.rgba("Yellow") == (1.0, 1.0, 0.0, 1.0)
+    assert engine.rgba("rebeccapurple") == pytest.approx((0.4, 0.2, 0.6, 1.0))
+    assert engine.contrast("yellow", "background") == pytest.approx(
+        1.07, abs=0.01
+    )
+
+    assert engine.contrast("foreground", "background") == pytest.approx(21)
+    assert engine.contrast("blue", "primary") == pytest.approx(1)
+    assert engine.contrast("#767676", "#FFF") == pytest.approx(4.54, abs=0.01)
+
+    matrix = engine.contrast_matrix()
+    n = len(engine.names)
+    assert matrix.typecode == "f"
+    assert len(matrix) == n * n
+    assert matrix[2 * n + 3] == pytest.approx(21)
+    assert matrix[3 * n + 2] == matrix[2 * n + 3]
+    assert matrix[0] == pytest.approx(1)
+    assert engine.contrast_matrix() is matrix
+
+    assert engine.nearest("#4070A0") in ("blue", "primary")
+    assert engine.nearest("#FE0102") == "secondary"
+
+    assert engine.lighten(0.5)["foreground"] == "#808080"
+    assert engine.darken(0.5)["background"] == "#808080"
+    assert engine.mix("#FFFFFF", 0)["blue"] == "#447099"
+    assert engine.mix("rgba(0, 0, 0, 0)", 1)["blue"] == "#00000000"
+
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        engine.lighten(2)
+    with pytest.raises(ValueError, match="not a known color"):
+        engine.contrast("missing", "blue")
+
+    # The engine is cached until a field is assigned
+    assert color.engine is engine
+    color.primary = "#FF0000"
+    assert color.engine is not engine
+    assert color.engine.rgba("primary") == (1.0, 0.0, 0.0, 1.0)
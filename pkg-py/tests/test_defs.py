@@ -3,9 +3,11 @@ from __future__ import annotations
 import pytest
 from brand_yml._defs import (
     CircularReferenceError,
+    DefsResolver,
     check_circular_references,
     defs_get,
     defs_replace_recursively,
+    defs_resolver,
 )
 from pydantic import BaseModel
 
@@ -62,3 +64,76 @@ def test_defs_replace_recursively():
     }
 
     assert defs_replace_recursively(None, {}) is None
+
+
+def test_circular_references_error_message():
+    with pytest.raises(CircularReferenceError) as exc_info:
+        check_circular_references(
+            {"x": "a", "a": "d", "b": "a", "d": {"y": {"y1": "b"}}},
+            name="palette",
+        )
+
+    err = exc_info.value
+    assert err.seen == ["x", "a", "d", "b", "a"]
+    assert err.path == ["x", "a", "d", "y", "y1", "b"]
+    assert str(err).startswith("Circular reference detected in 'palette'.")
+
+
+def test_circular_references_error_message_self_and_nested():
+    with pytest.raises(CircularReferenceError) as exc_info:
+        check_circular_references({"a": "a"}, name="palette")
+
+    assert str(exc_info.value) == (
+        "Circular reference detected in 'palette'.\n"
+        "Refs    : a -> a -> a\n"
+        "Via path: a -> a"
+    )
+
+    with pytest.raises(CircularReferenceError) as exc_info:
+        check_circular_references({"a": {"fg": "b"}, "b": {"x": {"y": "a"}}})
+
+    assert str(exc_info.value) == (
+        "Circular reference detected.\n"
+        "Refs    : fg -> b -> a -> b\n"
+        "Via path: a -> fg -> b -> x -> y -> a -> fg"
+    )
+
+
+def test_defs_resolver_deep_alias_chains():
+    # Definitions refer to definitions that appear later in `defs`
+    n = 5000
+    defs = {f"c{i}": f"c{i + 1}" for i in range(n)}
+    defs[f"c{n}"] = "#123456"
+
+    resolver = DefsResolver(defs)
+    assert resolver.order[0] == f"c{n}"
+    assert all(v == "#123456" for v in resolver.resolved.values())
+
+    items = {"a": "c0", "b": {"c": "c10"}, "with_": "c0"}
+    defs_replace_recursively(items, defs)
+    assert items == {"a": "#123456", "b": {"c": "#123456"}, "with_": "c0"}
+
+    # Definitions can be resolved in place
+    defs_replace_recursively(defs, defs)
+    assert set(defs.values()) == {"#123456"}
+
+    with pytest.raises(CircularReferenceError, match="c0 -> c1 -> c2 -> c0"):
+        check_circular_references({"c0": "c1", "c1": "c2", "c2": "c0"})
+
+
+def test_defs_get_reuses_resolver():
+    defs = {"a": "b", "b": "c", "c": "#123456"}
+
+    resolver = defs_resolver(defs)
+    assert defs_get(defs, "a") == "#123456"
+    assert defs_get(defs, "b") == "#123456"
+    assert defs_resolver(defs) is resolver
+    assert resolver._resolved is not None
+
+    # Equal but different tables get their own resolver
+    assert defs_resolver(dict(defs)) is not resolver
+
+    # Assigning a top-level key rebuilds the resolver
+    defs["c"] = "#abcdef"
+    assert defs_get(defs, "a") == "#abcdef"
+    assert defs_resolver(defs) is not resolver
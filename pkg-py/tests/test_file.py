@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import base64
 import copy
 from pathlib import Path
 
 import pytest
+from brand_yml._utils_data_uri import data_uri_cache
 from brand_yml.file import FileLocation, FileLocationLocal, FileLocationUrl
 
 
@@ -60,3 +62,30 @@ def test_local_files_retain_root_after_copy():
     local_deep = copy.deepcopy(local)
     assert local_deep.absolute() == local.absolute()
     assert local_deep.model_dump() == local.model_dump()
+
+
+def test_local_file_to_data_uri(tmp_path: Path):
+    data_uri_cache.clear()
+    content = bytes(range(256)) * 4000  # > one chunk, not a multiple of 3
+    (tmp_path / "logo.png").write_bytes(content)
+
+    local = FileLocationLocal.model_validate("logo.png")
+    local.set_root_dir(tmp_path)
+
+    uri = local.to_data_uri()
+    assert uri is not None
+    prefix = "data:image/png;base64,"
+    assert uri.startswith(prefix)
+    assert base64.b64decode(uri[len(prefix) :]) == content
+    assert local.to_data_uri() is uri
+    assert len(data_uri_cache) == 1
+
+    assert local.to_data_uri(max_bytes=len(content) - 1) is None
+    assert local.to_data_uri(mime_type="image/x-test", max_bytes=len(content))
+
+    # The cache is invalidated when the file changes
+    (tmp_path / "logo.png").write_bytes(b"")
+    assert local.to_data_uri() == prefix
+
+    with pytest.raises(FileNotFoundError):
+        FileLocationLocal.model_validate("missing.png").to_data_uri()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import brand_yml
+import pytest
+
+
+def imported_modules(code: str) -> set[str]:
+    """Modules imported by running `code` in a fresh interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{code}; import sys; print(*sys.modules, sep='\\n')",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like: "import time:   self [us] | cumulative | module"
+    modules = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+    return modules | set(result.stdout.splitlines())
+
+
+def test_import_brand_yml_is_lazy():
+    modules = imported_modules("import brand_yml")
+
+    assert "brand_yml" in modules
+    for heavy in (
+        "pydantic",
+        "ruamel.yaml",
+        "brand_yml._brand",
+        "brand_yml._utils_yaml",
+        "brand_yml.color",
+        "brand_yml.logo",
+        "brand_yml.meta",
+        "brand_yml.typography",
+    ):
+        assert heavy not in modules, f"{heavy} imported by `import brand_yml`"
+
+
+def test_import_brand_yml_loads_on_first_access():
+    modules = imported_modules("import brand_yml; brand_yml.BrandColor")
+
+    assert "brand_yml.color" in modules
+    assert "pydantic" in modules
+    assert "brand_yml._brand" not in modules
+    assert "brand_yml.typography" not in modules
+
+    modules = imported_modules("from brand_yml import Brand")
+    assert "brand_yml._brand" in modules
+    assert "ruamel.yaml" in modules
+
+
+def test_brand_yml_exports():
+    for name in brand_yml.__all__:
+        assert getattr(brand_yml, name) is not None
+        assert name in dir(brand_yml)
+
+    assert brand_yml.Brand.__name__ == "Brand"
+
+
+def test_brand_yml_submodules():
+    modules = imported_modules(
+        "import brand_yml; brand_yml.color.BrandColor; brand_yml.audit"
+    )
+    assert "brand_yml.color" in modules
+    assert "brand_yml.audit" in modules
+
+    assert brand_yml.typography.BrandTypography is brand_yml.BrandTypography
+    assert brand_yml._submodule_names() == {
+        path.stem
+        for path in Path(brand_yml.__file__).parent.glob("*.py")
+        if path.stem != "__init__"
+    }
+    with pytest.raises(AttributeError, match="no attribute 'colour'"):
+        brand_yml.colour  # noqa: B018 # pyright: ignore[reportAttributeAccessIssue]
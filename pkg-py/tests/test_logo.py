@@ -188,3 +188,29 @@ def test_brand_logo_ex_full_alt(snapshot_json):
     brand = read_brand_yml(path_examples("brand-logo-full-alt.yml"))
 
     assert snapshot_json == pydantic_data_from_json(brand)
+
+
+def test_brand_logo_resource_to_src(tmp_path: Path):
+    (tmp_path / "logo.svg").write_text("<svg></svg>")
+    (tmp_path / "_brand.yml").write_text(
+        "logo:\n"
+        "  images:\n"
+        "    local: logo.svg\n"
+        "    missing: missing.svg\n"
+        "    online: https://example.com/logo.svg\n"
+    )
+    brand = read_brand_yml(tmp_path / "_brand.yml", cache=False)
+    assert isinstance(brand.logo, BrandLogo)
+    assert brand.logo.images is not None
+    local, missing, online = brand.logo.images.values()
+
+    assert local.to_src() == "logo.svg"
+    assert local.to_src(inline_max_bytes=5) == "logo.svg"
+    assert (
+        local.to_src(inline_max_bytes=1024)
+        == "data:image/svg+xml;base64,PHN2Zz48L3N2Zz4="
+    )
+    assert missing.to_src(inline_max_bytes=1024) == "missing.svg"
+    assert (
+        online.to_src(inline_max_bytes=1024) == "https://example.com/logo.svg"
+    )
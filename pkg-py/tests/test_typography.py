@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+from copy import deepcopy
 from pathlib import Path
 from urllib.parse import unquote
 
@@ -23,6 +25,7 @@ from brand_yml.typography import (
     BrandTypographyMonospaceBlock,
     BrandTypographyMonospaceInline,
     BrandUnsupportedFontFileFormat,
+    google_fonts_import_url,
     validate_font_weight,
 )
 from syrupy.extensions.json import JSONSnapshotExtension
@@ -367,6 +370,66 @@ def test_brand_typography_font_google_import_url():
     )
 
 
+def test_brand_typography_font_google_import_url_cached():
+    fonts = [
+        BrandTypographyFontGoogle.model_validate(
+            {"family": "Open Sans", "style": style}
+        )
+        for style in (["italic", "normal"], ["normal", "italic"])
+    ]
+
+    google_fonts_import_url.cache_clear()
+    urls = [font.to_import_url() for font in fonts]
+    assert urls[0] == urls[1]
+
+    info = google_fonts_import_url.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_brand_typography_font_google_subset_text():
+    font = BrandTypographyFontGoogle.model_validate(
+        {
+            "family": "Roboto",
+            "weight": [400],
+            "style": "normal",
+            "subset": ["latin-ext", "latin"],
+            "text": "0123456789 Sales",
+        }
+    )
+    assert unquote(font.to_import_url()) == (
+        "https://fonts.googleapis.com/css2?family=Roboto:ital,wght@0,400"
+        "&display=auto&subset=latin,latin-ext&text=0123456789+Sales"
+    )
+
+    font_v1 = BrandTypographyFontBunny.model_validate(
+        {
+            "family": "Inter",
+            "weight": [700],
+            "style": "normal",
+            "subset": "latin",
+        }
+    )
+    assert unquote(font_v1.to_import_url()) == (
+        "https://fonts.bunny.net/css?family=Inter:700&display=auto&subset=latin"
+    )
+
+    # Fonts are only combined with fonts that request the same subset and text
+    typography = BrandTypography.model_validate(
+        {
+            "fonts": [
+                font.model_dump(),
+                {"source": "google", "family": "Lato", "text": "Sales"},
+            ]
+        }
+    )
+    assert typography.css_include_fonts(combine=True).count("@import") == 2
+
+    dumped = Brand.model_validate({"typography": typography}).model_dump_yaml()
+    assert "subset:\n        - latin-ext\n        - latin\n" in dumped
+    assert "text: 0123456789 Sales\n" in dumped
+    assert "text: Sales\n" in dumped
+
+
 def test_brand_typography_font_google_weight_range_import_url():
     bg = BrandTypography.model_validate(
         {
@@ -706,6 +769,141 @@ def test_brand_typography_css_fonts_local(snapshot):
     assert snapshot == brand.typography.css_include_fonts()
 
 
+def test_brand_typography_css_fonts_cached():
+    typography = BrandTypography.model_validate(
+        {"fonts": [{"source": "google", "family": "Open Sans"}]}
+    )
+
+    css = typography.css_include_fonts()
+    assert ";1,400" in unquote(css)
+    assert typography.css_include_fonts() is css
+
+    # Changing the fonts, even in place, invalidates the cached CSS
+    font = typography.fonts[0]
+    assert isinstance(font, BrandTypographyFontGoogle)
+    font.style = "normal"
+    assert "0,900&display" in unquote(typography.css_include_fonts())
+
+    typography.fonts.append(
+        BrandTypographyFontBunny.model_validate(
+            {"family": "Fira Code", "weight": [400]}
+        )
+    )
+    css = unquote(typography.css_include_fonts())
+    assert "0,900&display" in css
+    assert "fonts.bunny.net/css?family=Fira+Code:400,400i&" in css
+
+    # Editing a list field in place also invalidates the cached CSS
+    bunny = typography.fonts[1]
+    assert isinstance(bunny, BrandTypographyFontBunny)
+    assert isinstance(bunny.weight.root, list)
+    bunny.weight.root.append(700)
+    css = unquote(typography.css_include_fonts())
+    assert "fonts.bunny.net/css?family=Fira+Code:400,400i,700,700i&" in css
+
+    local = BrandTypographyFontFiles.model_validate(
+        {"family": "Local", "files": [{"path": "a.woff2"}]}
+    )
+    typography.fonts.append(local)
+    assert "a.woff2" in typography.css_include_fonts()
+    local.files.append(
+        BrandTypographyFontFilesPath.model_validate(
+            {"path": "b.woff2", "weight": 700}
+        )
+    )
+    assert "b.woff2" in typography.css_include_fonts()
+
+    typography.fonts = []
+    assert typography.css_include_fonts() == ""
+
+
+def test_brand_typography_css_fonts_combined():
+    typography = BrandTypography.model_validate(
+        {
+            "fonts": [
+                {"source": "google", "family": "Open Sans", "weight": [400]},
+                {
+                    "source": "file",
+                    "family": "Local",
+                    "files": [{"path": "a.woff2"}],
+                },
+                {"source": "bunny", "family": "Fira Code", "weight": [400]},
+                {"source": "google", "family": "Roboto", "style": "normal"},
+                {"source": "bunny", "family": "Inter", "style": "italic"},
+                {"source": "google", "family": "Lato", "display": "swap"},
+            ]
+        }
+    )
+
+    css = typography.css_include_fonts(combine=True).splitlines()
+    imports = [unquote(line) for line in css if line.startswith("@import")]
+    assert imports[0] == (
+        "@import url('https://fonts.googleapis.com/css2"
+        "?family=Open+Sans:ital,wght@0,400;1,400"
+        "&family=Roboto:ital,wght@0,100;0,200;0,300;0,400;0,500;0,600;0,700;0,800;0,900"
+        "&display=auto');"
+    )
+    assert imports[1] == (
+        "@import url('https://fonts.bunny.net/css"
+        "?family=Fira+Code:400,400i|Inter:100i,200i,300i,400i,500i,600i,700i,800i,900i"
+        "&display=auto');"
+    )
+    assert imports[2].startswith(
+        "@import url('https://fonts.googleapis.com/css2?family=Lato:"
+    )
+    assert imports[2].endswith("&display=swap');")
+    assert len(imports) == 3
+    assert css[1] == "@font-face {"
+
+    # The per-font imports are still available
+    assert typography.css_include_fonts().count("@import") == 5
+
+
+def test_brand_typography_css_fonts_prune():
+    typography = BrandTypography.model_validate(
+        {
+            "fonts": [
+                {"source": "google", "family": "Inter"},
+                {"source": "google", "family": "Lora", "weight": [400, 600]},
+                {"source": "bunny", "family": "Fira Code"},
+                {"source": "google", "family": "Unused", "style": "normal"},
+            ],
+            "base": {"family": "Inter"},
+            "headings": {"family": "Inter", "style": "italic"},
+            "link": {"weight": "semi-bold"},
+            "monospace": {"family": "Fira Code"},
+            "monospace-block": {"weight": 500},
+        }
+    )
+
+    # Every weight and style is imported by default
+    assert "1,900" in unquote(typography.css_include_fonts())
+
+    imports = [
+        unquote(i) for i in typography.css_include_fonts(prune=True).split("\n")
+    ]
+    # Only the exact (style, weight) faces used by the elements
+    assert "family=Inter:ital,wght@0,400;0,600;1,700&" in imports[0]
+    # Lora isn't used, so its explicit weights are kept
+    assert "family=Lora:ital,wght@0,400;0,600;1,400;1,600&" in imports[1]
+    # Bunny Fonts uses the v1 API
+    assert "family=Fira+Code:400,500&" in imports[2]
+    assert "family=Unused:ital,wght@0,100;0,200;" in imports[3]
+
+    combined = unquote(typography.css_include_fonts(combine=True, prune=True))
+    assert "family=Inter:ital,wght@0,400;0,600;1,700&family=Lora:" in combined
+
+    # Explicit weights override the used weights, but styles are still pruned
+    typography.headings = BrandTypographyHeadings.model_validate(
+        {"family": "Lora"}
+    )
+    imports = [
+        unquote(i) for i in typography.css_include_fonts(prune=True).split("\n")
+    ]
+    assert "family=Inter:wght@400;600&" in imports[0]
+    assert "family=Lora:ital,wght@0,400;0,600&" in imports[1]
+
+
 def test_brand_typography_google_fonts_weight_range(snapshot):
     fw = BrandTypographyGoogleFontsWeightRange.model_validate("600..800")
     assert fw.root == [600, 800]
@@ -741,3 +939,586 @@ def test_brand_typography_undefined_colors():
     assert isinstance(brand.typography, BrandTypography)
     assert isinstance(brand.typography.headings, BrandTypographyHeadings)
     assert brand.typography.headings.color == "orange"
+
+
+def test_brand_typography_vendor_fonts(tmp_path):
+    css = {
+        "Open+Sans": """
+        /* latin-ext */
+        @font-face {
+          font-family: 'Open Sans';
+          font-style: normal;
+          font-weight: 300 800;
+          font-display: swap;
+          src: url(https://fonts.gstatic.com/s/opensans/latin-ext.woff2) format('woff2');
+          unicode-range: U+0100-02BA, U+02BD-02C5;
+        }
+        /* latin */
+        @font-face {
+          font-family: 'Open Sans';
+          font-style: normal;
+          font-weight: 300 800;
+          font-display: swap;
+          src: url(https://fonts.gstatic.com/s/opensans/latin.woff2) format('woff2');
+          unicode-range: U+0000-00FF, U+0131;
+        }
+        """,
+        "Inter": """
+        @font-face {
+          font-family: 'Inter';
+          font-style: italic;
+          font-weight: 700;
+          src: url(/inter/files/inter-700-italic.woff2) format('woff2'),
+               url(/inter/files/inter-700-italic.woff) format('woff');
+        }
+        """,
+    }
+    requested = []
+
+    def fetcher(url: str) -> bytes:
+        requested.append(url)
+        if "/css" in url:
+            family = re.search(r"family=([^&%]+)", url).group(1)  # type: ignore
+            return css[family].encode()
+        return f"font data for {url.rsplit('/', 1)[1]}".encode()
+
+    data = {
+        "fonts": [
+            {"source": "google", "family": "Open Sans", "weight": "300..800"},
+            {"source": "file", "family": "Local", "files": []},
+            {"source": "bunny", "family": "Inter", "weight": [700]},
+        ]
+    }
+    typography = BrandTypography.model_validate(deepcopy(data))
+
+    paths = typography.vendor_fonts("fonts", root_dir=tmp_path, fetcher=fetcher)
+
+    assert len(paths) == 3
+    assert all(p.parent == tmp_path / "fonts" and p.exists() for p in paths)
+    assert all(p.name.startswith(("open-sans-", "inter-")) for p in paths)
+    assert all(p.suffix == ".woff2" for p in paths)
+    assert (
+        "https://fonts.bunny.net/inter/files/inter-700-italic.woff2"
+        in requested
+    )
+    assert not any(url.endswith(".woff") for url in requested)
+
+    open_sans, local, inter = typography.fonts
+    assert isinstance(open_sans, BrandTypographyFontFiles)
+    assert isinstance(local, BrandTypographyFontFiles)
+    assert isinstance(inter, BrandTypographyFontFiles)
+    assert [str(f.weight) for f in open_sans.files] == ["300 800", "300 800"]
+    assert open_sans.files[1].unicode_range == "U+0000-00FF, U+0131"
+    assert inter.files[0].style == "italic"
+    assert inter.files[0].unicode_range is None
+
+    path = inter.files[0].path
+    assert isinstance(path, FileLocationLocal)
+    assert path.absolute() == tmp_path / "fonts" / Path(str(path)).name
+
+    css_out = typography.css_include_fonts()
+    assert "@import" not in css_out
+    assert css_out.count("@font-face") == 3
+    assert "unicode-range: U+0100-02BA, U+02BD-02C5;" in css_out
+    assert f"src: url('{path}') format('woff2');" in css_out
+
+    # Files are named by content, so vendoring again reuses the same files
+    again = BrandTypography.model_validate(deepcopy(data))
+    assert again.vendor_fonts(tmp_path / "fonts", fetcher=fetcher) == paths
+    assert len(list((tmp_path / "fonts").iterdir())) == 3
+
+
+def test_brand_typography_vendor_fonts_error(tmp_path):
+    def fetcher(url: str) -> bytes:
+        if url.endswith(".woff2"):
+            raise OSError("offline")
+        return b"@font-face { src: url(https://example.com/a.woff2); }"
+
+    typography = BrandTypography.model_validate(
+        {"fonts": [{"source": "google", "family": "Open Sans"}]}
+    )
+    with pytest.raises(OSError, match="offline"):
+        typography.vendor_fonts(tmp_path, fetcher=fetcher)
+
+    assert isinstance(typography.fonts[0], BrandTypographyFontGoogle)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_brand_typography_vendor_fonts_other_drive(tmp_path, monkeypatch):
+    def relpath(path, start=None):
+        raise ValueError("path is on mount 'D:', start on mount 'C:'")
+
+    # On Windows, relpath() fails for paths on different drives
+    monkeypatch.setattr("os.path.relpath", relpath)
+
+    def fetcher(url: str) -> bytes:
+        raise AssertionError("nothing should be downloaded")
+
+    typography = BrandTypography.model_validate(
+        {"fonts": [{"source": "google", "family": "Open Sans"}]}
+    )
+    with pytest.raises(ValueError, match="same drive"):
+        typography.vendor_fonts(
+            tmp_path / "fonts", root_dir=tmp_path / "project", fetcher=fetcher
+        )
+
+    assert isinstance(typography.fonts[0], BrandTypographyFontGoogle)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_brand_typography_font_files_display_unicode_range():
+    font = BrandTypographyFontFiles.model_validate(
+        {
+            "family": "Open Sans",
+            "display": "swap",
+            "unicode-range": "U+0000-00FF",
+            "files": [
+                {"path": "a.woff2"},
+                {
+                    "path": "b.woff2",
+                    "display": "optional",
+                    "unicode_range": "U+0400-045F",
+                },
+            ],
+        }
+    )
+
+    rules = font.to_css().split("@font-face")[1:]
+    assert "font-display: swap;" in rules[0]
+    assert "unicode-range: U+0000-00FF;" in rules[0]
+    assert "font-display: optional;" in rules[1]
+    assert "unicode-range: U+0400-045F;" in rules[1]
+
+    # Neither is emitted unless set
+    css = BrandTypographyFontFilesPath(path="a.woff2").to_css()  # type: ignore
+    assert "font-display" not in css
+    assert "unicode-range" not in css
+
+
+def test_brand_typography_html_preload_links():
+    typography = BrandTypography.model_validate(
+        {
+            "fonts": [
+                {
+                    "source": "file",
+                    "family": "Open Sans",
+                    "files": [
+                        {
+                            "path": "fonts/latin.woff2",
+                            "weight": "300..800",
+                            "unicode-range": "U+0000-00FF, U+0131",
+                        },
+                        {
+                            "path": "fonts/latin.ttf",
+                            "weight": "300..800",
+                            "unicode-range": "U+0000-00FF, U+0131",
+                        },
+                        {
+                            "path": "fonts/cyrillic.woff2",
+                            "weight": "300..800",
+                            "unicode-range": "U+0400-045F",
+                        },
+                        {
+                            "path": "fonts/italic.woff2",
+                            "weight": "300..800",
+                            "style": "italic",
+                        },
+                    ],
+                },
+                {
+                    "source": "file",
+                    "family": "Slab",
+                    "files": [
+                        {"path": "fonts/slab-400.woff", "weight": 400},
+                        {"path": "fonts/slab-700.otf", "weight": "bold"},
+                    ],
+                },
+                {"source": "google", "family": "Fira Code"},
+            ],
+            "base": "Open Sans",
+            "headings": "Slab",
+            "monospace": "Fira Code",
+        }
+    )
+
+    assert typography.html_preload_links().splitlines() == [
+        '<link rel="preload" href="fonts/latin.woff2" as="font" type="font/woff2" crossorigin>',
+        '<link rel="preload" href="fonts/slab-700.otf" as="font" type="font/otf" crossorigin>',
+    ]
+
+    assert BrandTypography.model_validate({}).html_preload_links() == ""
+
+
+def test_brand_typography_font_files_grouped_by_face():
+    font = BrandTypographyFontFiles.model_validate(
+        {
+            "family": "Open Sans",
+            "files": [
+                {"path": "fonts/regular.ttf"},
+                {"path": "fonts/bold.otf", "weight": "bold"},
+                {"path": "fonts/regular.woff2", "weight": "auto"},
+                {"path": "fonts/bold.woff", "weight": 700},
+                {"path": "fonts/bold.woff", "weight": 700},
+                {"path": "fonts/italic.woff2", "style": "italic"},
+                {
+                    "path": "fonts/regular-latin.woff2",
+                    "unicode-range": "U+0-FF",
+                },
+            ],
+        }
+    )
+
+    rules = [rule.strip() for rule in font.to_css().split("@font-face")[1:]]
+    assert len(rules) == 4
+    assert (
+        "font-weight: auto;\n  font-style: normal;\n"
+        "  src: url('fonts/regular.woff2') format('woff2'), "
+        "url('fonts/regular.ttf') format('truetype');"
+    ) in rules[0]
+    assert (
+        "font-weight: bold;\n  font-style: normal;\n"
+        "  src: url('fonts/bold.woff') format('woff'), "
+        "url('fonts/bold.otf') format('opentype');"
+    ) in rules[1]
+    assert "src: url('fonts/italic.woff2') format('woff2');" in rules[2]
+    assert "src: url('fonts/regular-latin.woff2') format('woff2');" in rules[3]
+
+
+def test_brand_typography_font_files_auto_weight_faces():
+    font = BrandTypographyFontFiles.model_validate(
+        {
+            "family": "X",
+            "files": [
+                {"path": "fonts/x-regular.ttf"},
+                {"path": "fonts/x-bold.ttf"},
+                {"path": "fonts/x-regular.woff2"},
+                {"path": "https://example.com/x-regular.woff2"},
+            ],
+        }
+    )
+
+    rules = [rule.strip() for rule in font.to_css().split("@font-face")[1:]]
+    assert len(rules) == 3
+    assert (
+        "src: url('fonts/x-regular.woff2') format('woff2'), "
+        "url('fonts/x-regular.ttf') format('truetype');"
+    ) in rules[0]
+    assert "src: url('fonts/x-bold.ttf') format('truetype');" in rules[1]
+    assert (
+        "src: url('https://example.com/x-regular.woff2') format('woff2');"
+    ) in rules[2]
+
+
+def test_brand_typography_font_files_explicit_weight_faces():
+    font = BrandTypographyFontFiles.model_validate(
+        {
+            "family": "X",
+            "files": [
+                {"path": "fonts/a.woff2", "weight": 400},
+                {"path": "fonts/b.ttf", "weight": "normal"},
+                {"path": "fonts/c.woff2", "weight": 700},
+            ],
+        }
+    )
+
+    rules = [rule.strip() for rule in font.to_css().split("@font-face")[1:]]
+    assert len(rules) == 2
+    assert (
+        "src: url('fonts/a.woff2') format('woff2'), "
+        "url('fonts/b.ttf') format('truetype');"
+    ) in rules[0]
+    assert "src: url('fonts/c.woff2') format('woff2');" in rules[1]
+
+
+def test_brand_typography_css_fonts_inline(tmp_path):
+    fonts = tmp_path / "fonts"
+    fonts.mkdir()
+    (fonts / "small.woff2").write_bytes(b"small")
+    (fonts / "small.ttf").write_bytes(b"small")
+    (fonts / "large.woff2").write_bytes(b"large" * 100)
+    (tmp_path / "_brand.yml").write_text(
+        "typography:\n"
+        "  fonts:\n"
+        "    - family: Small\n"
+        "      source: file\n"
+        "      files: [{path: fonts/small.woff2}, {path: fonts/small.ttf}]\n"
+        "    - family: Large\n"
+        "      source: file\n"
+        "      files: [{path: fonts/large.woff2}]\n"
+        "    - family: Online\n"
+        "      source: file\n"
+        "      files: [{path: 'https://example.com/online.woff2'}]\n"
+    )
+    brand = read_brand_yml(tmp_path / "_brand.yml", cache=False)
+    assert brand.typography is not None
+
+    css = brand.typography.css_include_fonts(inline_max_bytes=100)
+    assert (
+        "src: url('data:font/woff2;base64,c21hbGw=') format('woff2'), "
+        "url('data:font/ttf;base64,c21hbGw=') format('truetype');"
+    ) in css
+    assert "src: url('fonts/large.woff2') format('woff2');" in css
+    assert "url('https://example.com/online.woff2')" in css
+    assert "data:" not in brand.typography.css_include_fonts()
+
+    # Changes to embedded files are picked up
+    (fonts / "small.woff2").write_bytes(b"SMALL")
+    css = brand.typography.css_include_fonts(inline_max_bytes=100)
+    assert "url('data:font/woff2;base64,U01BTEw=')" in css
+
+    # The same fonts resolved against another directory are embedded from it
+    other = tmp_path / "other"
+    (other / "fonts").mkdir(parents=True)
+    (other / "fonts" / "small.woff2").write_bytes(b"OTHER")
+    for font in brand.typography.fonts:
+        assert isinstance(font, BrandTypographyFontFiles)
+        for file in font.files:
+            if isinstance(file.path, FileLocationLocal):
+                file.path.set_root_dir(other)
+    css = brand.typography.css_include_fonts(inline_max_bytes=100)
+    assert "url('data:font/woff2;base64,T1RIRVI=')" in css
+    assert "url('fonts/small.ttf') format('truetype')" in css
+
+
+def test_brand_typography_font_files_variable():
+    font = BrandTypographyFontFiles.model_validate(
+        {
+            "family": "Roboto Flex",
+            "files": [
+                {"path": "https://e.com/Regular.woff2", "weight": 400},
+                {"path": "https://e.com/Bold.woff2", "weight": "bold"},
+                {"path": "https://e.com/Black.woff2", "weight": 900},
+                {
+                    "path": "https://e.com/Condensed.woff2",
+                    "weight": 400,
+                    "stretch": "condensed",
+                },
+                {
+                    "path": "https://e.com/Expanded.woff2",
+                    "weight": 400,
+                    "stretch": 150,
+                },
+                {
+                    "path": "https://e.com/Italic.woff2",
+                    "weight": 400,
+                    "style": "italic",
+                },
+                {
+                    "path": "https://e.com/Variable.woff2",
+                    "weight": "100..800",
+                    "stretch": "75%..125%",
+                    "variation-settings": {"GRAD": 0, "opsz": 14},
+                },
+                {
+                    "path": "https://e.com/Variable.ttf",
+                    "weight": "100..800",
+                    "stretch": "75%..125%",
+                    "variation_settings": {"GRAD": 0, "opsz": 14},
+                },
+            ],
+        }
+    )
+
+    assert font.files[4].stretch == "150%"
+    assert font.files[6].stretch == "75% 125%"
+
+    css = font.to_css()
+    # Static files covered by the variable file are replaced
+    for name in ("Regular", "Bold", "Condensed"):
+        assert name not in css
+    # Weights, stretches and styles outside of the variable file are kept
+    for name in ("Black", "Expanded", "Italic"):
+        assert f"{name}.woff2" in css
+
+    assert css.count("@font-face") == 4
+    assert (
+        "  font-weight: 100 800;\n"
+        "  font-style: normal;\n"
+        "  src: url('https://e.com/Variable.woff2') format('woff2'), "
+        "url('https://e.com/Variable.ttf') format('truetype');\n"
+        "  font-stretch: 75% 125%;\n"
+        "  font-variation-settings: 'GRAD' 0, 'opsz' 14;\n"
+    ) in css
+
+
+def test_brand_typography_font_files_variable_width():
+    font = BrandTypographyFontFiles.model_validate(
+        {
+            "family": "Roboto Flex",
+            "files": [
+                {
+                    "path": "https://e.com/Flex.woff2",
+                    "weight": [100, 900],
+                    "stretch": ["75%", 125],
+                },
+                {
+                    "path": "https://e.com/Flex.ttf",
+                    "weight": "100..900",
+                    "stretch": "condensed..expanded",
+                },
+                {"path": "https://e.com/Narrow.woff2", "stretch": [50, 75]},
+            ],
+        }
+    )
+
+    assert font.files[0].stretch == "75% 125%"
+    assert font.files[1]._stretch_key() == font.files[0]._stretch_key()
+
+    rules = [rule.strip() for rule in font.to_css().split("@font-face")[1:]]
+    assert len(rules) == 2
+    assert (
+        "  font-weight: 100 900;\n"
+        "  font-style: normal;\n"
+        "  src: url('https://e.com/Flex.woff2') format('woff2'), "
+        "url('https://e.com/Flex.ttf') format('truetype');\n"
+        "  font-stretch: 75% 125%;\n"
+    ) in rules[0]
+    assert "font-stretch: 50% 75%;" in rules[1]
+
+    with pytest.raises(ValueError, match="exactly 2 elements"):
+        BrandTypographyFontFiles.model_validate(
+            {
+                "family": "Roboto Flex",
+                "files": [{"path": "Flex.woff2", "stretch": [50, 75, 100]}],
+            }
+        )
+
+
+def test_brand_typography_infer_font_metadata(monkeypatch):
+    path = path_examples("brand-typography-fonts.yml")
+
+    brand = read_brand_yml(path, cache=False)
+    assert brand.typography is not None
+    open_sans = brand.typography.fonts[0]
+    assert isinstance(open_sans, BrandTypographyFontFiles)
+    assert [str(f.weight) for f in open_sans.files] == ["auto", "auto"]
+
+    monkeypatch.setenv("BRAND_YAML_INFER_FONT_METADATA", "true")
+    brand = read_brand_yml(path, cache=False)
+    assert brand.typography is not None
+    open_sans = brand.typography.fonts[0]
+    assert isinstance(open_sans, BrandTypographyFontFiles)
+
+    regular, italic = open_sans.files
+    assert str(regular.weight) == "300 800"
+    assert regular.stretch == "75% 100%"
+    assert regular.style == "normal"
+    assert italic.style == "italic"
+
+    # Explicit values are kept; hosted files are skipped
+    open_sans.files[0].weight = BrandTypographyFontFileWeight.model_validate(
+        400
+    )
+    open_sans.files[1].style = "normal"
+    assert brand.typography.infer_font_metadata() == 2
+    assert str(regular.weight) == "400"
+    assert italic.style == "normal"
+
+
+def test_brand_typography_css_fallback_fonts():
+    brand = read_brand_yml(path_examples("brand-typography-fonts.yml"))
+    assert brand.typography is not None
+    typography = brand.typography
+
+    # Open Sans metrics are read from the local files
+    css = typography.css_fallback_fonts()
+    assert css.count("@font-face") == 1
+    assert "font-family: 'Open Sans Fallback';\n  src: local('Arial');" in css
+    assert re.search(r"size-adjust: 105\.\d\d%;", css)
+    assert re.search(r"ascent-override: 101\.\d\d%;", css)
+    assert re.search(r"descent-override: 27\.\d\d%;", css)
+    assert "line-gap-override: 0.00%;" in css
+
+    assert typography.font_stack("Open Sans") == (
+        "'Open Sans', 'Open Sans Fallback', sans-serif"
+    )
+    # No local files or known metrics
+    assert typography.font_stack("Closed Sans") == "'Closed Sans', sans-serif"
+    assert typography.font_stack("Fira Code") == "'Fira Code', monospace"
+
+    # Known Google Fonts families use bundled metrics
+    typography = BrandTypography.model_validate(
+        {
+            "fonts": [
+                {"source": "google", "family": "Lato"},
+                {"source": "bunny", "family": "Source Code Pro"},
+                {"source": "system", "family": "Open Sans"},
+            ],
+            "monospace": {"family": "Source Code Pro"},
+        }
+    )
+    css = typography.css_fallback_fonts()
+    assert css.count("@font-face") == 2
+    assert "font-family: 'Lato Fallback';" in css
+    assert "src: local('Courier New');" in css
+    assert typography.font_stack("Source Code Pro") == (
+        "'Source Code Pro', 'Source Code Pro Fallback', monospace"
+    )
+    assert typography.font_stack("Open Sans") == "'Open Sans', sans-serif"
+
+
+def test_brand_typography_css_fallback_fonts_one_rule_per_family():
+    typography = BrandTypography.model_validate(
+        {
+            "fonts": [
+                {"source": "system", "family": "Lato"},
+                {"source": "google", "family": "Lato", "weight": 400},
+                {"source": "bunny", "family": "Lato", "weight": 700},
+                {"source": "google", "family": "Open Sans"},
+            ],
+        }
+    )
+    css = typography.css_fallback_fonts()
+    assert css.count("@font-face") == 2
+    assert css.count("font-family: 'Lato Fallback';") == 1
+    assert typography.font_stack("Lato") == (
+        "'Lato', 'Lato Fallback', sans-serif"
+    )
+
+
+def test_brand_typography_resource_hints():
+    typography = BrandTypography.model_validate(
+        {
+            "fonts": [
+                {"source": "google", "family": "Inter"},
+                {"source": "google", "family": "Lora"},
+                {"source": "bunny", "family": "Fira Code"},
+                {
+                    "source": "file",
+                    "family": "Hosted",
+                    "files": [
+                        {"path": "https://cdn.example.com/a/Hosted.woff2"},
+                        {"path": "https://cdn.example.com/b/Hosted-Bold.woff2"},
+                        {"path": "fonts/Local.woff2"},
+                    ],
+                },
+            ]
+        }
+    )
+
+    assert typography.resource_hints(dns_prefetch=False).splitlines() == [
+        '<link rel="preconnect" href="https://fonts.googleapis.com">',
+        '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>',
+        '<link rel="preconnect" href="https://fonts.bunny.net">',
+        '<link rel="preconnect" href="https://fonts.bunny.net" crossorigin>',
+        '<link rel="preconnect" href="https://cdn.example.com" crossorigin>',
+    ]
+
+    html = typography.resource_hints().splitlines()
+    assert len(html) == 9
+    assert html[5:] == [
+        '<link rel="dns-prefetch" href="https://fonts.googleapis.com">',
+        '<link rel="dns-prefetch" href="https://fonts.gstatic.com">',
+        '<link rel="dns-prefetch" href="https://fonts.bunny.net">',
+        '<link rel="dns-prefetch" href="https://cdn.example.com">',
+    ]
+
+    header = typography.resource_hints(output="header", dns_prefetch=False)
+    assert header.split(", ")[:2] == [
+        "<https://fonts.googleapis.com>; rel=preconnect",
+        "<https://fonts.gstatic.com>; rel=preconnect; crossorigin",
+    ]
+
+    assert BrandTypography.model_validate({}).resource_hints() == ""
+    with pytest.raises(ValueError, match="Invalid output"):
+        typography.resource_hints(output="json")  # type: ignore
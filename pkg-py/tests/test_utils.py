@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from brand_yml._utils import (
+    ProjectFileCache,
+    find_project_brand_yml,
+    find_project_file,
+)
+
+
+def test_find_project_file_cache_hits_and_misses(tmp_path: Path):
+    (tmp_path / "_brand.yml").write_text("meta:\n  name: test\n")
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (tmp_path / "a" / "c").mkdir()
+
+    cache = ProjectFileCache()
+
+    found = find_project_brand_yml(nested)
+    assert found == tmp_path / "_brand.yml"
+
+    # b, a and tmp_path are each scanned once
+    assert find_project_brand_yml_cached(nested, cache) == found
+    assert cache.cache_info() == (0, 3, 3)
+
+    # A sibling lookup reuses the negative result in `a` and the hit in tmp_path
+    assert find_project_brand_yml_cached(tmp_path / "a" / "c", cache) == found
+    assert cache.cache_info() == (2, 4, 4)
+
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0)
+
+
+def test_find_project_file_cache_invalidated_by_dir_mtime(tmp_path: Path):
+    (tmp_path / "_brand.yml").write_text("meta:\n  name: test\n")
+    nested = tmp_path / "project"
+    nested.mkdir()
+
+    cache = ProjectFileCache()
+    assert find_project_brand_yml_cached(nested, cache) == (
+        tmp_path / "_brand.yml"
+    )
+
+    # Adding a brand directory in `project` invalidates the cached miss
+    (nested / "brand").mkdir()
+    (nested / "brand" / "_brand.yml").write_text("meta:\n  name: nested\n")
+    assert find_project_brand_yml_cached(nested, cache) == (
+        nested / "brand" / "_brand.yml"
+    )
+
+    # Removing it again is picked up via the subdirectory's mtime
+    (nested / "brand" / "_brand.yml").unlink()
+    assert find_project_brand_yml_cached(nested, cache) == (
+        tmp_path / "_brand.yml"
+    )
+
+
+def test_find_project_file_cache_not_found(tmp_path: Path):
+    cache = ProjectFileCache()
+    with pytest.raises(FileNotFoundError):
+        find_project_brand_yml_cached(tmp_path / "does-not-exist", cache)
+
+
+def find_project_brand_yml_cached(dir_: Path, cache: ProjectFileCache) -> Path:
+    return find_project_file("_brand.yml", dir_, ("brand", "_brand"), cache)
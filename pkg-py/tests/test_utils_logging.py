@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from brand_yml._utils_logging import log_debug, log_debug_enabled, logger
+
+
+class ReprError:
+    def __repr__(self) -> str:
+        raise AssertionError("should not be formatted")
+
+
+@pytest.fixture
+def debug_logger():
+    level = logger.level
+    logger.setLevel(logging.DEBUG)
+    try:
+        yield logger
+    finally:
+        logger.setLevel(level)
+
+
+def test_log_debug_skips_formatting_when_disabled():
+    assert not log_debug_enabled()
+    log_debug("value is %r", ReprError())
+
+
+def test_log_debug_formats_when_enabled(debug_logger, caplog):
+    assert log_debug_enabled()
+
+    with caplog.at_level(logging.DEBUG, logger="brand_yml"):
+        log_debug("key %s has value %r", "a", {"b": 1}, level=2)
+
+    assert caplog.records[-1].getMessage() == "..key a has value {'b': 1}"
+    assert caplog.records[-1].funcName == "test_log_debug_formats_when_enabled"
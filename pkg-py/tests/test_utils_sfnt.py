@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+from brand_yml._utils_sfnt import (
+    FontAxis,
+    font_metadata_cache,
+    read_font_metadata,
+)
+from utils import path_examples
+
+
+def sfnt_to_woff(data: bytes) -> bytes:
+    """Repackage a TrueType font as WOFF with zlib-compressed tables."""
+    flavor, num_tables = struct.unpack_from(">4sH", data, 0)
+    records = [
+        struct.unpack_from(">4sLLL", data, 12 + 16 * i)
+        for i in range(num_tables)
+    ]
+
+    offset = 44 + 20 * num_tables
+    directory, tables = b"", b""
+    for tag, checksum, table_offset, length in records:
+        table = data[table_offset : table_offset + length]
+        compressed = zlib.compress(table)
+        if len(compressed) >= length:
+            compressed = table
+        directory += struct.pack(
+            ">4sLLLL",
+            tag,
+            offset + len(tables),
+            len(compressed),
+            length,
+            checksum,
+        )
+        tables += compressed + b"\0" * (-len(compressed) % 4)
+
+    header = struct.pack(
+        ">4s4sLHHLHHLLLLL",
+        b"wOFF",
+        flavor,
+        offset + len(tables),
+        num_tables,
+        0,
+        len(data),
+        1,
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+    )
+    return header + directory + tables
+
+
+def test_read_font_metadata_ttf():
+    font_metadata_cache.clear()
+
+    regular = read_font_metadata(
+        path_examples("fonts/open-sans/OpenSans-Variable.ttf")
+    )
+    assert regular is not None
+    assert regular.family == "Open Sans"
+    assert regular.weight == 400
+    assert not regular.italic
+    assert regular.axis("wght") == FontAxis("wght", 300, 400, 800)
+    assert regular.axis("wdth") == FontAxis("wdth", 75, 100, 100)
+    assert regular.axis("ital") is None
+    assert regular.metrics is not None
+    assert regular.metrics[:4] == (2048, 2189, -600, 0)
+    assert regular.metrics.x_width_avg == pytest.approx(956, abs=1)
+
+    italic = read_font_metadata(
+        path_examples("fonts/open-sans/OpenSans-Variable-Italic.ttf")
+    )
+    assert italic is not None
+    assert italic.italic
+
+    # Cached by path, modification time and size
+    assert len(font_metadata_cache) == 2
+    assert (
+        read_font_metadata(
+            path_examples("fonts/open-sans/OpenSans-Variable.ttf")
+        )
+        is regular
+    )
+
+
+def test_read_font_metadata_woff(tmp_path: Path):
+    ttf = path_examples("fonts/open-sans/OpenSans-Variable-Italic.ttf")
+    woff = tmp_path / "OpenSans-Italic.woff"
+    woff.write_bytes(sfnt_to_woff(ttf.read_bytes()))
+
+    assert read_font_metadata(woff) == read_font_metadata(ttf)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"not a font file", b"wOFF" + b"\xff" * 40, b"\x00\x01\x00\x00" * 3],
+)
+def test_read_font_metadata_invalid(tmp_path: Path, content: bytes):
+    path = tmp_path / "font.ttf"
+    path.write_bytes(content)
+    metadata = read_font_metadata(path)
+    assert metadata is None or metadata.weight is None
+
+
+def with_table_offset(data: bytes, tag: bytes, offset: int) -> bytes:
+    """Point the table directory entry for `tag` at `offset`."""
+    (num_tables,) = struct.unpack_from(">H", data, 4)
+    for i in range(num_tables):
+        record = 12 + 16 * i
+        if data[record : record + 4] == tag:
+            patched = bytearray(data)
+            struct.pack_into(">L", patched, record + 8, offset)
+            return bytes(patched)
+    raise ValueError(f"No {tag!r} table")
+
+
+@pytest.mark.parametrize("tag", [b"name", b"fvar", b"cmap", b"hhea"])
+def test_read_font_metadata_table_out_of_range(tmp_path: Path, tag: bytes):
+    ttf = path_examples("fonts/open-sans/OpenSans-Variable.ttf").read_bytes()
+    path = tmp_path / "font.ttf"
+    path.write_bytes(with_table_offset(ttf, tag, len(ttf) + 1024))
+    assert read_font_metadata(path) is None
+
+
+def test_read_font_metadata_truncated(tmp_path: Path):
+    ttf = path_examples("fonts/open-sans/OpenSans-Variable.ttf").read_bytes()
+    path = tmp_path / "font.ttf"
+    # The table directory is intact but the tables are past the end
+    path.write_bytes(ttf[:1024])
+    assert read_font_metadata(path) is None
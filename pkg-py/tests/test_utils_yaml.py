@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import json
+
+import pytest
 from brand_yml import Brand
+from brand_yml._utils_yaml import yaml_brand as yaml
+from utils import path_examples
 
 
 def test_brand_model_dump_yaml(snapshot):
@@ -16,3 +21,18 @@ def test_brand_model_dump_yaml(snapshot):
     """)
 
     assert snapshot == brand.model_dump_yaml()
+
+
+@pytest.mark.parametrize(
+    "path",
+    sorted(path_examples().glob("*.yml")),
+    ids=lambda path: path.name,
+)
+def test_brand_model_dump_yaml_matches_json_round_trip(path):
+    brand = Brand.from_yaml(path)
+
+    # Brands are serialized as if round-tripped through JSON
+    data = json.loads(
+        brand.model_dump_json(exclude_defaults=True, exclude_none=True)
+    )
+    assert brand.model_dump_yaml() == yaml.dump(data)